@@ -0,0 +1,55 @@
+"""Add fighter_stats
+
+Revision ID: 02a1e1b48e9a
+Revises: 843b606c75b5
+Create Date: 2026-10-18 14:52:33.204918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '02a1e1b48e9a'
+down_revision: Union[str, Sequence[str], None] = '843b606c75b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('fighter_stats',
+    sa.Column('fighter_id', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('losses', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('draws', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('no_contests', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['fighter_id'], ['fighters.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('fighter_id')
+    )
+
+    # Backfill from existing fights (same rules as stats_service)
+    op.execute("""
+        INSERT INTO fighter_stats (fighter_id, wins, losses, draws, no_contests)
+        SELECT f.id,
+               COALESCE(SUM(CASE WHEN c.winner_id = f.id THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN c.winner_id IS NOT NULL AND c.winner_id <> f.id THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN c.winner_id IS NULL AND c.method IS NOT NULL
+                                  AND LOWER(TRIM(c.method)) NOT IN ('nc', 'no contest') THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN c.winner_id IS NULL
+                                  AND LOWER(TRIM(c.method)) IN ('nc', 'no contest') THEN 1 ELSE 0 END), 0)
+        FROM fighters f
+        LEFT JOIN (
+            SELECT fighter_1_id AS fighter_id, winner_id, method FROM fights
+            UNION ALL
+            SELECT fighter_2_id AS fighter_id, winner_id, method FROM fights
+        ) c ON c.fighter_id = f.id
+        GROUP BY f.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('fighter_stats')
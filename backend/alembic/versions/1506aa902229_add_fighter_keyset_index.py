@@ -0,0 +1,28 @@
+"""Add fighter keyset pagination index
+
+Revision ID: 1506aa902229
+Revises: f25c1ea433e4
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1506aa902229'
+down_revision: Union[str, Sequence[str], None] = 'f25c1ea433e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_fighters_last_name_id', 'fighters', ['last_name', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_fighters_last_name_id', table_name='fighters')
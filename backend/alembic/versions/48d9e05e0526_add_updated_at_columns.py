@@ -0,0 +1,45 @@
+"""Add updated_at to fighters, events and fights
+
+Revision ID: 48d9e05e0526
+Revises: 02a1e1b48e9a
+Create Date: 2026-10-18 17:05:12.538120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '48d9e05e0526'
+down_revision: Union[str, Sequence[str], None] = '02a1e1b48e9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch mode: SQLite can't ADD COLUMN with a non-constant default;
+    # existing rows take the migration time
+    for table in ('fighters', 'events', 'fights'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column(
+                'updated_at',
+                sa.DateTime(timezone=True),
+                server_default=sa.text('CURRENT_TIMESTAMP'),
+                nullable=False,
+            ))
+
+    op.create_index(op.f('ix_fighters_updated_at'), 'fighters', ['updated_at'], unique=False)
+    op.create_index(op.f('ix_events_updated_at'), 'events', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_events_updated_at'), table_name='events')
+    op.drop_index(op.f('ix_fighters_updated_at'), table_name='fighters')
+
+    for table in ('fights', 'events', 'fighters'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('updated_at')
@@ -0,0 +1,36 @@
+"""Add foreign key and lookup indexes
+
+Revision ID: 843b606c75b5
+Revises: a35ac47f383d
+Create Date: 2026-10-18 13:41:05.662710
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '843b606c75b5'
+down_revision: Union[str, Sequence[str], None] = 'a35ac47f383d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_fights_event_id'), 'fights', ['event_id'], unique=False)
+    op.create_index(op.f('ix_fights_fighter_1_id'), 'fights', ['fighter_1_id'], unique=False)
+    op.create_index(op.f('ix_fights_fighter_2_id'), 'fights', ['fighter_2_id'], unique=False)
+    op.create_index(op.f('ix_fights_winner_id'), 'fights', ['winner_id'], unique=False)
+    op.create_index('ix_fighters_last_name_first_name', 'fighters', ['last_name', 'first_name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_fighters_last_name_first_name', table_name='fighters')
+    op.drop_index(op.f('ix_fights_winner_id'), table_name='fights')
+    op.drop_index(op.f('ix_fights_fighter_2_id'), table_name='fights')
+    op.drop_index(op.f('ix_fights_fighter_1_id'), table_name='fights')
+    op.drop_index(op.f('ix_fights_event_id'), table_name='fights')
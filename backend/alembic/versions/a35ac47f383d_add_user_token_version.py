@@ -0,0 +1,28 @@
+"""Add user token_version
+
+Revision ID: a35ac47f383d
+Revises: fff857b5cd6a
+Create Date: 2026-10-18 11:26:51.730412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a35ac47f383d'
+down_revision: Union[str, Sequence[str], None] = 'fff857b5cd6a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
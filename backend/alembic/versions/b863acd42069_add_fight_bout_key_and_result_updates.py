@@ -0,0 +1,48 @@
+"""Add fights.bout_key and fight_result_updates
+
+Revision ID: b863acd42069
+Revises: cb88a9f2a502
+Create Date: 2026-10-18 18:40:27.193604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b863acd42069'
+down_revision: Union[str, Sequence[str], None] = 'cb88a9f2a502'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('fights', sa.Column('bout_key', sa.String(), nullable=True))
+
+    # NULL until a result is ingested for the fight
+    op.create_index(op.f('ix_fights_bout_key'), 'fights', ['bout_key'], unique=True)
+
+    op.create_table(
+        'fight_result_updates',
+        sa.Column('idempotency_key', sa.String(), nullable=False),
+        sa.Column('event_id', sa.Integer(), nullable=False),
+        sa.Column('bout_key', sa.String(), nullable=False),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('received_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('idempotency_key'),
+    )
+    op.create_index(
+        op.f('ix_fight_result_updates_event_id'), 'fight_result_updates', ['event_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_fight_result_updates_event_id'), table_name='fight_result_updates')
+    op.drop_table('fight_result_updates')
+    op.drop_index(op.f('ix_fights_bout_key'), table_name='fights')
+    with op.batch_alter_table('fights') as batch_op:
+        batch_op.drop_column('bout_key')
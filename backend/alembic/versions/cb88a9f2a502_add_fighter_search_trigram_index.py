@@ -0,0 +1,45 @@
+"""Add fighter search trigram index
+
+Revision ID: cb88a9f2a502
+Revises: 48d9e05e0526
+Create Date: 2026-10-18 14:05:12.407311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cb88a9f2a502'
+down_revision: Union[str, Sequence[str], None] = '48d9e05e0526'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL only, and only where pg_trgm is installable;
+    # elsewhere search uses the in-process index
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    available = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first()
+    if available is None:
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        "CREATE INDEX ix_fighters_search_name_trgm ON fighters USING gin "
+        "(lower(first_name || ' ' || last_name || ' ' || coalesce(nickname, '')) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP INDEX IF EXISTS ix_fighters_search_name_trgm')
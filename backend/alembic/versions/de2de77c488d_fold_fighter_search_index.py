@@ -0,0 +1,51 @@
+"""Fold accents and split words in the fighter search index
+
+Revision ID: de2de77c488d
+Revises: b863acd42069
+Create Date: 2026-10-18 18:40:31.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'de2de77c488d'
+down_revision: Union[str, Sequence[str], None] = 'b863acd42069'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.models.fighter.SEARCH_NAME as of this revision
+SEARCH_NAME = "btrim(regexp_replace(translate(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(replace(lower(first_name || ' ' || last_name || ' ' || coalesce(nickname, '')), 'Æ', 'ae'), 'ß', 'ss'), 'æ', 'ae'), 'Ĳ', 'ij'), 'ĳ', 'ij'), 'Œ', 'oe'), 'œ', 'oe'), 'Ǆ', 'dz'), 'ǅ', 'dz'), 'ǆ', 'dz'), 'Ǉ', 'lj'), 'ǈ', 'lj'), 'ǉ', 'lj'), 'Ǌ', 'nj'), 'ǋ', 'nj'), 'ǌ', 'nj'), 'Ǳ', 'dz'), 'ǲ', 'dz'), 'ǳ', 'dz'), 'ÀÁÂÃÄÅÇÈÉÊËÌÍÎÏÑÒÓÔÕÖØÙÚÛÜÝàáâãäåçèéêëìíîïñòóôõöøùúûüýÿĀāĂăĄąĆćĈĉĊċČčĎďĐđĒēĔĕĖėĘęĚěĜĝĞğĠġĢģĤĥĨĩĪīĬĭĮįİıĴĵĶķĹĺĻļĽľĿŀŁłŃńŅņŇňŌōŎŏŐőŔŕŖŗŘřŚśŜŝŞşŠšŢţŤťŨũŪūŬŭŮůŰűŲųŴŵŶŷŸŹźŻżŽžſƠơƯưǍǎǏǐǑǒǓǔǕǖǗǘǙǚǛǜǞǟǠǡǦǧǨǩǪǫǬǭǰǴǵǸǹǺǻȀȁȂȃȄȅȆȇȈȉȊȋȌȍȎȏȐȑȒȓȔȕȖȗȘșȚțȞȟȦȧȨȩȪȫȬȭȮȯȰȱȲȳ', 'aaaaaaceeeeiiiinoooooouuuuyaaaaaaceeeeiiiinoooooouuuuyyaaaaaaccccccccddddeeeeeeeeeegggggggghhiiiiiiiiiijjkkllllllllllnnnnnnoooooorrrrrrssssssssttttuuuuuuuuuuuuwwyyyzzzzzzsoouuaaiioouuuuuuuuuuaaaaggkkoooojggnnaaaaaaeeeeiiiioooorrrruuuusstthhaaeeooooooooyy'), '[^[:alnum:]]+', ' ', 'g'))"
+
+PREVIOUS_SEARCH_NAME = "lower(first_name || ' ' || last_name || ' ' || coalesce(nickname, ''))"
+
+
+def _recreate_index(expression: str) -> None:
+    # Only where the trigram index exists (PostgreSQL with pg_trgm)
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+    installed = bind.execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).first()
+    if installed is None:
+        return
+
+    op.execute('DROP INDEX IF EXISTS ix_fighters_search_name_trgm')
+    op.execute(
+        f"CREATE INDEX ix_fighters_search_name_trgm ON fighters USING gin "
+        f"(({expression}) gin_trgm_ops)"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _recreate_index(SEARCH_NAME)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _recreate_index(PREVIOUS_SEARCH_NAME)
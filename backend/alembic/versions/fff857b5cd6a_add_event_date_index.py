@@ -0,0 +1,28 @@
+"""Add event_date index
+
+Revision ID: fff857b5cd6a
+Revises: 1506aa902229
+Create Date: 2026-10-18 10:03:17.452981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fff857b5cd6a'
+down_revision: Union[str, Sequence[str], None] = '1506aa902229'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_events_event_date'), 'events', ['event_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_events_event_date'), table_name='events')
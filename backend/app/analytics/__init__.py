@@ -0,0 +1,15 @@
+"""
+Fighter analytics computed in bulk with NumPy.
+
+The fights table is loaded once into columnar arrays
+(loader.py), every metric is computed for every fighter in one
+vectorized pass (metrics.py), and the result is cached until the
+next committed fight or event write (engine.py).
+Elo ratings are replayed incrementally on the same writes (ratings.py).
+Predictions combine a per-fighter feature store (features.py) with
+a logistic model trained offline (model.py).
+"""
+
+from app.analytics.engine import LEADERBOARD_METRICS, analytics_engine
+from app.analytics.ratings import rating_engine
+from app.analytics.features import feature_store
@@ -0,0 +1,175 @@
+import threading
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.analytics.loader import load_fight_columns
+from app.analytics.metrics import (
+    Appearances,
+    FighterMetrics,
+    build_appearances,
+    compute_metrics,
+    fights_by_year,
+)
+from app.core import changes
+
+# Leaderboard metrics, in the order they are offered
+LEADERBOARD_METRICS = (
+    "current_win_streak",
+    "longest_win_streak",
+    "wins",
+    "ko_wins",
+    "submission_wins",
+    "finish_rate",
+    "ko_rate",
+    "submission_rate",
+    "decision_rate",
+    "fights_last_year",
+)
+
+
+def _epoch_day(day: date) -> int:
+    return int(np.datetime64(day, "D").astype(np.int64))
+
+
+def _to_date(day) -> date:
+    return np.datetime64(int(day), "D").astype(date)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Metrics computed from one load of the fights table.
+    """
+
+    built_on: date
+    appearances: Appearances
+    metrics: FighterMetrics
+
+    def position(self, fighter_id: int) -> int | None:
+        ids = self.metrics.fighter_ids
+        pos = int(np.searchsorted(ids, fighter_id))
+        if pos < len(ids) and ids[pos] == fighter_id:
+            return pos
+        return None
+
+
+class AnalyticsEngine:
+    """
+    Process-wide cache of fighter metrics.
+
+    - The fights table is loaded and every metric computed once
+    - Committed writes to fights or events mark the cache stale
+      (see app.core.changes); the next read rebuilds it
+    - The activity window moves with the calendar, so a snapshot
+      is also rebuilt when the day changes
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._generation = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+
+    def snapshot(self, db: Session) -> Snapshot:
+        today = date.today()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.built_on == today:
+            return snapshot
+
+        with self._lock:
+            generation = self._generation
+
+        apps = build_appearances(load_fight_columns(db))
+        snapshot = Snapshot(today, apps, compute_metrics(apps, _epoch_day(today)))
+
+        # Don't cache a build that raced with a write
+        with self._lock:
+            if generation == self._generation:
+                self._snapshot = snapshot
+
+        return snapshot
+
+    def fighter_analytics(self, db: Session, fighter_id: int) -> dict:
+        """
+        All metrics for one fighter; zeros if they have no completed fight.
+        """
+
+        snapshot = self.snapshot(db)
+        pos = snapshot.position(fighter_id)
+
+        if pos is None:
+            return {
+                "fighter_id": fighter_id,
+                "fights": 0, "wins": 0, "losses": 0, "draws": 0, "no_contests": 0,
+                "ko_wins": 0, "submission_wins": 0, "decision_wins": 0,
+                "current_win_streak": 0, "longest_win_streak": 0,
+                "ko_rate": 0.0, "submission_rate": 0.0,
+                "decision_rate": 0.0, "finish_rate": 0.0,
+                "avg_finish_round": None,
+                "first_fight_date": None, "last_fight_date": None,
+                "fights_last_year": 0, "fights_by_year": {},
+            }
+
+        m = snapshot.metrics
+        avg_round = m.avg_finish_round[pos]
+
+        return {
+            "fighter_id": fighter_id,
+            "fights": int(m.fights[pos]),
+            "wins": int(m.wins[pos]),
+            "losses": int(m.losses[pos]),
+            "draws": int(m.draws[pos]),
+            "no_contests": int(m.no_contests[pos]),
+            "ko_wins": int(m.ko_wins[pos]),
+            "submission_wins": int(m.submission_wins[pos]),
+            "decision_wins": int(m.decision_wins[pos]),
+            "current_win_streak": int(m.current_win_streak[pos]),
+            "longest_win_streak": int(m.longest_win_streak[pos]),
+            "ko_rate": float(m.ko_rate[pos]),
+            "submission_rate": float(m.submission_rate[pos]),
+            "decision_rate": float(m.decision_rate[pos]),
+            "finish_rate": float(m.finish_rate[pos]),
+            "avg_finish_round": None if np.isnan(avg_round) else float(avg_round),
+            "first_fight_date": _to_date(m.first_fight_day[pos]),
+            "last_fight_date": _to_date(m.last_fight_day[pos]),
+            "fights_last_year": int(m.fights_last_year[pos]),
+            "fights_by_year": fights_by_year(snapshot.appearances, pos),
+        }
+
+    def leaderboard(
+        self, db: Session, metric: str, limit: int, min_fights: int
+    ) -> list[tuple[int, float, int]]:
+        """
+        Top fighters by metric as (fighter_id, value, fights).
+
+        Ties are broken by fighter id; fighters with fewer than
+        min_fights completed fights are left out.
+        """
+
+        m = self.snapshot(db).metrics
+        values = getattr(m, metric)
+
+        eligible = np.flatnonzero(m.fights >= min_fights)
+        order = np.lexsort((m.fighter_ids[eligible], -values[eligible]))
+        top = eligible[order[:limit]]
+
+        return [
+            (int(m.fighter_ids[i]), values[i].item(), int(m.fights[i]))
+            for i in top
+        ]
+
+
+analytics_engine = AnalyticsEngine()
+
+
+@changes.subscribe
+def _invalidate_on_fight_changes(committed):
+    if any(change.table in ("fights", "events") for change in committed):
+        analytics_engine.invalidate()
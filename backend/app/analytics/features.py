@@ -0,0 +1,337 @@
+import threading
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.analytics.loader import (
+    METHOD_KO,
+    METHOD_NONE,
+    METHOD_SUBMISSION,
+    NO_WINNER,
+    FightColumns,
+    load_fight_columns,
+)
+from app.core import changes
+from app.models.fighter import Fighter
+
+STANCES = ("orthodox", "southpaw", "switch")
+
+# Columns of the per-fighter feature table (NaN = unknown)
+KNOWN = 0
+HEIGHT = 1
+REACH = 2
+BIRTH_DAY = 3       # days since epoch
+STANCE = 4          # one-hot, len(STANCES) columns
+FIGHTS = STANCE + len(STANCES)
+WINS = FIGHTS + 1
+FINISHES = FIGHTS + 2
+LAST_FIGHT_DAY = FIGHTS + 3
+N_COLUMNS = FIGHTS + 4
+
+# Matchup features fed to the model: fighter_1 minus fighter_2
+MATCHUP_FEATURES = (
+    "rating",
+    "height",
+    "reach",
+    "age",
+    *STANCES,
+    "experience",
+    "win_rate",
+    "finish_rate",
+    "layoff",
+)
+
+DAYS_PER_YEAR = 365.25
+MAX_LAYOFF_YEARS = 5.0
+
+
+def _epoch_day(value) -> float:
+    if value is None:
+        return np.nan
+    return float(np.datetime64(value, "D").astype(np.int64))
+
+
+def history_counts(fights: FightColumns):
+    """
+    Per-fighter (ids, fights, wins, finishes, last_fight_day)
+    over completed fights, one bincount per column.
+    """
+
+    completed = (fights.winner != NO_WINNER) | (fights.method != METHOD_NONE)
+    fighter = np.concatenate([fights.fighter_1[completed], fights.fighter_2[completed]])
+    winner = np.tile(fights.winner[completed], 2)
+    method = np.tile(fights.method[completed], 2)
+    day = np.tile(fights.event_day[completed], 2)
+
+    ids, index = np.unique(fighter, return_inverse=True)
+    won = winner == fighter
+    finished = won & ((method == METHOD_KO) | (method == METHOD_SUBMISSION))
+
+    last_day = np.full(len(ids), np.iinfo(np.int64).min)
+    np.maximum.at(last_day, index, day)
+
+    return (
+        ids,
+        np.bincount(index, minlength=len(ids)),
+        np.bincount(index[won], minlength=len(ids)),
+        np.bincount(index[finished], minlength=len(ids)),
+        last_day,
+    )
+
+
+def matchup_features(side_1: np.ndarray, side_2: np.ndarray,
+                     rating_1: np.ndarray, rating_2: np.ndarray,
+                     day) -> np.ndarray:
+    """
+    Model inputs for N matchups, shape (N, len(MATCHUP_FEATURES)).
+
+    side_1 / side_2 are feature table rows (N, N_COLUMNS) for each
+    corner; day is the scoring date (days since epoch, scalar or N).
+    Every feature is a difference, so swapping corners negates it;
+    unknown differences are 0.
+    """
+
+    day = np.asarray(day, dtype=np.float64)
+
+    def rates(side):
+        fights = side[:, FIGHTS]
+        wins = side[:, WINS]
+        win_rate = np.divide(wins, fights, out=np.zeros(len(side)), where=fights > 0)
+        finish_rate = np.divide(side[:, FINISHES], wins, out=np.zeros(len(side)), where=wins > 0)
+        layoff = np.clip((day - side[:, LAST_FIGHT_DAY]) / DAYS_PER_YEAR, 0, MAX_LAYOFF_YEARS)
+        return np.log1p(fights), win_rate, finish_rate, layoff
+
+    experience_1, win_rate_1, finish_rate_1, layoff_1 = rates(side_1)
+    experience_2, win_rate_2, finish_rate_2, layoff_2 = rates(side_2)
+
+    columns = [
+        (rating_1 - rating_2) / 400.0,
+        (side_1[:, HEIGHT] - side_2[:, HEIGHT]) / 10.0,
+        (side_1[:, REACH] - side_2[:, REACH]) / 10.0,
+        (side_2[:, BIRTH_DAY] - side_1[:, BIRTH_DAY]) / DAYS_PER_YEAR / 10.0,  # age
+        *(side_1[:, STANCE + i] - side_2[:, STANCE + i] for i in range(len(STANCES))),
+        experience_1 - experience_2,
+        win_rate_1 - win_rate_2,
+        finish_rate_1 - finish_rate_2,
+        layoff_1 - layoff_2,
+    ]
+
+    return np.nan_to_num(np.column_stack(columns), nan=0.0)
+
+
+class FeatureStore:
+    """
+    Per-fighter features in one float table indexed by fighter id.
+
+    - Attributes come from the fighters table, history counts
+      from completed fights
+    - Committed fight and fighter writes mark the fighters
+      involved dirty; their rows are recomputed on the next read
+      with one fighters query and one indexed fights query
+    - Ratings are not stored: they are read from the rating
+      engine at scoring time, since a backdated result moves
+      ratings of fighters who weren't in it
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._table = None
+        self._dirty = set()
+
+    def reset(self):
+        with self._lock:
+            self._table = None
+            self._dirty.clear()
+
+    def mark_dirty(self, fighter_ids):
+        with self._lock:
+            self._dirty.update(fighter_ids)
+
+    def _grow(self, size: int):
+        if size > len(self._table):
+            extra = np.full((size - len(self._table), N_COLUMNS), np.nan)
+            extra[:, KNOWN] = 0
+            self._table = np.vstack([self._table, extra])
+
+    def _refresh(self, db: Session, fighter_ids: list[int] | None):
+        """
+        Recompute rows for fighter_ids (all fighters if None).
+        """
+
+        stmt = select(
+            Fighter.id, Fighter.height_cm, Fighter.reach_cm,
+            Fighter.date_of_birth, Fighter.stance,
+        )
+        if fighter_ids is not None:
+            stmt = stmt.where(Fighter.id.in_(fighter_ids))
+        fighters = db.execute(stmt).all()
+
+        history = history_counts(load_fight_columns(db, fighter_ids))
+
+        if fighter_ids is None:
+            self._table = np.zeros((0, N_COLUMNS))
+        else:
+            # Rows of deleted fighters go back to unknown
+            ids = np.array(fighter_ids, dtype=np.int64)
+            ids = ids[ids < len(self._table)]
+            self._table[ids] = np.nan
+            self._table[ids, KNOWN] = 0
+
+        if not fighters:
+            return
+
+        ids = np.array([row.id for row in fighters], dtype=np.int64)
+        self._grow(int(ids.max()) + 1)
+
+        rows = np.full((len(fighters), N_COLUMNS), np.nan)
+        rows[:, KNOWN] = 1
+        rows[:, HEIGHT] = [np.nan if row.height_cm is None else row.height_cm for row in fighters]
+        rows[:, REACH] = [np.nan if row.reach_cm is None else row.reach_cm for row in fighters]
+        rows[:, BIRTH_DAY] = [_epoch_day(row.date_of_birth) for row in fighters]
+
+        stance = np.array([(row.stance or "").strip().lower() for row in fighters])
+        for i, name in enumerate(STANCES):
+            rows[:, STANCE + i] = np.where(stance == "", np.nan, stance == name)
+
+        history_ids, fights, wins, finishes, last_day = history
+        rows[:, FIGHTS:LAST_FIGHT_DAY] = 0
+        lookup = np.full(int(max(ids.max(), history_ids.max(initial=0))) + 1, -1)
+        lookup[history_ids] = np.arange(len(history_ids))
+        matched = lookup[ids]
+        found = matched >= 0
+        matched = matched[found]
+        rows[found, FIGHTS] = fights[matched]
+        rows[found, WINS] = wins[matched]
+        rows[found, FINISHES] = finishes[matched]
+        rows[found, LAST_FIGHT_DAY] = last_day[matched]
+
+        self._table[ids] = rows
+
+    def rows(self, db: Session, fighter_ids: np.ndarray) -> np.ndarray:
+        """
+        Feature rows for fighter_ids, refreshing dirty or unseen
+        fighters first. Rows of fighters that don't exist have
+        KNOWN == 0.
+        """
+
+        fighter_ids = np.asarray(fighter_ids, dtype=np.int64)
+
+        with self._lock:
+            if self._table is None:
+                self._refresh(db, None)
+                self._dirty.clear()
+
+            # Fighters created outside the ORM (bulk import) aren't
+            # announced; look up any id the table hasn't seen. Ids
+            # below 1 can't exist and are never looked up.
+            valid = fighter_ids > 0
+            unseen = valid & (fighter_ids >= len(self._table))
+            seen = valid & ~unseen
+            unseen[seen] = self._table[fighter_ids[seen], KNOWN] == 0
+            stale = self._dirty | set(np.unique(fighter_ids[unseen]).tolist())
+
+            if stale:
+                self._refresh(db, sorted(stale))
+                self._dirty.clear()
+
+            # The table only grows to ids that exist: an id past its
+            # end after the refresh is unknown, however large
+            out = np.full((len(fighter_ids), N_COLUMNS), np.nan)
+            out[:, KNOWN] = 0
+            inside = valid & (fighter_ids < len(self._table))
+            out[inside] = self._table[fighter_ids[inside]]
+            return out
+
+
+feature_store = FeatureStore()
+
+
+@changes.subscribe
+def _mark_changed_fighters(committed):
+    fighter_ids = set()
+
+    for change in committed:
+        if change.table == "events" and "event_date" in change.previous:
+            # Moves last-fight dates of everyone on the card
+            feature_store.reset()
+            return
+        if change.table == "fighters":
+            fighter_ids.add(change.id)
+        elif change.table == "fights":
+            for row in (change.values, change.previous):
+                for key in ("fighter_1_id", "fighter_2_id"):
+                    if row.get(key) is not None:
+                        fighter_ids.add(row[key])
+
+    if fighter_ids:
+        feature_store.mark_dirty(fighter_ids)
+
+
+def training_set(db: Session, pre_bout_ratings) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Point-in-time training data: one row per fight with a winner.
+
+    History features count only fights before the bout and
+    ratings are the ratings going into it, so the model never
+    sees the result it is asked to predict. pre_bout_ratings is
+    (fight_id, rating_1, rating_2) from the rating engine.
+    Each fight is added from both corners (X, y) and (-X, 1 - y).
+    """
+
+    store = FeatureStore()
+    store._refresh(db, None)
+
+    fights = load_fight_columns(db)
+    completed = np.flatnonzero((fights.winner != NO_WINNER) | (fights.method != METHOD_NONE))
+    m = len(completed)
+
+    fighter = np.concatenate([fights.fighter_1[completed], fights.fighter_2[completed]])
+    position = np.tile(completed, 2)
+    won = (fights.winner[position] == fighter).astype(np.float64)
+    method = fights.method[position]
+    finished = won * ((method == METHOD_KO) | (method == METHOD_SUBMISSION))
+    day = fights.event_day[position].astype(np.float64)
+
+    # Per fighter, chronologically: counts before each appearance
+    order = np.lexsort((position, fighter))
+    sorted_fighter = fighter[order]
+    group_start = np.ones(len(order), dtype=bool)
+    group_start[1:] = sorted_fighter[1:] != sorted_fighter[:-1]
+    first = np.maximum.accumulate(np.where(group_start, np.arange(len(order)), 0))
+
+    def before(values):
+        total = np.cumsum(values[order]) - values[order]
+        out = np.empty(len(order))
+        out[order] = total - total[first]
+        return out
+
+    previous_day = np.empty(len(order))
+    previous_day[1:] = day[order][:-1]
+    previous_day[group_start] = np.nan
+    last_day = np.empty(len(order))
+    last_day[order] = previous_day
+
+    store._grow(int(fighter.max(initial=-1)) + 1)
+    sides = store._table[fighter]
+    sides[:, FIGHTS] = before(np.ones(len(order)))
+    sides[:, WINS] = before(won)
+    sides[:, FINISHES] = before(finished)
+    sides[:, LAST_FIGHT_DAY] = last_day
+
+    winner = fights.winner[completed]
+    decided = (winner == fights.fighter_1[completed]) | (winner == fights.fighter_2[completed])
+
+    rating_ids, rating_1, rating_2 = pre_bout_ratings
+    ratings = dict(zip(rating_ids.tolist(), zip(rating_1.tolist(), rating_2.tolist())))
+    pre = np.array([ratings.get(fight_id, (np.nan, np.nan))
+                    for fight_id in fights.fight_id[completed].tolist()]).reshape(-1, 2)
+
+    X = matchup_features(
+        sides[:m][decided], sides[m:][decided],
+        pre[decided, 0], pre[decided, 1],
+        day[:m][decided],
+    )
+    y = (winner[decided] == fights.fighter_1[completed][decided]).astype(np.float64)
+
+    return np.vstack([X, -X]), np.concatenate([y, 1.0 - y])
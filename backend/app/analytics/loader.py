@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.fight import Fight
+from app.services.fight_results import NO_CONTEST_METHODS
+
+# Method categories (Fight.method is free text)
+METHOD_NONE = 0
+METHOD_KO = 1
+METHOD_SUBMISSION = 2
+METHOD_DECISION = 3
+METHOD_OTHER = 4
+METHOD_NO_CONTEST = 5
+
+NO_WINNER = -1
+
+
+def classify_method(method: str | None) -> int:
+    """
+    Map a free-text method to a category.
+
+    "KO", "TKO", "KO/TKO" -> KO; "Submission" -> submission;
+    "Unanimous Decision" etc. -> decision; "NC" -> no contest.
+    """
+
+    if method is None:
+        return METHOD_NONE
+
+    text = method.strip().lower()
+    if text in NO_CONTEST_METHODS:
+        return METHOD_NO_CONTEST
+    if "ko" in text:
+        return METHOD_KO
+    if "sub" in text:
+        return METHOD_SUBMISSION
+    if "dec" in text:
+        return METHOD_DECISION
+    return METHOD_OTHER
+
+
+@dataclass(frozen=True)
+class FightColumns:
+    """
+    The fights table as parallel NumPy arrays, ordered by
+    (event_date, fight id).
+
+    - event_day: days since 1970-01-01
+    - winner: fighter id, or NO_WINNER
+    - method: METHOD_* category
+    - round: 0 when unknown
+    """
+
+    fight_id: np.ndarray
+    event_day: np.ndarray
+    fighter_1: np.ndarray
+    fighter_2: np.ndarray
+    winner: np.ndarray
+    method: np.ndarray
+    round: np.ndarray
+
+    def __len__(self):
+        return len(self.fight_id)
+
+
+def load_fight_columns(db: Session, fighter_ids: list[int] | None = None) -> FightColumns:
+    """
+    Load every fight in one query into columnar arrays.
+
+    With fighter_ids, only those fighters' fights are loaded
+    (served by the fighter_1_id / fighter_2_id indexes).
+    Method strings are classified once per distinct value,
+    not once per row.
+    """
+
+    stmt = (
+        select(
+            Fight.id,
+            Event.event_date,
+            Fight.fighter_1_id,
+            Fight.fighter_2_id,
+            Fight.winner_id,
+            Fight.method,
+            Fight.round,
+        )
+        .join(Event, Event.id == Fight.event_id)
+        .order_by(Event.event_date, Fight.id)
+    )
+
+    if fighter_ids is not None:
+        stmt = stmt.where(or_(
+            Fight.fighter_1_id.in_(fighter_ids),
+            Fight.fighter_2_id.in_(fighter_ids),
+        ))
+
+    rows = db.execute(stmt).all()
+
+    if not rows:
+        empty = np.array([], dtype=np.int64)
+        return FightColumns(
+            empty, empty, empty, empty, empty,
+            np.array([], dtype=np.int8), np.array([], dtype=np.int16),
+        )
+
+    fight_id, event_date, fighter_1, fighter_2, winner, method, round_ = zip(*rows)
+
+    methods, method_index = np.unique(
+        np.array([m if m is not None else "" for m in method], dtype=object),
+        return_inverse=True,
+    )
+    method_codes = np.array(
+        [classify_method(m) if m != "" else METHOD_NONE for m in methods],
+        dtype=np.int8,
+    )
+
+    return FightColumns(
+        fight_id=np.array(fight_id, dtype=np.int64),
+        event_day=np.array(event_date, dtype="datetime64[D]").astype(np.int64),
+        fighter_1=np.array(fighter_1, dtype=np.int64),
+        fighter_2=np.array(fighter_2, dtype=np.int64),
+        winner=np.array([NO_WINNER if w is None else w for w in winner], dtype=np.int64),
+        method=method_codes[method_index],
+        round=np.array([0 if r is None else r for r in round_], dtype=np.int16),
+    )
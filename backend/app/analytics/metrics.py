@@ -0,0 +1,219 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.analytics.loader import (
+    METHOD_DECISION,
+    METHOD_KO,
+    METHOD_NO_CONTEST,
+    METHOD_NONE,
+    METHOD_SUBMISSION,
+    NO_WINNER,
+    FightColumns,
+)
+
+# Per-appearance results
+RESULT_WIN = 0
+RESULT_LOSS = 1
+RESULT_DRAW = 2
+RESULT_NO_CONTEST = 3
+
+# Window for "recent activity"
+ACTIVE_WINDOW_DAYS = 365
+
+
+@dataclass(frozen=True)
+class Appearances:
+    """
+    One row per (fighter, completed fight), sorted by fighter
+    and then chronologically. offsets[i]:offsets[i + 1] is the
+    slice of fighter_ids[i].
+    """
+
+    fighter_ids: np.ndarray
+    offsets: np.ndarray
+    fighter: np.ndarray
+    day: np.ndarray
+    result: np.ndarray
+    method: np.ndarray
+    round: np.ndarray
+
+
+def build_appearances(fights: FightColumns) -> Appearances:
+    """
+    Unfold both corners of every completed fight into appearances.
+
+    Scheduled fights (no winner, no method) are dropped.
+    Mirrors fight_results.result_for.
+    """
+
+    completed = (fights.winner != NO_WINNER) | (fights.method != METHOD_NONE)
+    order = np.flatnonzero(completed)
+
+    fighter = np.concatenate([fights.fighter_1[order], fights.fighter_2[order]])
+    fight_pos = np.concatenate([order, order])
+    winner = fights.winner[fight_pos]
+    method = fights.method[fight_pos]
+
+    result = np.full(len(fighter), RESULT_DRAW, dtype=np.int8)
+    result[method == METHOD_NO_CONTEST] = RESULT_NO_CONTEST
+    result[winner != NO_WINNER] = RESULT_LOSS
+    result[winner == fighter] = RESULT_WIN
+
+    # Fights are already chronological, so their position is the time key
+    sort = np.lexsort((fight_pos, fighter))
+    fighter = fighter[sort]
+
+    fighter_ids, starts = np.unique(fighter, return_index=True)
+    offsets = np.append(starts, len(fighter))
+
+    return Appearances(
+        fighter_ids=fighter_ids,
+        offsets=offsets,
+        fighter=np.searchsorted(fighter_ids, fighter),
+        day=fights.event_day[fight_pos][sort],
+        result=result[sort],
+        method=method[sort],
+        round=fights.round[fight_pos][sort],
+    )
+
+
+def win_streaks(apps: Appearances) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (current, longest) win streak per fighter in one pass.
+
+    Splits the sorted appearances into runs of equal
+    (fighter, is_win) and measures the win runs.
+    No contests are skipped; draws and losses end a streak.
+    """
+
+    n_fighters = len(apps.fighter_ids)
+    current = np.zeros(n_fighters, dtype=np.int64)
+    longest = np.zeros(n_fighters, dtype=np.int64)
+
+    counted = apps.result != RESULT_NO_CONTEST
+    fighter = apps.fighter[counted]
+    is_win = apps.result[counted] == RESULT_WIN
+    if len(fighter) == 0:
+        return current, longest
+
+    boundary = np.ones(len(fighter), dtype=bool)
+    boundary[1:] = (fighter[1:] != fighter[:-1]) | (is_win[1:] != is_win[:-1])
+    run_id = np.cumsum(boundary) - 1
+
+    run_length = np.bincount(run_id)
+    run_start = np.flatnonzero(boundary)
+    run_fighter = fighter[run_start]
+    run_is_win = is_win[run_start]
+
+    np.maximum.at(longest, run_fighter[run_is_win], run_length[run_is_win])
+
+    # A fighter's last run is their current form
+    last = np.ones(len(run_start), dtype=bool)
+    last[:-1] = run_fighter[1:] != run_fighter[:-1]
+    current_runs = last & run_is_win
+    current[run_fighter[current_runs]] = run_length[current_runs]
+
+    return current, longest
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    out = np.zeros(len(numerator), dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+@dataclass(frozen=True)
+class FighterMetrics:
+    """
+    Metrics for every fighter with a completed fight, as arrays
+    aligned with fighter_ids. Rates are fractions of wins.
+    """
+
+    fighter_ids: np.ndarray
+    fights: np.ndarray
+    wins: np.ndarray
+    losses: np.ndarray
+    draws: np.ndarray
+    no_contests: np.ndarray
+    ko_wins: np.ndarray
+    submission_wins: np.ndarray
+    decision_wins: np.ndarray
+    current_win_streak: np.ndarray
+    longest_win_streak: np.ndarray
+    ko_rate: np.ndarray
+    submission_rate: np.ndarray
+    decision_rate: np.ndarray
+    finish_rate: np.ndarray
+    avg_finish_round: np.ndarray  # NaN without a finish that has a round
+    first_fight_day: np.ndarray
+    last_fight_day: np.ndarray
+    fights_last_year: np.ndarray
+
+
+def compute_metrics(apps: Appearances, today_day: int) -> FighterMetrics:
+    """
+    Every metric for every fighter, vectorized over appearances.
+
+    Counts use bincount on the dense fighter index;
+    today_day (days since epoch) anchors the activity window.
+    """
+
+    n = len(apps.fighter_ids)
+    fighter = apps.fighter
+
+    def count(mask):
+        return np.bincount(fighter[mask], minlength=n)
+
+    won = apps.result == RESULT_WIN
+    ko_wins = count(won & (apps.method == METHOD_KO))
+    submission_wins = count(won & (apps.method == METHOD_SUBMISSION))
+    decision_wins = count(won & (apps.method == METHOD_DECISION))
+    wins = count(won)
+
+    finished = won & ((apps.method == METHOD_KO) | (apps.method == METHOD_SUBMISSION))
+    with_round = finished & (apps.round > 0)
+    round_sum = np.bincount(fighter[with_round], weights=apps.round[with_round], minlength=n)
+    round_count = count(with_round)
+    avg_finish_round = np.full(n, np.nan)
+    np.divide(round_sum, round_count, out=avg_finish_round, where=round_count > 0)
+
+    current, longest = win_streaks(apps)
+
+    starts = apps.offsets[:-1]
+    ends = apps.offsets[1:]
+    recent = apps.day > today_day - ACTIVE_WINDOW_DAYS
+
+    return FighterMetrics(
+        fighter_ids=apps.fighter_ids,
+        fights=ends - starts,
+        wins=wins,
+        losses=count(apps.result == RESULT_LOSS),
+        draws=count(apps.result == RESULT_DRAW),
+        no_contests=count(apps.result == RESULT_NO_CONTEST),
+        ko_wins=ko_wins,
+        submission_wins=submission_wins,
+        decision_wins=decision_wins,
+        current_win_streak=current,
+        longest_win_streak=longest,
+        ko_rate=_ratio(ko_wins, wins),
+        submission_rate=_ratio(submission_wins, wins),
+        decision_rate=_ratio(decision_wins, wins),
+        finish_rate=_ratio(ko_wins + submission_wins, wins),
+        avg_finish_round=avg_finish_round,
+        first_fight_day=apps.day[starts] if n else np.array([], dtype=np.int64),
+        last_fight_day=apps.day[ends - 1] if n else np.array([], dtype=np.int64),
+        fights_last_year=count(recent & (apps.day <= today_day)),
+    )
+
+
+def fights_by_year(apps: Appearances, position: int) -> dict[int, int]:
+    """
+    Completed fights per calendar year for one fighter
+    (position in apps.fighter_ids).
+    """
+
+    days = apps.day[apps.offsets[position]:apps.offsets[position + 1]]
+    years = days.astype("datetime64[D]").astype("datetime64[Y]").astype(np.int64) + 1970
+    values, counts = np.unique(years, return_counts=True)
+    return {int(year): int(n) for year, n in zip(values, counts)}
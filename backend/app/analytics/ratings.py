@@ -0,0 +1,426 @@
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import date
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.analytics.loader import (
+    METHOD_NO_CONTEST,
+    METHOD_NONE,
+    NO_WINNER,
+    classify_method,
+    load_fight_columns,
+)
+from app.core import changes
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+# Bouts are ordered by (event day, fight id), packed into one sortable int64
+_DAY_SHIFT = 32
+
+
+def _bout_key(day, fight_id):
+    return (np.asarray(day, dtype=np.int64) << _DAY_SHIFT) | np.asarray(fight_id, dtype=np.int64)
+
+
+def _to_date(day) -> date:
+    return np.datetime64(int(day), "D").astype(date)
+
+
+def bout_score(fighter_1_id: int, fighter_2_id: int, winner_id, method_code: int):
+    """
+    Score of a fight for fighter_1 (1, 0 or 0.5 for a draw).
+
+    Returns None for fights that don't move ratings:
+    scheduled fights and no contests.
+    """
+
+    if winner_id is None or winner_id == NO_WINNER:
+        if method_code in (METHOD_NONE, METHOD_NO_CONTEST):
+            return None
+        return 0.5
+    if winner_id == fighter_1_id:
+        return 1.0
+    if winner_id == fighter_2_id:
+        return 0.0
+    return None
+
+
+class RatingEngine:
+    """
+    Elo ratings replayed over every rated bout in event_date order.
+
+    State is a set of parallel arrays, one row per bout
+    (fighter_1 is "a", fighter_2 is "b"), plus the current rating
+    of every fighter in an array indexed by fighter id.
+    Each bout keeps the ratings going into it, so a write only
+    rewinds to the first affected bout and replays from there:
+    a result on the latest card costs one Elo update.
+
+    Committed fight and event writes reach the engine through
+    app.core.changes. Writes it can't place (an event moving to
+    another date, an unknown event) drop the state; the next read
+    reloads it.
+
+    The change hook runs in commit, on the event loop for async
+    sessions, so it never waits for the lock: while a read holds
+    it (a first read replays the whole history) changes are queued
+    and applied by that read before it lets go. Applying a change
+    the load already saw is harmless: bouts are replaced by id.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        # Change batches waiting for the lock holder
+        self._queued: list[list[changes.Change]] = []
+        self._queue_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        self._lock.acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self):
+        """
+        Apply the queued changes, then release the lock. The queue
+        is checked and the lock released under _queue_lock, so a
+        batch queued meanwhile is never left behind.
+        """
+
+        while True:
+            with self._queue_lock:
+                if not self._queued:
+                    self._lock.release()
+                    return
+                batch = self._queued.pop(0)
+            try:
+                self._apply(batch)
+            except Exception:
+                logger.exception("Rating update failed, reloading on the next read")
+                self._loaded = False
+
+    # -------------------------
+    # Loading and replay
+    # -------------------------
+
+    def _load(self, db: Session):
+        fights = load_fight_columns(db)
+
+        codes = fights.method
+        score = np.full(len(fights), np.nan)
+        has_winner = fights.winner != NO_WINNER
+        score[~has_winner & (codes != METHOD_NONE) & (codes != METHOD_NO_CONTEST)] = 0.5
+        score[has_winner & (fights.winner == fights.fighter_1)] = 1.0
+        score[has_winner & (fights.winner == fights.fighter_2)] = 0.0
+        rated = ~np.isnan(score)
+
+        self.fight_id = fights.fight_id[rated]
+        self.day = fights.event_day[rated]
+        self.key = _bout_key(self.day, self.fight_id)
+        self.a = fights.fighter_1[rated]
+        self.b = fights.fighter_2[rated]
+        self.score = score[rated]
+        self.pre_a = np.zeros(len(self.a))
+        self.pre_b = np.zeros(len(self.a))
+        self.delta = np.zeros(len(self.a))
+
+        size = int(max(self.a.max(initial=0), self.b.max(initial=0))) + 1
+        self.ratings = np.full(size, INITIAL_RATING)
+
+        self.event_days = {
+            event_id: int(np.datetime64(event_date, "D").astype(np.int64))
+            for event_id, event_date in db.execute(select(Event.id, Event.event_date))
+        }
+
+        self._replay(0)
+        self._loaded = True
+
+    def _grow(self, fighter_id: int):
+        if fighter_id >= len(self.ratings):
+            extra = fighter_id + 1 - len(self.ratings)
+            self.ratings = np.concatenate([self.ratings, np.full(extra, INITIAL_RATING)])
+
+    def _replay(self, start: int):
+        """
+        Apply Elo from bout `start` to the end.
+
+        self.ratings must hold the ratings as of just before `start`.
+        Plain lists keep the sequential loop fast.
+        """
+
+        a = self.a[start:].tolist()
+        b = self.b[start:].tolist()
+        score = self.score[start:].tolist()
+        ratings = self.ratings.tolist()
+        pre_a, pre_b, delta = [], [], []
+
+        for i in range(len(a)):
+            ra = ratings[a[i]]
+            rb = ratings[b[i]]
+            expected = 1.0 / (1.0 + 10.0 ** ((rb - ra) / 400.0))
+            d = K_FACTOR * (score[i] - expected)
+
+            pre_a.append(ra)
+            pre_b.append(rb)
+            delta.append(d)
+            ratings[a[i]] = ra + d
+            ratings[b[i]] = rb - d
+
+        self.pre_a[start:] = pre_a
+        self.pre_b[start:] = pre_b
+        self.delta[start:] = delta
+        self.ratings = np.array(ratings)
+        self._rankings = None
+
+    def _rewind(self, start: int):
+        """
+        Restore self.ratings to just before bout `start`: each
+        fighter who fought since takes the rating going into their
+        first bout at or after `start`.
+        """
+
+        fighters = np.concatenate([self.a[start:], self.b[start:]])
+        before = np.concatenate([self.pre_a[start:], self.pre_b[start:]])
+        position = np.tile(np.arange(start, len(self.a)), 2)
+
+        order = np.argsort(position, kind="stable")
+        fighters, first = np.unique(fighters[order], return_index=True)
+        self.ratings[fighters] = before[order][first]
+
+    def _splice(self, start: int, removed: np.ndarray, added: list[tuple]):
+        """
+        Replace the bouts from `start` on: drop `removed` positions,
+        add (fight_id, day, a, b, score) rows, keep key order.
+        """
+
+        keep = np.ones(len(self.a) - start, dtype=bool)
+        keep[removed - start] = False
+
+        def tail(column, new_values, dtype):
+            return np.concatenate([column[start:][keep], np.array(new_values, dtype=dtype)])
+
+        fight_id = tail(self.fight_id, [row[0] for row in added], np.int64)
+        day = tail(self.day, [row[1] for row in added], np.int64)
+        a = tail(self.a, [row[2] for row in added], np.int64)
+        b = tail(self.b, [row[3] for row in added], np.int64)
+        score = tail(self.score, [row[4] for row in added], np.float64)
+        key = _bout_key(day, fight_id)
+        order = np.argsort(key, kind="stable")
+
+        def join(column, new_tail):
+            return np.concatenate([column[:start], new_tail[order]])
+
+        self.fight_id = join(self.fight_id, fight_id)
+        self.day = join(self.day, day)
+        self.key = join(self.key, key)
+        self.a = join(self.a, a)
+        self.b = join(self.b, b)
+        self.score = join(self.score, score)
+        size = len(self.a)
+        self.pre_a = np.resize(self.pre_a, size)
+        self.pre_b = np.resize(self.pre_b, size)
+        self.delta = np.resize(self.delta, size)
+
+    # -------------------------
+    # Incremental updates
+    # -------------------------
+
+    def apply(self, committed: list[changes.Change]):
+        """
+        Fold committed fight/event writes into the ratings, now or,
+        while another thread holds the lock, when it lets go.
+        """
+
+        with self._queue_lock:
+            self._queued.append(committed)
+        if self._lock.acquire(blocking=False):
+            self._release()
+
+    def _apply(self, committed: list[changes.Change]):
+        """
+        Fold one batch of changes in (lock held).
+
+        Steps:
+        - Turn fight writes into removed and added bouts
+        - Rewind to the earliest affected bout
+        - Splice the bouts and replay forward
+        """
+
+        if not self._loaded:
+            return
+
+        removed_ids = set()
+        added = {}
+
+        # Events first: a card and its fights can commit together
+        for change in sorted(committed, key=lambda c: c.table != "events"):
+            if change.table == "events":
+                if change.op == "insert":
+                    self.event_days[change.id] = int(
+                        np.datetime64(change.values["event_date"], "D").astype(np.int64)
+                    )
+                elif change.op == "delete" or "event_date" in change.previous:
+                    self._loaded = False
+                    return
+                continue
+
+            if change.table != "fights":
+                continue
+
+            removed_ids.add(change.id)
+            added.pop(change.id, None)
+            if change.op == "delete":
+                continue
+
+            values = change.values
+            score = bout_score(
+                values["fighter_1_id"],
+                values["fighter_2_id"],
+                values["winner_id"],
+                classify_method(values["method"]),
+            )
+            if score is None:
+                continue
+
+            day = self.event_days.get(values["event_id"])
+            if day is None:
+                self._loaded = False
+                return
+
+            added[change.id] = (
+                change.id, day, values["fighter_1_id"], values["fighter_2_id"], score
+            )
+
+        removed = np.flatnonzero(np.isin(self.fight_id, list(removed_ids)))
+        if len(removed) == 0 and not added:
+            return
+
+        starts = [len(self.a)]
+        if len(removed):
+            starts.append(int(removed[0]))
+        if added:
+            new_keys = _bout_key(
+                [row[1] for row in added.values()], [row[0] for row in added.values()]
+            )
+            starts.append(int(np.searchsorted(self.key, new_keys).min()))
+        start = min(starts)
+
+        self._rewind(start)
+        self._splice(start, removed, list(added.values()))
+        for row in added.values():
+            self._grow(max(row[2], row[3]))
+        self._replay(start)
+
+    # -------------------------
+    # Reads
+    # -------------------------
+
+    def _ensure_loaded(self, db: Session):
+        if not self._loaded:
+            self._load(db)
+
+    def rankings(self, db: Session, limit: int, min_fights: int) -> list[tuple[int, float, int]]:
+        """
+        Top fighters by current rating as (fighter_id, rating, bouts).
+
+        The full ordering is cached until the next replay,
+        so serving a page is a slice.
+        """
+
+        with self._locked():
+            self._ensure_loaded(db)
+
+            if self._rankings is None:
+                bouts = np.bincount(
+                    np.concatenate([self.a, self.b]), minlength=len(self.ratings)
+                )
+                rated = np.flatnonzero(bouts > 0)
+                order = np.lexsort((rated, -self.ratings[rated]))
+                ranked = rated[order]
+                self._rankings = (ranked, self.ratings[ranked].copy(), bouts[ranked])
+
+            ranked, ratings, bouts = self._rankings
+
+        eligible = np.flatnonzero(bouts >= min_fights)[:limit]
+        return [
+            (int(ranked[i]), float(ratings[i]), int(bouts[i]))
+            for i in eligible
+        ]
+
+    def history(self, db: Session, fighter_id: int) -> list[dict]:
+        """
+        Rating before and after each of a fighter's rated bouts, oldest first.
+        """
+
+        with self._locked():
+            self._ensure_loaded(db)
+
+            as_a = self.a == fighter_id
+            positions = np.flatnonzero(as_a | (self.b == fighter_id))
+
+            entries = []
+            for i in positions.tolist():
+                corner_a = bool(as_a[i])
+                before = self.pre_a[i] if corner_a else self.pre_b[i]
+                change = self.delta[i] if corner_a else -self.delta[i]
+                score = self.score[i] if corner_a else 1.0 - self.score[i]
+
+                entries.append({
+                    "fight_id": int(self.fight_id[i]),
+                    "event_date": _to_date(self.day[i]),
+                    "opponent_id": int(self.b[i] if corner_a else self.a[i]),
+                    "score": float(score),
+                    "rating_before": float(before),
+                    "rating_after": float(before + change),
+                })
+
+        return entries
+
+    def current_ratings(self, db: Session, fighter_ids: np.ndarray) -> np.ndarray:
+        """
+        Current rating of each fighter id (INITIAL_RATING if unrated).
+        """
+
+        fighter_ids = np.asarray(fighter_ids, dtype=np.int64)
+
+        with self._locked():
+            self._ensure_loaded(db)
+
+            out = np.full(len(fighter_ids), INITIAL_RATING)
+            # Negative ids would wrap around to other fighters
+            inside = (fighter_ids > 0) & (fighter_ids < len(self.ratings))
+            out[inside] = self.ratings[fighter_ids[inside]]
+
+        return out
+
+    def pre_bout_ratings(self, db: Session) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (fight_id, rating_1, rating_2) going into every rated bout.
+        """
+
+        with self._locked():
+            self._ensure_loaded(db)
+            return self.fight_id.copy(), self.pre_a.copy(), self.pre_b.copy()
+
+    def reset(self):
+        with self._locked():
+            self._loaded = False
+
+
+rating_engine = RatingEngine()
+
+
+@changes.subscribe
+def _apply_fight_changes(committed):
+    rating_engine.apply(committed)
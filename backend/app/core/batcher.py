@@ -0,0 +1,187 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from app.core.metrics import batch_flush_duration, batch_flush_size, batch_flushes, batch_queue_depth
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Batcher:
+    """
+    Coalesces items submitted by many requests into batches for
+    one flush function, run on a background thread.
+
+    - submit() queues an item and returns a Future at once
+    - The queue is flushed when max_size items are waiting, or
+      max_wait seconds after the oldest one arrived
+    - flush(items) returns one result per item, in order; a batch
+      that raises is retried (retries times), then its items are
+      flushed one by one and only the ones that still raise fail
+    - At most max_pending items wait; beyond that submit raises
+      QueueFull
+    """
+
+    def __init__(self, name: str, flush, max_size: int, max_wait: float,
+                 max_pending: int, retries: int = 2):
+        self.name = name
+        self._flush = flush
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.retries = retries
+
+        # (item, future, monotonic arrival time), oldest first
+        self._items: list[tuple[object, Future, float]] = []
+        self._force = False
+        self._condition = threading.Condition()
+        self._flushing = False
+        self._thread = None
+        self._stopped = False
+
+    def submit(self, item) -> Future:
+        future = Future()
+
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError(f"{self.name} batcher is shut down")
+            if len(self._items) >= self.max_pending:
+                raise QueueFull(f"{len(self._items)} {self.name} items already queued")
+
+            self._items.append((item, future, time.monotonic()))
+            batch_queue_depth.set(self.name, value=len(self._items))
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-batcher", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+        return future
+
+    def _take(self) -> list[tuple[object, Future, float]]:
+        batch = self._items[:self.max_size]
+        del self._items[:self.max_size]
+        if not self._items:
+            self._force = False
+        batch_queue_depth.set(self.name, value=len(self._items))
+        return batch
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._items:
+                        due = self._items[0][2] + self.max_wait - time.monotonic()
+                        if len(self._items) >= self.max_size or due <= 0 or self._force or self._stopped:
+                            break
+                        self._condition.wait(due)
+                    elif self._stopped:
+                        # Drained: a later submit starts a new thread
+                        self._thread = None
+                        self._stopped = False
+                        self._condition.notify_all()
+                        return
+                    else:
+                        self._condition.wait()
+
+                batch = self._take()
+                self._flushing = True
+
+            try:
+                self._flush_batch(batch)
+            finally:
+                with self._condition:
+                    self._flushing = False
+                    self._condition.notify_all()
+
+    def _flush_batch(self, batch: list[tuple[object, Future, float]]):
+        items = [item for item, _, _ in batch]
+        batch_flush_size.observe(self.name, value=len(items))
+
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                results = self._flush(items)
+            except Exception as exc:
+                batch_flushes.inc(self.name, "error")
+                if attempt < self.retries:
+                    logger.warning("%s batch of %d failed, retrying: %s", self.name, len(items), exc)
+                    time.sleep(0.05 * 2 ** attempt)
+                    continue
+                if len(batch) > 1:
+                    # One bad item must not sink the others
+                    logger.warning("%s batch of %d failed, flushing items one by one: %s",
+                                   self.name, len(items), exc)
+                    self._flush_each(batch)
+                    return
+                logger.exception("%s batch of %d failed", self.name, len(items))
+                batch[0][1].set_exception(exc)
+                return
+            finally:
+                batch_flush_duration.observe(self.name, value=time.perf_counter() - start)
+
+            batch_flushes.inc(self.name, "ok")
+            for (_, future, _), result in zip(batch, results):
+                future.set_result(result)
+            return
+
+    def _flush_each(self, batch: list[tuple[object, Future, float]]):
+        """
+        Flush the items of a failed batch in batches of one, so only
+        the futures of the items that fail on their own fail.
+        """
+
+        for item, future, _ in batch:
+            try:
+                [result] = self._flush([item])
+            except Exception as exc:
+                batch_flushes.inc(self.name, "error")
+                logger.exception("%s item failed on its own", self.name)
+                future.set_exception(exc)
+            else:
+                batch_flushes.inc(self.name, "ok")
+                future.set_result(result)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """
+        Flush everything queued now and wait until it is written.
+
+        Returns False if the timeout expired first.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            # Everything queued is due at once
+            self._force = bool(self._items)
+            self._condition.notify_all()
+            while self._items or self._flushing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float | None = 10.0) -> bool:
+        """
+        Flush what is queued, then stop the background thread
+        (a later submit starts a new one).
+
+        Returns False if the thread is still flushing after timeout:
+        submit keeps raising until it exits, so there is never a
+        second thread.
+        """
+
+        with self._condition:
+            if self._thread is None:
+                return True
+            self._stopped = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        thread.join(timeout)
+        return not thread.is_alive()
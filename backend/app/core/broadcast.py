@@ -0,0 +1,384 @@
+import asyncio
+import logging
+import select
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import orjson
+
+from app.core.batcher import Batcher, QueueFull
+from app.core.metrics import stream_connections, stream_dropped, stream_messages
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel every worker LISTENs on; the stream channel
+# travels in the payload
+NOTIFY_CHANNEL = "card_stream"
+
+# Publishes waiting for the NOTIFY thread; beyond that they are
+# delivered in this worker only
+NOTIFY_QUEUE_LIMIT = 10000
+
+
+class TooManySubscribers(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class Message:
+    """
+    One server-sent event.
+
+    ids increase with publication time, and are the same in every
+    worker when messages are relayed through Postgres.
+    """
+
+    id: int
+    channel: str
+    event: str
+    data: str
+
+    def encode(self) -> bytes:
+        return f"id: {self.id}\nevent: {self.event}\ndata: {self.data}\n\n".encode()
+
+
+class Subscription:
+    """
+    Messages for one stream, waiting to be written.
+
+    Lives on the event loop that serves the stream: the broadcaster
+    hands messages over with call_soon_threadsafe. A subscription
+    with more than limit undelivered messages is closed, so a slow
+    client can't hold memory; it resumes with Last-Event-ID.
+    """
+
+    def __init__(self, channel: str, limit: int):
+        self.channel = channel
+        self.limit = limit
+        self.loop = asyncio.get_running_loop()
+        # Last-Event-ID could not be resumed from the history
+        self.reset = False
+        self.closed = False
+        self._messages = deque()
+        self._ready = asyncio.Event()
+
+    def push(self, message: Message):
+        if self.closed:
+            return
+        if len(self._messages) >= self.limit:
+            self.closed = True
+            stream_dropped.inc()
+        else:
+            self._messages.append(message)
+        self._ready.set()
+
+    def end(self):
+        self.closed = True
+        self._ready.set()
+
+    async def get(self, timeout: float) -> list[Message] | None:
+        """
+        Every waiting message; [] if none arrived within timeout,
+        None once the subscription is closed and drained.
+        """
+
+        if not self._messages and not self.closed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        self._ready.clear()
+
+        if self._messages:
+            messages = list(self._messages)
+            self._messages.clear()
+            return messages
+        return None if self.closed else []
+
+
+def _fan_out(subscriptions: list[Subscription], message: Message):
+    for subscription in subscriptions:
+        subscription.push(message)
+
+
+class Broadcaster:
+    """
+    In-process pub/sub of stream messages by channel.
+
+    - publish() may be called from any thread (request threads,
+      the result batcher); subscriptions are served on asyncio,
+      so an idle stream costs a coroutine and a deque
+    - The last history messages are kept for resuming a stream
+      from its Last-Event-ID
+    - "memory" delivers in this process only; "postgres" sends
+      every message through NOTIFY and delivers what a LISTEN
+      connection receives, so all workers see all writes
+    - NOTIFY runs on its own thread: publish() is called from
+      commit hooks, on the event loop for async sessions, and
+      must not wait on the database there
+    """
+
+    def __init__(self, backend: str = "memory", engine=None, history: int = 1000,
+                 queue_size: int = 100, max_connections: int = 10000):
+        if backend not in ("memory", "postgres"):
+            raise RuntimeError(f"Unknown STREAM_BACKEND {backend!r} (memory or postgres)")
+        if backend == "postgres" and (engine is None or engine.dialect.driver != "psycopg2"):
+            raise RuntimeError("STREAM_BACKEND=postgres needs a postgresql+psycopg2 DATABASE_URL")
+
+        self.backend = backend
+        self.engine = engine
+        self.queue_size = queue_size
+        self.max_connections = max_connections
+
+        self._channels: dict[str, set[Subscription]] = {}
+        self._history: deque[Message] = deque(maxlen=history)
+        self._count = 0
+        self._last_id = 0
+        self._lock = threading.Lock()
+
+        self._notifier = None
+        if backend == "postgres":
+            # Everything queued meanwhile goes out in one round trip
+            self._notifier = Batcher(
+                "stream-notify", self._notify_batch,
+                max_size=500, max_wait=0, max_pending=NOTIFY_QUEUE_LIMIT, retries=1,
+            )
+
+        self._listener = None
+        self._stopped = threading.Event()
+        # Set while the LISTEN connection is up
+        self.listening = threading.Event()
+
+    def next_id(self) -> int:
+        # Microseconds since the epoch, strictly increasing in this process
+        with self._lock:
+            self._last_id = max(self._last_id + 1, time.time_ns() // 1000)
+            return self._last_id
+
+    def publish(self, messages: list[tuple[str, str, dict]]):
+        """
+        Publish (channel, event, data) messages, in order.
+        """
+
+        if not messages:
+            return
+        encoded = [
+            Message(self.next_id(), channel, event, orjson.dumps(data).decode())
+            for channel, event, data in messages
+        ]
+
+        if self._notifier is not None:
+            try:
+                future = self._notifier.submit(encoded)
+            except (QueueFull, RuntimeError):
+                logger.exception("Stream NOTIFY queue unavailable, delivering locally only")
+            else:
+                future.add_done_callback(lambda done: self._notified(done, encoded))
+                return
+
+        for message in encoded:
+            self.deliver(message)
+
+    def _notified(self, future, messages: list[Message]):
+        if future.exception() is not None:
+            # Other workers miss these; this one still delivers them
+            logger.error("Stream NOTIFY failed, delivering locally only: %s", future.exception())
+            for message in messages:
+                self.deliver(message)
+
+    def _notify_batch(self, batches: list[list[Message]]) -> list[None]:
+        self._notify([message for messages in batches for message in messages])
+        return [None] * len(batches)
+
+    def _notify(self, messages: list[Message]):
+        payloads = [
+            {"channel": NOTIFY_CHANNEL, "payload": orjson.dumps(message.__dict__).decode()}
+            for message in messages
+        ]
+        with self.engine.connect() as connection:
+            connection.exec_driver_sql("SELECT pg_notify(%(channel)s, %(payload)s)", payloads)
+            connection.commit()
+
+    def deliver(self, message: Message):
+        """
+        Record a message and hand it to the channel's subscriptions.
+        """
+
+        with self._lock:
+            self._history.append(message)
+            subscriptions = list(self._channels.get(message.channel, ()))
+        stream_messages.inc()
+
+        # One callback per event loop, not per subscription
+        by_loop: dict[asyncio.AbstractEventLoop, list[Subscription]] = {}
+        for subscription in subscriptions:
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+        for loop, group in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_fan_out, group, message)
+            except RuntimeError:
+                # Loop already closed; its streams are gone
+                pass
+
+    def subscribe(self, channel: str, last_event_id: int | None = None) -> Subscription:
+        """
+        Start receiving a channel's messages; call on the event loop.
+
+        With last_event_id, the channel's messages published after
+        it are queued first. If that message is no longer in the
+        history (or never reached this worker) subscription.reset
+        is set: the client has to reload what it shows.
+        Raises TooManySubscribers beyond max_connections.
+        """
+
+        subscription = Subscription(channel, self.queue_size)
+
+        with self._lock:
+            if self._count >= self.max_connections:
+                raise TooManySubscribers(f"{self._count} streams already open")
+            self._channels.setdefault(channel, set()).add(subscription)
+            self._count += 1
+            stream_connections.set(value=self._count)
+
+            if last_event_id is not None:
+                ids = [message.id for message in self._history]
+                if last_event_id in ids:
+                    start = ids.index(last_event_id) + 1
+                    for message in list(self._history)[start:]:
+                        if message.channel == channel:
+                            subscription.push(message)
+                else:
+                    subscription.reset = True
+
+        self.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            channel = self._channels.get(subscription.channel)
+            if channel is None or subscription not in channel:
+                return
+            channel.discard(subscription)
+            if not channel:
+                del self._channels[subscription.channel]
+            self._count -= 1
+            stream_connections.set(value=self._count)
+
+    @property
+    def connections(self) -> int:
+        with self._lock:
+            return self._count
+
+    @property
+    def full(self) -> bool:
+        return self.connections >= self.max_connections
+
+    def close(self):
+        """
+        Send the queued NOTIFYs, end every open stream and stop
+        listening (a later subscribe starts again). Called on
+        shutdown, so servers don't wait on streams that never finish.
+        """
+
+        if self._notifier is not None:
+            self._notifier.shutdown(5)
+
+        with self._lock:
+            subscriptions = [s for channel in self._channels.values() for s in channel]
+            self._channels.clear()
+            self._count = 0
+            stream_connections.set(value=0)
+
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.end)
+            except RuntimeError:
+                pass
+
+        listener = self._listener
+        if listener is not None:
+            self._stopped.set()
+            listener.join(5)
+            self._listener = None
+            self._stopped.clear()
+
+    def reset(self):
+        """
+        Forget the history (tests).
+        """
+        with self._lock:
+            self._history.clear()
+
+    def start(self):
+        """
+        Open the LISTEN connection (postgres backend), so messages
+        are in the history before the first stream connects.
+        """
+
+        if self.backend != "postgres":
+            return
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(target=self._listen, name="stream-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        """
+        Deliver NOTIFY payloads until close(); reconnects after errors.
+        """
+
+        while not self._stopped.is_set():
+            try:
+                raw = self.engine.raw_connection()
+                connection = raw.driver_connection
+                # A dedicated connection: never returned to the pool
+                raw.detach()
+                connection.rollback()
+                connection.autocommit = True
+                connection.cursor().execute(f"LISTEN {NOTIFY_CHANNEL}")
+                self.listening.set()
+            except Exception:
+                logger.exception("Stream LISTEN connection failed, retrying")
+                self._stopped.wait(1)
+                continue
+
+            try:
+                while not self._stopped.is_set():
+                    if select.select([connection], [], [], 0.5)[0]:
+                        connection.poll()
+                        while connection.notifies:
+                            payload = orjson.loads(connection.notifies.pop(0).payload)
+                            self.deliver(Message(**payload))
+            except Exception:
+                # Messages sent while reconnecting are lost; clients
+                # resuming from before the gap get a reset
+                logger.exception("Stream LISTEN connection lost, reconnecting")
+                with self._lock:
+                    self._history.clear()
+            finally:
+                self.listening.clear()
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+
+
+def build_broadcaster() -> Broadcaster:
+    engine = None
+    if settings.STREAM_BACKEND == "postgres":
+        from app.database import engine
+
+    return Broadcaster(
+        settings.STREAM_BACKEND,
+        engine=engine,
+        history=settings.STREAM_HISTORY,
+        queue_size=settings.STREAM_QUEUE_SIZE,
+        max_connections=settings.STREAM_MAX_CONNECTIONS,
+    )
+
+
+broadcaster = build_broadcaster()
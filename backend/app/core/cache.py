@@ -0,0 +1,366 @@
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core import changes
+from app.core.batcher import Batcher, QueueFull
+from app.core.conditional import etag_matches
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Public GET routes served through the cache, with the tags
+# whose invalidation makes a cached response stale
+CACHED_ROUTES = [
+    (re.compile(r"^/fighters$"), lambda m: ["fighters"]),
+    (re.compile(r"^/fighters/search$"), lambda m: ["fighters"]),
+    (re.compile(r"^/fighters/(\d+)$"), lambda m: [f"fighter:{m[1]}"]),
+    (re.compile(r"^/events$"), lambda m: ["events"]),
+    (re.compile(r"^/events/(\d+)$"), lambda m: [f"event:{m[1]}"]),
+    (re.compile(r"^/events/(\d+)/card$"), lambda m: [f"event:{m[1]}", "fighter-names"]),
+]
+
+# Response headers stored with the body
+CACHED_HEADERS = (b"content-type", b"x-next-cursor", b"etag", b"last-modified")
+
+CACHE_STATUS_HEADER = b"x-cache"
+
+# Invalidations waiting for the invalidation thread (blocking
+# backends); beyond that they run inline
+INVALIDATION_QUEUE_LIMIT = 10000
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class MemoryBackend:
+    """
+    In-process LRU with per-entry TTL.
+
+    Tag versions live in the same process, so with several
+    workers an invalidation only reaches the worker that made
+    the write; the others catch up within the TTL.
+    """
+
+    # Calls only take a lock: fine on the event loop
+    blocking = False
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def versions(self, tags: list[str]) -> list[int]:
+        with self._lock:
+            return [self._versions.get(tag, 0) for tag in tags]
+
+    def bump(self, tags: list[str]):
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class RedisBackend:
+    """
+    Shared cache on a Redis-compatible server.
+
+    Uses only get, set(ex=), mget and incr, so any client with
+    that interface works (redis-py, or a fake in tests).
+    Tag versions are shared by every worker.
+    """
+
+    # Network round trips: the middleware runs them in the threadpool
+    blocking = True
+
+    def __init__(self, client, prefix: str = "octagoniq:cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBackend":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis needs the redis package (pip install redis)"
+            )
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.client.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    def versions(self, tags: list[str]) -> list[int]:
+        values = self.client.mget([self.prefix + "tag:" + tag for tag in tags])
+        return [int(value or 0) for value in values]
+
+    def bump(self, tags: list[str]):
+        for tag in tags:
+            self.client.incr(self.prefix + "tag:" + tag)
+
+    def clear(self):
+        # Entries are namespaced by tag version; bumping is enough
+        # in production, tests use a fresh fake instead
+        pass
+
+
+class ResponseCache:
+    """
+    Read-through cache of serialized GET responses.
+
+    Keys combine the path, the sorted query string and the current
+    version of every tag of the route. Invalidating a tag bumps its
+    version, so stale entries are never read again and age out by
+    TTL / LRU. A response computed while a write commits is stored
+    under the old version, which makes the race harmless.
+    """
+
+    def __init__(self, backend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.blocking = getattr(backend, "blocking", True)
+        self._invalidator = None
+        if self.blocking:
+            self._invalidator = Batcher(
+                "cache-invalidate", self._bump_batch,
+                max_size=500, max_wait=0, max_pending=INVALIDATION_QUEUE_LIMIT,
+            )
+
+    def key(self, path: str, query: bytes, tags: list[str]) -> str:
+        # A write this worker answered is visible to the next read
+        self.drain(timeout=1.0)
+        params = urlencode(sorted(parse_qsl(query.decode("latin-1"), keep_blank_values=True)))
+        versions = ",".join(str(v) for v in self.backend.versions(tags))
+        return f"{path}?{params}|{versions}"
+
+    def get(self, key: str):
+        raw = self.backend.get(key)
+        if raw is None:
+            return None
+        head, _, body = raw.partition(b"\n")
+        headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in json.loads(head)]
+        return headers, body
+
+    def set(self, key: str, headers: list[tuple[bytes, bytes]], body: bytes):
+        head = json.dumps([(k.decode("latin-1"), v.decode("latin-1")) for k, v in headers])
+        self.backend.set(key, head.encode() + b"\n" + body, self.ttl)
+
+    def invalidate(self, tags: list[str]):
+        """
+        Bump the tags' versions.
+
+        Called from commit hooks. On the event loop (async sessions)
+        a blocking backend's bump is queued for the invalidation
+        thread, like the middleware's reads go to the threadpool.
+        The write's response may go out before the bump lands, so
+        key() waits for queued bumps first. Elsewhere it runs inline.
+        """
+
+        if not tags:
+            return
+        if self._invalidator is not None and _on_event_loop():
+            try:
+                self._invalidator.submit(tags)
+                return
+            except (QueueFull, RuntimeError):
+                logger.warning("Cache invalidation queue unavailable, bumping inline")
+        self.backend.bump(tags)
+
+    def _bump_batch(self, batches: list[list[str]]) -> list[None]:
+        # One bump per tag, however many writes queued it
+        self.backend.bump(sorted({tag for tags in batches for tag in tags}))
+        return [None] * len(batches)
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """
+        Wait until queued invalidations are applied.
+        """
+
+        if self._invalidator is None:
+            return True
+        return self._invalidator.drain(timeout)
+
+    def clear(self):
+        self.backend.clear()
+
+
+def build_response_cache() -> ResponseCache | None:
+    if settings.RESPONSE_CACHE_BACKEND == "none":
+        return None
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        backend = RedisBackend.from_url(settings.RESPONSE_CACHE_URL)
+    else:
+        backend = MemoryBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+    return ResponseCache(backend, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+response_cache = build_response_cache()
+
+
+def tags_for_changes(committed: list[changes.Change]) -> set[str]:
+    """
+    Cache tags made stale by committed writes.
+
+    - New fighters/events only change the list endpoints
+    - Updates and deletes also change the row's detail endpoint
+    - Fights change their event's card; a fighter update changes
+      the names shown on cards
+    """
+
+    tags = set()
+
+    for change in committed:
+        if change.table == "fighters":
+            tags.add("fighters")
+            if change.op != "insert":
+                tags.update([f"fighter:{change.id}", "fighter-names"])
+        elif change.table == "events":
+            tags.add("events")
+            if change.op != "insert":
+                tags.add(f"event:{change.id}")
+        elif change.table == "fights":
+            for row in (change.values, change.previous):
+                if row.get("event_id") is not None:
+                    tags.add(f"event:{row['event_id']}")
+
+    return tags
+
+
+@changes.subscribe
+def _invalidate_responses(committed):
+    if response_cache is not None:
+        response_cache.invalidate(sorted(tags_for_changes(committed)))
+
+
+def _header(headers, name: bytes) -> str | None:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware serving CACHED_ROUTES through the response cache.
+
+    Sits in front of routing, so it covers the sync and async stacks.
+    Only 200 responses are stored; X-Cache: HIT / MISS says which path
+    a response took. A hit whose stored ETag matches If-None-Match
+    is answered with 304.
+    """
+
+    def __init__(self, app, cache: ResponseCache):
+        self.app = app
+        self.cache = cache
+
+    async def _call(self, fn, *args):
+        # A blocking backend (Redis) must not stall the event loop,
+        # where async routes and open streams are served
+        if self.cache.blocking:
+            return await run_in_threadpool(fn, *args)
+        return fn(*args)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+
+        path = scope["path"]
+        for pattern, tags_for in CACHED_ROUTES:
+            match = pattern.match(path)
+            if match:
+                break
+        else:
+            return await self.app(scope, receive, send)
+
+        key = await self._call(self.cache.key, path, scope.get("query_string", b""), tags_for(match))
+
+        hit = await self._call(self.cache.get, key)
+        if hit is not None:
+            headers, body = hit
+
+            # Validators were stored with the body
+            if_none_match = _header(scope["headers"], b"if-none-match")
+            etag = _header(headers, b"etag")
+            if if_none_match and etag and etag_matches(if_none_match, etag):
+                await send({
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (k, v) for k, v in headers if k in (b"etag", b"last-modified")
+                    ] + [(CACHE_STATUS_HEADER, b"HIT")],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": headers + [
+                    (b"content-length", str(len(body)).encode()),
+                    (CACHE_STATUS_HEADER, b"HIT"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        status = None
+        stored_headers = []
+        chunks = []
+
+        async def send_and_capture(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                stored_headers[:] = [
+                    (k, v) for k, v in message.get("headers", [])
+                    if k.lower() in CACHED_HEADERS
+                ]
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [(CACHE_STATUS_HEADER, b"MISS")],
+                }
+            elif message["type"] == "http.response.body" and status == 200:
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await self._call(self.cache.set, key, stored_headers, b"".join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, send_and_capture)
@@ -0,0 +1,114 @@
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Tables whose committed writes are published to subscribers
+TRACKED_TABLES = ("fighters", "events", "fights")
+
+PENDING_KEY = "pending_changes"
+
+_subscribers = []
+
+
+@dataclass(frozen=True)
+class Change:
+    """
+    One committed row write.
+
+    values holds the row's column values after the write
+    (before it, for deletes); previous holds the old values
+    of columns changed by an update (None if the old value was
+    never loaded).
+    """
+
+    table: str
+    op: str  # "insert", "update" or "delete"
+    id: int
+    values: dict = field(default_factory=dict)
+    previous: dict = field(default_factory=dict)
+
+
+def subscribe(callback):
+    """
+    Register callback(changes: list[Change]), called after each commit
+    that wrote to a tracked table. Usable as a decorator.
+    """
+    _subscribers.append(callback)
+    return callback
+
+
+def publish(changes: list[Change]):
+    """
+    Deliver committed changes to every subscriber.
+
+    Called automatically for ORM writes; code that writes with Core
+    statements (bulk inserts, upserts) calls it after committing.
+    A failing subscriber is logged and does not affect the others.
+    """
+
+    if not changes:
+        return
+
+    for callback in list(_subscribers):
+        try:
+            callback(changes)
+        except Exception:
+            logger.exception("Change subscriber %r failed", callback)
+
+
+def _snapshot(instance, op: str) -> Change:
+    state = inspect(instance)
+    mapper = state.mapper
+
+    values = {column.key: state.dict.get(column.key) for column in mapper.column_attrs}
+
+    previous = {}
+    if op == "update":
+        for column in mapper.column_attrs:
+            history = state.attrs[column.key].history
+            if history.deleted:
+                previous[column.key] = history.deleted[0]
+            elif history.added:
+                # Set without being loaded first: old value unknown
+                previous[column.key] = None
+
+    return Change(
+        table=mapper.persist_selectable.name,
+        op=op,
+        id=state.identity[0] if state.identity else values.get("id"),
+        values=values,
+        previous=previous,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session, flush_context):
+    # new / dirty / deleted still hold the pre-flush state here
+    pending = session.info.setdefault(PENDING_KEY, [])
+
+    for op, instances in (
+        ("insert", session.new),
+        ("update", session.dirty),
+        ("delete", session.deleted),
+    ):
+        for instance in instances:
+            table = inspect(instance).mapper.persist_selectable.name
+            if table not in TRACKED_TABLES:
+                continue
+            if op == "update" and not session.is_modified(instance, include_collections=False):
+                continue
+            pending.append(_snapshot(instance, op))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_changes(session):
+    publish(session.info.pop(PENDING_KEY, []))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_changes(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,93 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag from the values a representation depends on
+    (e.g. "fighter", id, updated_at).
+    """
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12)
+    return f'"{digest.hexdigest()}"'
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite returns naive datetimes; every timestamp is stored in UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def http_date(value: datetime) -> str:
+    return format_datetime(as_utc(value), usegmt=True)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison, as If-None-Match requires.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    """
+    Evaluate If-None-Match, then If-Modified-Since (RFC 9110 order).
+    """
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have whole seconds
+        return as_utc(last_modified).replace(microsecond=0) <= since
+
+    return False
+
+
+def conditional(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None,
+) -> Response | None:
+    """
+    Attach ETag / Last-Modified to the response.
+
+    Returns a bare 304 response if the client's copy is current,
+    so the route can return before loading or serializing anything.
+    """
+
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
+
+def collection_etag(name: str, version) -> tuple[str, datetime | None]:
+    """
+    (ETag, Last-Modified) for a list endpoint from its
+    (max updated_at, row count) version. The count catches deletes.
+    """
+
+    last_modified, count = version
+    return make_etag(name, last_modified, count), last_modified
+
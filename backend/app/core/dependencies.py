@@ -1,21 +1,30 @@
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
-from app.database import SessionLocal
-from app.models.user import User
+from app.database import get_db
 from app.core.security import decode_access_token
+from app.core.user_status import user_status_cache
 
 # This tells FastAPI where login happens
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated caller, built from verified JWT claims.
+
+    Stands in for the User row so authenticated requests
+    don't need a users lookup.
+    """
+
+    id: int
+    username: str
+    role: str
+    token_version: int
 
 
 def get_current_user(
@@ -23,29 +32,60 @@ def get_current_user(
     db: Session = Depends(get_db)
 ):
     """
-    Extract current user from JWT.
+    Build the current principal from the JWT.
+
+    Only the user's status (active flag, token version) is checked
+    against the database, through a short-TTL cache. The session is
+    not touched on a cache hit.
     """
 
     payload = decode_access_token(token)
 
-    username: str = payload.get("sub")
-    if username is None:
+    username = payload.get("sub")
+    user_id = payload.get("uid")
+    role = payload.get("role")
+    token_version = payload.get("ver")
+
+    if (
+        not isinstance(username, str)
+        or not isinstance(user_id, int)
+        or not isinstance(role, str)
+        or not isinstance(token_version, int)
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload"
         )
 
-    user = db.query(User).filter(User.username == username).first()
+    user_status = user_status_cache.get(db, user_id)
 
-    if user is None:
+    if user_status is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found"
         )
 
-    return user
+    if not user_status.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User is inactive"
+        )
+
+    # Role changes and deactivation bump the version
+    if user_status.token_version != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked"
+        )
+
+    return Principal(
+        id=user_id,
+        username=username,
+        role=role,
+        token_version=token_version,
+    )
 
-def require_admin(current_user: User = Depends(get_current_user)):
+def require_admin(current_user: Principal = Depends(get_current_user)):
     """
     Ensure the current user has admin role.
     401 = not authenticated
@@ -58,4 +98,4 @@ def require_admin(current_user: User = Depends(get_current_user)):
             detail="Admin privileges required"
         )
 
-    return current_user
\ No newline at end of file
+    return current_user
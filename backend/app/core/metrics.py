@@ -0,0 +1,433 @@
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from starlette.routing import compile_path
+
+from app.core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+# Route label for requests no route matched (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    One metric family: values keyed by label values.
+    """
+
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def set(self, *labels, value: float):
+        # Mirrors a total kept elsewhere (e.g. pool checkouts)
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, *labels) -> float:
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in items
+        ]
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, *labels, value: float):
+        # Per label set: [count per bucket (+Inf last), sum]
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][bisect_left(self.buckets, value)] += 1
+            entry[1] += value
+
+    def count(self, *labels) -> int:
+        with self._lock:
+            entry = self._values.get(labels)
+            return sum(entry[0]) if entry else 0
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._values.items())
+
+        lines = self.header()
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        for metric in self.metrics:
+            metric.clear()
+
+
+registry = Registry()
+
+http_requests = registry.register(Counter(
+    "http_requests_total", "HTTP requests by route and status.",
+    ("method", "route", "status"),
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.",
+    ("method", "route"), LATENCY_BUCKETS,
+))
+http_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "HTTP requests being served.",
+))
+db_queries = registry.register(Counter(
+    "db_queries_total", "SQL statements executed, by route (\"\" outside requests).",
+    ("route",),
+))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds", "SQL statement execution time.",
+    (), QUERY_BUCKETS,
+))
+db_queries_per_request = registry.register(Histogram(
+    "db_queries_per_request", "SQL statements per HTTP request.",
+    ("method", "route"), QUERY_COUNT_BUCKETS,
+))
+db_slow_queries = registry.register(Counter(
+    "db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS.",
+    ("route",),
+))
+db_n_plus_one = registry.register(Counter(
+    "db_n_plus_one_total", "Requests that repeated one statement more than N_PLUS_ONE_THRESHOLD times.",
+    ("method", "route"),
+))
+
+db_pool_connections = registry.register(Gauge(
+    "db_pool_connections", "Pool connections by state (checked_out, checked_in, overflow).",
+    ("engine", "state"),
+))
+db_pool_checkouts = registry.register(Counter(
+    "db_pool_checkouts_total", "Connections handed out by the pool.", ("engine",),
+))
+db_pool_timeouts = registry.register(Counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after pool_timeout.", ("engine",),
+))
+db_pool_wait = registry.register(Counter(
+    "db_pool_wait_seconds_total", "Time spent waiting for a pool connection.", ("engine",),
+))
+
+batch_queue_depth = registry.register(Gauge(
+    "batch_queue_depth", "Items waiting for the next batch flush.", ("batcher",),
+))
+batch_flushes = registry.register(Counter(
+    "batch_flushes_total", "Batch flush attempts by outcome (ok, error).", ("batcher", "outcome"),
+))
+batch_flush_size = registry.register(Histogram(
+    "batch_flush_size", "Items per batch flush.", ("batcher",), BATCH_SIZE_BUCKETS,
+))
+batch_flush_duration = registry.register(Histogram(
+    "batch_flush_duration_seconds", "Time to write one batch.", ("batcher",), LATENCY_BUCKETS,
+))
+
+stream_connections = registry.register(Gauge(
+    "stream_connections", "Open server-sent event streams.",
+))
+stream_messages = registry.register(Counter(
+    "stream_messages_total", "Stream messages delivered to this worker.",
+))
+stream_dropped = registry.register(Counter(
+    "stream_dropped_total", "Streams closed for falling STREAM_QUEUE_SIZE messages behind.",
+))
+
+
+def collect_pool(name: str, status: dict):
+    """
+    Copy an app.core.pool.pool_status() snapshot into the pool metrics.
+    """
+
+    for state in ("checked_out", "checked_in", "overflow"):
+        if state in status:
+            db_pool_connections.set(name, state, value=status[state])
+    if "checkouts" in status:
+        db_pool_checkouts.set(name, value=status["checkouts"])
+        db_pool_timeouts.set(name, value=status["timeouts"])
+        db_pool_wait.set(name, value=status["wait_seconds_total"])
+
+
+# -------------------------
+# Per-request SQL tracking
+# -------------------------
+
+@dataclass
+class RequestStats:
+    """
+    SQL issued while serving one request.
+    """
+
+    method: str
+    path: str
+    queries: int = 0
+    seconds: float = 0.0
+    slow: int = 0
+    statements: StatementCounter = field(default_factory=StatementCounter)
+
+
+# Set by the middleware; sync handlers see it through the
+# context copied into the threadpool
+current_request: ContextVar[RequestStats | None] = ContextVar("current_request", default=None)
+
+_PARAMETER = re.compile(r"%\(\w+\)s|\$\d+|:\w+|\?")
+_PARAMETER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+_NUMBER = re.compile(r"\b\d+\b")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Statement shape used to spot repeats: parameters and
+    numbers become ?, expanded IN lists collapse to one ?.
+    """
+    shape = _NUMBER.sub("?", _PARAMETER.sub("?", statement))
+    return " ".join(_PARAMETER_LIST.sub("?", shape).split())
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    slow = elapsed * 1000 >= settings.SLOW_QUERY_MS
+    db_query_duration.observe(value=elapsed)
+
+    # Per-route counters are added when the request ends
+    # (the route is only known once routing has run)
+    stats = current_request.get()
+    if stats is None:
+        db_queries.inc("")
+        if slow:
+            db_slow_queries.inc("")
+    else:
+        stats.queries += 1
+        stats.seconds += elapsed
+        stats.slow += slow
+        stats.statements[fingerprint(statement)] += 1
+
+    if slow:
+        where = f"{stats.method} {stats.path}" if stats is not None else "-"
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed * 1000, where, " ".join(statement.split())[:500],
+        )
+
+
+def _handle_error(exception_context):
+    # The statement failed: drop its start time
+    connection = exception_context.connection
+    starts = connection.info.get("query_start") if connection is not None else None
+    if starts:
+        starts.pop()
+
+
+_instrumented = set()
+
+
+def instrument_engine(engine):
+    """
+    Time and count every statement run on a (sync) engine.
+    For an AsyncEngine pass engine.sync_engine. Idempotent.
+    """
+
+    if id(engine) in _instrumented:
+        return
+    _instrumented.add(id(engine))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def report_n_plus_one(stats: RequestStats, route: str):
+    """
+    Warn about statements repeated more than N_PLUS_ONE_THRESHOLD
+    times in one request, the usual sign of a lazy load in a loop.
+    """
+
+    repeated = [
+        (count, statement) for statement, count in stats.statements.items()
+        if count > settings.N_PLUS_ONE_THRESHOLD
+    ]
+    if not repeated:
+        return
+
+    db_n_plus_one.inc(stats.method, route)
+    for count, statement in sorted(repeated, reverse=True):
+        logger.warning(
+            "Possible N+1 on %s %s: %d similar statements: %s",
+            stats.method, route, count, statement[:500],
+        )
+
+
+# -------------------------
+# ASGI middleware
+# -------------------------
+
+class MetricsMiddleware:
+    """
+    Records latency, status and SQL usage of every HTTP request.
+
+    Added last so it wraps everything else, response cache
+    hits included. Requests are labelled with the route's path
+    template, and a Server-Timing header reports the database
+    time and statement count up to the first response byte.
+    """
+
+    def __init__(self, app, root_app=None):
+        self.app = app
+        # The FastAPI app, for requests answered before routing
+        self.root_app = root_app
+        self._templates = None
+
+    def route_template(self, scope, status: int) -> str:
+        """
+        Path template of the route that served a request.
+
+        Routing stores the route in the scope. Requests answered
+        before routing (response cache hits) are matched against
+        the OpenAPI path templates.
+        """
+
+        route = scope.get("route")
+        if route is not None and getattr(route, "path", None):
+            return route.path
+
+        if self.root_app is None or status == 404:
+            return UNMATCHED_ROUTE
+        if self._templates is None:
+            self._templates = [
+                (compile_path(path)[0], path) for path in self.root_app.openapi().get("paths", {})
+            ]
+        for regex, path in self._templates:
+            if regex.match(scope["path"]):
+                return path
+        return UNMATCHED_ROUTE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats(method=scope["method"], path=scope["path"])
+        token = current_request.set(stats)
+        status = 500
+        start = time.perf_counter()
+        http_in_flight.inc(amount=1)
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                timing = f'db;dur={stats.seconds * 1000:.1f};desc="{stats.queries} queries"'
+                message = {
+                    **message,
+                    "headers": list(message.get("headers", [])) + [(b"server-timing", timing.encode())],
+                }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            http_in_flight.inc(amount=-1)
+
+            route = self.route_template(scope, status)
+            method = stats.method
+            http_requests.inc(method, route, str(status))
+            http_request_duration.observe(method, route, value=time.perf_counter() - start)
+            db_queries_per_request.observe(method, route, value=stats.queries)
+            if stats.queries:
+                db_queries.inc(route, amount=stats.queries)
+            if stats.slow:
+                db_slow_queries.inc(route, amount=stats.slow)
+            report_n_plus_one(stats, route)
@@ -0,0 +1,59 @@
+import re
+import unicodedata
+
+# Letters NFKD doesn't decompose into a base letter + accent
+_FOLD = str.maketrans({"ł": "l", "ø": "o", "đ": "d", "ı": "i", "æ": "ae", "œ": "oe"})
+
+_ASCII_WORD = re.compile(r"[a-z0-9]+")
+
+# Latin letters with accents or ligatures (Latin-1 Supplement,
+# Extended-A and -B): the ones folded in SQL as well
+_LATIN = range(0xC0, 0x250)
+
+
+def normalize(text: str | None) -> list[str]:
+    """
+    Lowercased, accent-free words of a name.
+
+    "Jan Błachowicz" -> ["jan", "blachowicz"]; anything that
+    isn't a letter or digit separates words.
+    """
+
+    if not text:
+        return []
+    if text.isascii():
+        return _ASCII_WORD.findall(text.lower())
+    decomposed = unicodedata.normalize("NFKD", text.casefold().translate(_FOLD))
+    folded = "".join(
+        char if char.isalnum() else " "
+        for char in decomposed
+        if not unicodedata.combining(char)
+    )
+    return folded.split()
+
+
+def sql_folds() -> tuple[str, str, list[tuple[str, str]]]:
+    """
+    normalize() of every accented Latin letter, for SQL:
+    (from, to) for translate() of the letters that fold to one
+    ASCII letter, and (letter, letters) replace() pairs for
+    ligatures ("æ" -> "ae", "ß" -> "ss").
+
+    Upper and lower case are both listed, so the result doesn't
+    depend on the database's lower() handling non-ASCII.
+    """
+
+    single_from, single_to, multi = [], [], []
+    for code in _LATIN:
+        char = chr(code)
+        if not char.isalpha():
+            continue
+        folded = "".join(normalize(char))
+        if not folded.isascii() or not folded or folded == char:
+            continue
+        if len(folded) == 1:
+            single_from.append(char)
+            single_to.append(folded)
+        else:
+            multi.append((char, folded))
+    return "".join(single_from), "".join(single_to), multi
@@ -0,0 +1,67 @@
+import base64
+import json
+
+from fastapi import HTTPException, status
+
+# Response header carrying the cursor for the next page.
+# Keeps list endpoints returning plain JSON arrays.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values) -> str:
+    """
+    Encode keyset values (e.g. last_name, id) into an opaque cursor.
+
+    Values must be JSON serializable (dates are passed as ISO strings).
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Decode an opaque cursor back into its keyset values.
+
+    Raises 400 if the cursor is malformed or has the wrong shape.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    return values
+
+
+def cursor_id(value) -> int:
+    """
+    The id of a decoded keyset, as an int.
+
+    Raises 400 for anything but a JSON integer: int() would accept
+    "7" and 1.5, and JSON true is a Python bool, so an int.
+    """
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    return value
+
+
+def split_page(rows: list, limit: int, key) -> tuple[list, tuple | None]:
+    """
+    Split a LIMIT + 1 result into (page, next_key).
+
+    The extra row only signals that another page exists;
+    next_key is key(last row of the page), or None on the last page.
+    """
+    page = rows[:limit]
+    next_key = key(page[-1]) if len(rows) > limit else None
+    return page, next_key
@@ -0,0 +1,97 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.core import security
+from app.core.settings import settings
+
+
+class PasswordHashPool:
+    """
+    Runs bcrypt in a bounded process pool.
+
+    - Hashing takes 100-300 ms of CPU; doing it in worker processes
+      keeps the API process free to serve other requests
+    - At most workers + queue_depth jobs are in flight; beyond that
+      callers get 429 instead of queueing without bound
+    - workers=0 hashes inline in the calling thread (no backpressure)
+    - The async methods wait on the event loop, so a queued hash
+      doesn't hold a threadpool thread that other sync routes need
+    """
+
+    def __init__(self, workers: int, queue_depth: int):
+        self.workers = workers
+        self.capacity = workers + queue_depth
+        self._slots = threading.BoundedSemaphore(self.capacity) if workers > 0 else None
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: forking a process that already runs threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many concurrent password operations, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _run(self, fn, *args):
+        if self._slots is None:
+            return fn(*args)
+
+        # Blocks this request's thread only; the GIL is released while waiting
+        return self._submit(fn, *args).result()
+
+    async def _run_async(self, fn, *args):
+        if self._slots is None:
+            # Inline bcrypt would stall the event loop
+            return await run_in_threadpool(fn, *args)
+
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def hash(self, password: str) -> str:
+        return self._run(security.hash_password, password)
+
+    def verify_and_update(self, plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        return self._run(security.verify_and_update_password, plain_password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        return await self._run_async(security.hash_password, password)
+
+    async def verify_and_update_async(self, plain_password: str,
+                                      hashed_password: str) -> tuple[bool, str | None]:
+        return await self._run_async(security.verify_and_update_password, plain_password, hashed_password)
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_depth=settings.PASSWORD_HASH_QUEUE_DEPTH,
+)
@@ -0,0 +1,167 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import QueuePool
+
+from app.core.settings import settings
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Probes run here so a hung checkout or query can be abandoned after
+# READY_DB_TIMEOUT_SECONDS. One worker: while a probe is still stuck,
+# later probes fail at once instead of piling up threads.
+_probe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ready-probe")
+_probe_lock = threading.Lock()
+_probe_running = False
+
+_script_heads = None
+
+
+def script_heads() -> set[str]:
+    """
+    Head revisions of the migration scripts (read once).
+    """
+    global _script_heads
+
+    if _script_heads is None:
+        from alembic.config import Config
+        from alembic.script import ScriptDirectory
+
+        _script_heads = set(ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_heads())
+
+    return _script_heads
+
+
+def pool_check(engine) -> dict:
+    """
+    Fraction of the pool's connections (size + max_overflow) in use.
+    """
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"status": "skipped", "pool": type(pool).__name__}
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    in_use = pool.checkedout()
+    saturation = in_use / capacity if capacity else 0.0
+
+    return {
+        "status": "ok" if saturation < settings.READY_POOL_SATURATION else "fail",
+        "checked_out": in_use,
+        "capacity": capacity,
+        "saturation": round(saturation, 3),
+    }
+
+
+def _probe(engine) -> dict:
+    """
+    Check out a connection, run SELECT 1 and read the applied
+    migration revision; returns timings in ms.
+    """
+
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        checked_out = time.perf_counter()
+
+        if connection.dialect.name == "postgresql":
+            timeout_ms = int(settings.READY_DB_TIMEOUT_SECONDS * 1000)
+            connection.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+        connection.execute(text("SELECT 1"))
+        queried = time.perf_counter()
+
+        revisions = None
+        if settings.READY_CHECK_MIGRATIONS:
+            try:
+                with connection.begin_nested():
+                    revisions = {
+                        row[0] for row in connection.execute(text("SELECT version_num FROM alembic_version"))
+                    }
+            except SQLAlchemyError:
+                revisions = None
+
+        connection.rollback()
+
+    return {
+        "checkout_ms": round((checked_out - start) * 1000, 2),
+        "query_ms": round((queried - checked_out) * 1000, 2),
+        "revisions": revisions,
+    }
+
+
+def _run_probe(engine) -> dict:
+    global _probe_running
+
+    with _probe_lock:
+        if _probe_running:
+            return {"error": "previous probe still running"}
+        _probe_running = True
+
+    def probe():
+        global _probe_running
+        try:
+            return _probe(engine)
+        finally:
+            with _probe_lock:
+                _probe_running = False
+
+    future = _probe_executor.submit(probe)
+    try:
+        return future.result(timeout=settings.READY_DB_TIMEOUT_SECONDS)
+    except FutureTimeout:
+        return {"error": f"timed out after {settings.READY_DB_TIMEOUT_SECONDS}s"}
+    except Exception as exc:
+        return {"error": (str(getattr(exc, "orig", None) or exc).splitlines() or [type(exc).__name__])[0]}
+
+
+def migrations_check(revisions: set[str] | None) -> dict:
+    if not settings.READY_CHECK_MIGRATIONS:
+        return {"status": "skipped"}
+
+    heads = script_heads()
+    if revisions is None:
+        return {"status": "fail", "error": "alembic_version table missing", "expected": sorted(heads)}
+
+    return {
+        "status": "ok" if revisions == heads else "fail",
+        "current": sorted(revisions),
+        "expected": sorted(heads),
+    }
+
+
+def readiness(engine, async_engine=None) -> tuple[bool, dict]:
+    """
+    Whether this worker should receive traffic, with per-check details.
+
+    Steps:
+    - Pool saturation of the sync (and async, if started) engine,
+      read before the probe takes a connection itself
+    - Database probe on a pooled connection, abandoned after
+      READY_DB_TIMEOUT_SECONDS; fails above READY_DB_LATENCY_MS
+      (checkout wait included, so an exhausted pool fails it)
+    - Applied migration revision against the script heads
+    """
+
+    checks = {"pool": pool_check(engine)}
+    if async_engine is not None:
+        checks["async_pool"] = pool_check(async_engine.sync_engine)
+
+    probe = _run_probe(engine)
+    if "error" in probe:
+        checks["database"] = {"status": "fail", "error": probe["error"]}
+        checks["migrations"] = {"status": "skipped"}
+    else:
+        latency = probe["checkout_ms"] + probe["query_ms"]
+        checks["database"] = {
+            "status": "ok" if latency <= settings.READY_DB_LATENCY_MS else "fail",
+            "checkout_ms": probe["checkout_ms"],
+            "query_ms": probe["query_ms"],
+        }
+        checks["migrations"] = migrations_check(probe["revisions"])
+
+    ready = all(check["status"] != "fail" for check in checks.values())
+    return ready, checks
@@ -0,0 +1,350 @@
+import bisect
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core import changes
+from app.core.names import normalize
+from app.models.fighter import Fighter
+
+# Minimum trigram similarity between a query word and a name word
+WORD_THRESHOLD = 0.3
+
+# Minimum fighter score (mean best word similarity over query words)
+SCORE_THRESHOLD = 0.3
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+# Upper bound for prefix ranges: sorts after every word starting with the prefix
+_PREFIX_END = "\U0010ffff"
+
+
+def trigrams(word: str) -> set[str]:
+    """
+    Trigrams of one word, padded like pg_trgm ("  w", " wo", ..., "d ").
+    """
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def trigram_codes(word: str) -> set[int]:
+    """
+    trigrams(word) packed into ints, 21 bits per code point.
+    """
+    return {(ord(a) << 42) | (ord(b) << 21) | ord(c) for a, b, c in trigrams(word)}
+
+
+def _trigram_table(words: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Distinct (word index, trigram code) pairs of every word,
+    as trigram_codes() would give, computed on a code point matrix.
+    """
+
+    if not words:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    padded = np.array([f"  {word} " for word in words])
+    points = padded.view(np.uint32).reshape(len(words), -1).astype(np.int64)
+    grams = (points[:, :-2] << 42) | (points[:, 1:-1] << 21) | points[:, 2:]
+
+    lengths = np.array([len(word) + 3 for word in words])
+    valid = np.arange(grams.shape[1]) < (lengths - 2)[:, None]
+    word_ids = np.broadcast_to(np.arange(len(words))[:, None], grams.shape)[valid]
+    codes = grams[valid]
+
+    order = np.lexsort((codes, word_ids))
+    word_ids, codes = word_ids[order], codes[order]
+    distinct = np.r_[True, (word_ids[1:] != word_ids[:-1]) | (codes[1:] != codes[:-1])]
+    return word_ids[distinct], codes[distinct]
+
+
+def _name_words(first_name, last_name, nickname) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(
+        normalize(first_name) + normalize(last_name) + normalize(nickname)
+    ))
+
+
+class FighterSearchIndex:
+    """
+    In-process name index for fighter search.
+
+    Used when the database has no pg_trgm. Two structures over
+    the distinct name words (first, last, nickname):
+    - trigram -> word id arrays, for typo tolerant search ranked
+      by trigram similarity, as pg_trgm does; shared trigrams
+      are counted with one numpy bincount per query word
+    - a sorted word list, for prefix autocomplete by bisection
+
+    Built on first use with one query. Committed fighter writes
+    mark fighters dirty and only their entries are reloaded on
+    the next read. Writes that bypass the ORM (bulk import)
+    call reset().
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built = False
+        self._dirty = set()
+
+    def reset(self):
+        with self._lock:
+            self._built = False
+            self._dirty.clear()
+
+    def mark_dirty(self, fighter_ids):
+        with self._lock:
+            self._dirty.update(fighter_ids)
+
+    # -------------------------
+    # Maintenance
+    # -------------------------
+
+    def _clear(self):
+        self._fighters = {}                     # id -> (first, last, nickname, words)
+        self._word_fighters = defaultdict(set)  # word -> fighter ids
+        self._word_ids = {}                     # word -> word id
+        self._id_words = []                     # word id -> word
+        self._word_sizes = np.zeros(0)          # word id -> number of trigrams
+        self._postings = {}                     # trigram code -> word id array
+        self._trigram_words = {}                # trigram code -> word id set, once edited
+        self._words = []                        # sorted distinct words
+
+    def _gram_words(self, code: int) -> set[int]:
+        # Editable posting: materialized from the array on first edit
+        words = self._trigram_words.get(code)
+        if words is None:
+            words = self._trigram_words[code] = set(self._postings.get(code, _EMPTY).tolist())
+        self._postings.pop(code, None)
+        return words
+
+    def _posting(self, code: int) -> np.ndarray:
+        posting = self._postings.get(code)
+        if posting is None:
+            posting = self._postings[code] = np.fromiter(
+                self._trigram_words.get(code, ()), dtype=np.int64
+            )
+        return posting
+
+    def _add(self, fighter_id, first_name, last_name, nickname):
+        words = _name_words(first_name, last_name, nickname)
+        self._fighters[fighter_id] = (first_name, last_name, nickname, words)
+
+        for word in words:
+            fighters = self._word_fighters[word]
+            if not fighters:
+                word_id = self._word_ids.get(word)
+                if word_id is None:
+                    word_id = self._word_ids[word] = len(self._id_words)
+                    self._id_words.append(word)
+                    self._word_sizes = np.resize(self._word_sizes, len(self._id_words))
+                codes = trigram_codes(word)
+                self._word_sizes[word_id] = len(codes)
+                for code in codes:
+                    self._gram_words(code).add(word_id)
+                bisect.insort(self._words, word)
+            fighters.add(fighter_id)
+
+    def _remove(self, fighter_id):
+        entry = self._fighters.pop(fighter_id, None)
+        if entry is None:
+            return
+
+        for word in entry[3]:
+            fighters = self._word_fighters[word]
+            fighters.discard(fighter_id)
+            if fighters:
+                continue
+            del self._word_fighters[word]
+            word_id = self._word_ids[word]
+            for code in trigram_codes(word):
+                self._gram_words(code).discard(word_id)
+            del self._words[bisect.bisect_left(self._words, word)]
+
+    def _build(self, rows):
+        """
+        Full build. Words are collected per fighter; the trigram
+        postings of all words are built with numpy in one pass.
+        """
+
+        self._clear()
+        fighters = self._fighters
+        word_fighters = self._word_fighters
+
+        for fighter_id, first_name, last_name, nickname in rows:
+            words = _name_words(first_name, last_name, nickname)
+            fighters[fighter_id] = (first_name, last_name, nickname, words)
+            for word in words:
+                word_fighters[word].add(fighter_id)
+
+        self._words = sorted(word_fighters)
+        self._id_words = list(self._words)
+        self._word_ids = {word: word_id for word_id, word in enumerate(self._id_words)}
+
+        word_ids, codes = _trigram_table(self._id_words)
+        self._word_sizes = np.bincount(word_ids, minlength=len(self._id_words)).astype(np.float64)
+
+        # Group word ids by trigram
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        word_ids = word_ids[order]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        self._postings = dict(zip(codes[starts].tolist(), np.split(word_ids, starts[1:])))
+
+        self._built = True
+
+    def _refresh(self, db: Session, fighter_ids: list[int] | None):
+        """
+        Reload entries for fighter_ids (everything if None).
+        """
+
+        stmt = select(Fighter.id, Fighter.first_name, Fighter.last_name, Fighter.nickname)
+
+        if fighter_ids is None:
+            self._build(db.execute(stmt))
+        else:
+            for fighter_id in fighter_ids:
+                self._remove(fighter_id)
+            for row in db.execute(stmt.where(Fighter.id.in_(fighter_ids))):
+                self._add(*row)
+
+    def _ensure_current(self, db: Session):
+        if not self._built:
+            self._refresh(db, None)
+            self._dirty.clear()
+        elif self._dirty:
+            self._refresh(db, sorted(self._dirty))
+            self._dirty.clear()
+
+    def _result(self, fighter_id, score):
+        first_name, last_name, nickname, _ = self._fighters[fighter_id]
+        return {
+            "id": fighter_id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "nickname": nickname,
+            "score": score,
+        }
+
+    # -------------------------
+    # Queries
+    # -------------------------
+
+    def search(self, db: Session, query: str, limit: int) -> list[dict]:
+        """
+        Fighters whose name words are similar to the query words.
+
+        Each query word is scored against every name word sharing
+        a trigram (similarity = shared / union of trigram sets);
+        a fighter's score is the mean of its best similarity per
+        query word. Highest score first, ties by name.
+        """
+
+        tokens = list(dict.fromkeys(normalize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            self._ensure_current(db)
+
+            scores = defaultdict(float)
+            for token in tokens:
+                grams = trigram_codes(token)
+
+                # Shared trigram count of every word, in one bincount
+                shared = np.bincount(
+                    np.concatenate([self._posting(code) for code in grams]),
+                    minlength=len(self._id_words),
+                )
+                candidates = np.flatnonzero(shared)
+                counts = shared[candidates]
+                similarity = counts / (len(grams) + self._word_sizes[candidates] - counts)
+                keep = similarity >= WORD_THRESHOLD
+
+                best = {}
+                for word_id, word_similarity in zip(
+                    candidates[keep].tolist(), similarity[keep].tolist()
+                ):
+                    for fighter_id in self._word_fighters.get(self._id_words[word_id], ()):
+                        if word_similarity > best.get(fighter_id, 0.0):
+                            best[fighter_id] = word_similarity
+
+                for fighter_id, word_similarity in best.items():
+                    scores[fighter_id] += word_similarity / len(tokens)
+
+            ranked = sorted(
+                (fighter_id for fighter_id, score in scores.items() if score >= SCORE_THRESHOLD),
+                key=lambda fighter_id: (
+                    -scores[fighter_id],
+                    self._fighters[fighter_id][1],
+                    self._fighters[fighter_id][0],
+                    fighter_id,
+                ),
+            )
+
+            return [
+                self._result(fighter_id, round(scores[fighter_id], 4))
+                for fighter_id in ranked[:limit]
+            ]
+
+    def autocomplete(self, db: Session, query: str, limit: int) -> list[dict]:
+        """
+        Fighters with a name word starting with every query word.
+
+        Walks the sorted words of the narrowest prefix range and
+        stops after `limit` matches, so the cost doesn't grow with
+        the table. Results come in matched-word order.
+        """
+
+        tokens = list(dict.fromkeys(normalize(query)))
+        if not tokens:
+            return []
+
+        with self._lock:
+            self._ensure_current(db)
+
+            ranges = []
+            for token in tokens:
+                start = bisect.bisect_left(self._words, token)
+                end = bisect.bisect_left(self._words, token + _PREFIX_END, lo=start)
+                ranges.append((end - start, start, end, token))
+            _, start, end, anchor = min(ranges)
+            others = [token for token in tokens if token != anchor]
+
+            matched = []
+            seen = set()
+            for word in self._words[start:end]:
+                fighter_ids = sorted(
+                    self._word_fighters[word] - seen,
+                    key=lambda fighter_id: self._fighters[fighter_id][1:2] + (fighter_id,),
+                )
+                for fighter_id in fighter_ids:
+                    seen.add(fighter_id)
+                    words = self._fighters[fighter_id][3]
+                    if all(any(w.startswith(token) for w in words) for token in others):
+                        matched.append(fighter_id)
+                        if len(matched) == limit:
+                            break
+                if len(matched) == limit:
+                    break
+
+            return [self._result(fighter_id, None) for fighter_id in matched]
+
+
+fighter_search_index = FighterSearchIndex()
+
+
+@changes.subscribe
+def _mark_renamed_fighters(committed):
+    fighter_ids = {
+        change.id for change in committed
+        if change.table == "fighters" and (
+            change.op != "update"
+            or {"first_name", "last_name", "nickname"} & change.previous.keys()
+        )
+    }
+    if fighter_ids:
+        fighter_search_index.mark_dirty(fighter_ids)
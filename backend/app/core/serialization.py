@@ -0,0 +1,40 @@
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def response_columns(model, schema: type[BaseModel]) -> list:
+    """
+    Model columns named like the schema's fields, in field order.
+
+    Selecting exactly these lets a list endpoint skip loading
+    ORM objects and validating them through the schema.
+    """
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+def rows_response(rows, response: Response | None = None) -> Response:
+    """
+    Encode SQLAlchemy Row objects as a JSON array of objects.
+
+    Rows come from response_columns(), so their keys and types
+    already match the route's response_model: no per-row Pydantic
+    validation, and orjson encodes dates natively.
+    Headers set on the route's injected response (ETag,
+    X-Next-Cursor, ...) are carried over.
+    """
+
+    if rows:
+        keys = rows[0]._fields
+        body = orjson.dumps([dict(zip(keys, row)) for row in rows])
+    else:
+        body = b"[]"
+
+    headers = {}
+    if response is not None:
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key not in ("content-length", "content-type")
+        }
+
+    return Response(content=body, media_type="application/json", headers=headers)
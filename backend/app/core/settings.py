@@ -13,6 +13,91 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     ALGORITHM: str = "HS256"
 
+    # How long a user's active flag / token version is trusted
+    # before re-checking the database (revocation delay across workers)
+    AUTH_STATUS_CACHE_TTL_SECONDS: float = 30.0
+
+    # bcrypt runs in a dedicated process pool so login bursts don't
+    # starve other requests. 0 workers hashes inline in the request thread.
+    # Requests beyond workers + queue depth are rejected with 429.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_DEPTH: int = 32
+
+    # Serve the core CRUD routes through the async engine instead of
+    # the sync threadpool path. ASYNC_DATABASE_URL defaults to
+    # DATABASE_URL with an async driver (asyncpg / aiosqlite).
+    ASYNC_DB: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Connection pool (per process, applies to the sync and async engines).
+    # Size it so workers * (POOL_SIZE + MAX_OVERFLOW) stays under
+    # Postgres max_connections.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0      # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800        # seconds; -1 disables recycling
+    DB_POOL_PRE_PING: bool = True      # detect connections dropped by failovers
+    DB_STATEMENT_TIMEOUT_MS: int = 0   # Postgres statement_timeout; 0 disables
+
+    # Response cache for the public GET routes ("memory", "redis" or "none").
+    # The memory backend is per process: other workers see a write
+    # within the TTL. "redis" shares invalidations (pip install redis).
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_URL: str | None = None
+    RESPONSE_CACHE_TTL_SECONDS: float = 30.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 10000
+
+    # Request / SQL instrumentation (GET /metrics). Statements at or
+    # above SLOW_QUERY_MS are logged; a request repeating one statement
+    # shape more than N_PLUS_ONE_THRESHOLD times is logged as a likely N+1.
+    SLOW_QUERY_MS: float = 200.0
+    N_PLUS_ONE_THRESHOLD: int = 10
+
+    # GET /ready (load balancer readiness). Not ready when the DB probe
+    # (pool checkout + SELECT 1) takes longer than READY_DB_LATENCY_MS or
+    # doesn't finish within READY_DB_TIMEOUT_SECONDS, when the pool is at
+    # READY_POOL_SATURATION or more, or when the applied migration isn't
+    # the Alembic head (READY_CHECK_MIGRATIONS).
+    READY_DB_TIMEOUT_SECONDS: float = 2.0
+    READY_DB_LATENCY_MS: float = 500.0
+    READY_POOL_SATURATION: float = 0.9
+    READY_CHECK_MIGRATIONS: bool = True
+
+    # POST /events/{id}/results: updates are acknowledged once queued and
+    # written in batches of up to RESULT_BATCH_SIZE, at most
+    # RESULT_BATCH_WAIT_MS after the oldest queued one. Beyond
+    # RESULT_QUEUE_LIMIT queued updates the route answers 429.
+    RESULT_BATCH_SIZE: int = 100
+    RESULT_BATCH_WAIT_MS: float = 50.0
+    RESULT_QUEUE_LIMIT: int = 10000
+
+    # GET /export/{table}: X-Export-As-Of is the database time when the
+    # export started minus EXPORT_OVERLAP_SECONDS. updated_at is set
+    # when a write flushes, before it commits; the overlap has to
+    # cover the longest write transaction (and clock skew between
+    # app servers), or such a write is missed by both pulls.
+    EXPORT_OVERLAP_SECONDS: float = 60.0
+
+    # GET /events/{id}/stream (server-sent events). "memory" fans out
+    # within this process; "postgres" relays every message through
+    # LISTEN/NOTIFY so each worker's streams see all workers' writes.
+    # Idle streams get a comment every STREAM_HEARTBEAT_SECONDS. The
+    # last STREAM_HISTORY messages can be resumed with Last-Event-ID.
+    # A stream more than STREAM_QUEUE_SIZE messages behind is closed
+    # (the client resumes); beyond STREAM_MAX_CONNECTIONS per process
+    # the route answers 503.
+    STREAM_BACKEND: str = "memory"
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
+    STREAM_RETRY_MS: int = 3000
+    STREAM_HISTORY: int = 1000
+    STREAM_QUEUE_SIZE: int = 100
+    STREAM_MAX_CONNECTIONS: int = 10000
+
+    # Trained outcome model (python -m app.seeds train-model).
+    # Without one, predictions use Elo ratings alone.
+    PREDICTION_MODEL_PATH: str | None = None
+
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,73 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session
+
+from app.core.settings import settings
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class UserStatus:
+    """
+    The parts of a user row that can revoke an issued token.
+    """
+
+    is_active: bool
+    token_version: int
+
+
+class UserStatusCache:
+    """
+    Short-TTL, in-process cache of user status keyed by user id.
+
+    Lets authenticated requests skip the users lookup. Changes made in
+    this process invalidate the entry immediately; changes made by other
+    workers are picked up once the entry expires (at most ttl seconds).
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[int, tuple[UserStatus, float]] = {}
+
+    def get(self, db: Session, user_id: int) -> UserStatus | None:
+        """
+        Return the cached status, loading it from the database on a miss.
+
+        Returns None if the user does not exist.
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        row = (
+            db.query(User.is_active, User.token_version)
+            .filter(User.id == user_id)
+            .first()
+        )
+        if row is None:
+            return None
+
+        status = UserStatus(is_active=bool(row.is_active), token_version=row.token_version)
+
+        with self._lock:
+            self._entries[user_id] = (status, now + self.ttl_seconds)
+
+        return status
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+user_status_cache = UserStatusCache(settings.AUTH_STATUS_CACHE_TTL_SECONDS)
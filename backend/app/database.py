@@ -1,10 +1,17 @@
 import os
+from datetime import datetime, timezone
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.settings import settings
+from app.core.pool import engine_options
+from app.core.metrics import instrument_engine
 
 # Create SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
+# Pool size, overflow, timeout, recycle and pre-ping come from Settings
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+
+# Statement counts / timings for GET /metrics, slow query and N+1 logs
+instrument_engine(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -12,6 +19,17 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for models
 Base = declarative_base()
 
+
+def utcnow() -> datetime:
+    """
+    Default / onupdate for updated_at columns.
+
+    Set in Python so the value has microseconds on every database
+    (SQLite's CURRENT_TIMESTAMP has whole seconds).
+    """
+    return datetime.now(timezone.utc)
+
+
 def get_db():
     """
     Dependency that provides a database session per request.
@@ -0,0 +1,74 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.settings import settings
+from app.core.metrics import instrument_engine
+from app.core.pool import engine_options
+
+# Async driver used for each backend when ASYNC_DATABASE_URL is not set
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine = None
+_async_session_factory = None
+
+
+def to_async_url(url: str) -> str:
+    """
+    Swap the sync driver in a database URL for its async counterpart.
+
+    Example: postgresql://... -> postgresql+asyncpg://...
+    """
+    parsed = make_url(url)
+    drivername = ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    return parsed.set(drivername=drivername).render_as_string(hide_password=False)
+
+
+def get_async_engine():
+    """
+    Create the AsyncEngine on first use.
+
+    Created lazily so the sync-only deployment never needs
+    the async drivers installed.
+    """
+    global _async_engine
+
+    if _async_engine is None:
+        url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+        _async_engine = create_async_engine(url, **engine_options(url, is_async=True))
+        instrument_engine(_async_engine.sync_engine)
+
+    return _async_engine
+
+
+def get_async_session_factory():
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        # expire_on_commit=False: attributes cannot lazy-load after commit
+        # in async code, so keep them populated for response serialization
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    return _async_session_factory
+
+
+async def get_async_db():
+    """
+    Dependency that provides an AsyncSession per request.
+    Ensures session is properly closed after use.
+    """
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+def get_async_engine_if_started():
+    """
+    Return the AsyncEngine only if something has already created it.
+    """
+    return _async_engine
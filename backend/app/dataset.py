@@ -0,0 +1,290 @@
+"""
+Synthetic MMA dataset for load tests and benchmarks.
+
+    python -m app.seeds generate --fighters 50000 --events 20000 --fights 300000
+
+Everything is drawn from one seeded NumPy generator, so the same
+arguments always produce the same rows.
+"""
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.models.event import Event
+from app.models.fight import Fight
+from app.models.fighter import Fighter
+from app.services import stats_service
+
+FIRST_NAMES = [
+    "Jon", "Khabib", "Islam", "Alex", "Israel", "Conor", "Dustin", "Charles", "Max",
+    "Alexander", "Kamaru", "Leon", "Francis", "Stipe", "Daniel", "Jan", "Jiri", "Magomed",
+    "Sean", "Aljamain", "Merab", "Petr", "Henry", "Deiveson", "Brandon", "Kai", "Tom",
+    "Ciryl", "Sergei", "Curtis", "Amanda", "Valentina", "Zhang", "Rose", "Joanna",
+    "Julianna", "Alexa", "Erin", "Manon", "Weili", "Tatiana", "Mackenzie", "Ilia",
+    "Arman", "Beneil", "Justin", "Michael", "Paddy", "Belal", "Gilbert", "Shavkat",
+    "Robert", "Paulo", "Dricus", "Marvin", "Jamahal", "Khamzat", "Bo", "Umar",
+    "Movsar", "Cory", "Song", "Yan", "Rafael", "Jose", "Anderson", "Georges", "Fedor",
+    "Mirko", "Wanderlei", "Mauricio", "Lyoto", "Rashad", "Frankie", "BJ", "Matt",
+    "Chuck", "Tito", "Randy", "Dan", "Demetrious", "Cody", "Dominick", "TJ",
+]
+
+LAST_NAMES = [
+    "Jones", "Nurmagomedov", "Makhachev", "Pereira", "Adesanya", "McGregor", "Poirier",
+    "Oliveira", "Holloway", "Volkanovski", "Usman", "Edwards", "Ngannou", "Miocic",
+    "Cormier", "Błachowicz", "Procházka", "Ankalaev", "O'Malley", "Sterling",
+    "Dvalishvili", "Yan", "Cejudo", "Figueiredo", "Moreno", "Kara-France", "Aspinall",
+    "Gane", "Pavlovich", "Blaydes", "Nunes", "Shevchenko", "Namajunas", "Jędrzejczyk",
+    "Peña", "Grasso", "Andrade", "Fiorot", "Topuria", "Tsarukyan", "Dariush", "Gaethje",
+    "Chandler", "Pimblett", "Muhammad", "Burns", "Rakhmonov", "Whittaker", "Costa",
+    "du Plessis", "Strickland", "Vettori", "Allen", "Chimaev", "Nickal", "Evloev",
+    "Sandhagen", "Yadong", "Dos Anjos", "Aldo", "Silva", "St-Pierre", "Emelianenko",
+    "Filipović", "Rua", "Machida", "Evans", "Edgar", "Penn", "Hughes", "Liddell",
+    "Ortiz", "Couture", "Henderson", "Johnson", "Garbrandt", "Cruz", "Dillashaw",
+    "Ribas", "Zhang", "Świątek", "Gonçalves", "Müller", "Ødegaard", "Nakamura",
+]
+
+SYLLABLES = [
+    "ka", "ha", "bib", "nur", "ma", "go", "med", "ov", "is", "lam", "khe", "chev",
+    "jon", "es", "da", "nil", "son", "al", "ex", "pe", "rei", "ra", "jan", "bla",
+    "cho", "wicz", "dus", "tin", "po", "ir", "ier", "sean", "o", "mal", "ley",
+]
+
+NICKNAMES = [
+    "Bones", "The Eagle", "The Notorious", "Poatan", "The Last Stylebender", "Do Bronx",
+    "Blessed", "The Great", "The Nigerian Nightmare", "Rocky", "The Diamond", "Borz",
+    "Suga", "The Machine", "Lionheart", "Thug Rose", "Bullet", "Cannibal", "Stillknocks",
+    "The Highlight", "Nomad", "Nightmare", "Dragon", "Spider", "Rush", "The Answer",
+]
+
+STANCES = ["Orthodox", "Southpaw", "Switch"]
+STANCE_WEIGHTS = [0.72, 0.22, 0.06]
+
+PROMOTIONS = ["UFC", "UFC Fight Night", "Bellator", "PFL", "ONE", "Cage Warriors", "LFA"]
+
+LOCATIONS = [
+    "Las Vegas, NV", "New York, NY", "Abu Dhabi, UAE", "London, England", "Paris, France",
+    "Rio de Janeiro, Brazil", "São Paulo, Brazil", "Sydney, Australia", "Perth, Australia",
+    "Toronto, Canada", "Houston, TX", "Newark, NJ", "Anaheim, CA", "Denver, CO",
+    "Singapore", "Tokyo, Japan", "Shanghai, China", "Mexico City, Mexico", "Boston, MA",
+    "Miami, FL", "Chicago, IL", "Nashville, TN", "Stockholm, Sweden", "Prague, Czechia",
+]
+
+# Outcomes of completed fights: (method, has winner, share)
+OUTCOMES = [
+    ("KO/TKO", True, 0.32),
+    ("Submission", True, 0.19),
+    ("Decision - Unanimous", True, 0.32),
+    ("Decision - Split", True, 0.09),
+    ("Decision - Majority", True, 0.02),
+    ("DQ", True, 0.01),
+    ("Decision - Split", False, 0.015),      # split draw
+    ("Decision - Majority", False, 0.005),   # majority draw
+    ("NC", False, 0.02),
+]
+
+# Finishing round, by scheduled rounds
+FINISH_ROUNDS = {
+    3: [0.47, 0.31, 0.22],
+    5: [0.36, 0.25, 0.18, 0.12, 0.09],
+}
+
+FIRST_EVENT = date(1993, 11, 12)
+CAREER_YEARS = 9
+BATCH_SIZE = 10000
+
+
+def _names(rng: np.random.Generator, count: int, pool: list[str]) -> list[str]:
+    """
+    Names from the pool, about a third replaced by syllable
+    names so the roster is not a few thousand repeated pairs.
+    """
+
+    names = np.array(pool, dtype=object)[rng.integers(0, len(pool), count)]
+    invented = np.flatnonzero(rng.random(count) < 0.35)
+    lengths = rng.integers(2, 5, len(invented))
+    syllables = np.array(SYLLABLES, dtype=object)
+    for index, length in zip(invented, lengths):
+        names[index] = "".join(syllables[rng.integers(0, len(SYLLABLES), length)]).capitalize()
+    return names.tolist()
+
+
+def _insert(db: Session, model, rows: list[dict]) -> list[int]:
+    """
+    Bulk INSERT in batches, returning the new ids in row order.
+
+    Plain executemany (ordered RETURNING falls back to one row per
+    statement on SQLite); the ids are read back afterwards, which
+    assumes no other writer while the dataset is generated.
+    """
+
+    table = model.__table__
+    connection = db.connection()
+    last_id = connection.scalar(select(func.coalesce(func.max(table.c.id), 0)))
+    for start in range(0, len(rows), BATCH_SIZE):
+        connection.execute(insert(table), rows[start:start + BATCH_SIZE])
+    return list(connection.scalars(select(table.c.id).where(table.c.id > last_id).order_by(table.c.id)))
+
+
+def _pick_fighters(rng, starts: np.ndarray, order: np.ndarray, when: np.ndarray, career: float):
+    """
+    For each fight date, a fighter whose career spans it.
+
+    starts is sorted debut times; order maps positions in it back
+    to fighter indexes.
+    """
+
+    lo = np.searchsorted(starts, when - career)
+    hi = np.maximum(np.searchsorted(starts, when, side="right"), lo + 1)
+    hi = np.minimum(hi, len(starts))
+    lo = np.minimum(lo, hi - 1)
+    return order[lo + (rng.random(len(when)) * (hi - lo)).astype(np.int64)]
+
+
+def fighter_rows(rng, count: int, debuts: np.ndarray) -> list[dict]:
+    first_names = _names(rng, count, FIRST_NAMES)
+    last_names = _names(rng, count, LAST_NAMES)
+    nicknames = np.array(NICKNAMES, dtype=object)[rng.integers(0, len(NICKNAMES), count)]
+    has_nickname = rng.random(count) < 0.4
+
+    # Debut at 20-30; DOB known for most fighters
+    birth = debuts - rng.uniform(20, 30, count) * 365.25
+    has_dob = rng.random(count) < 0.9
+    height = np.clip(rng.normal(178, 8, count), 152, 211).round().astype(int)
+    reach = np.clip(height + rng.normal(3, 5, count), 150, 215).round().astype(int)
+    stances = np.array(STANCES, dtype=object)[rng.choice(len(STANCES), count, p=STANCE_WEIGHTS)]
+
+    return [
+        {
+            "first_name": first_names[i],
+            "last_name": last_names[i],
+            "nickname": nicknames[i] if has_nickname[i] else None,
+            "date_of_birth": FIRST_EVENT + timedelta(days=int(birth[i])) if has_dob[i] else None,
+            "height_cm": int(height[i]),
+            "reach_cm": int(reach[i]),
+            "stance": stances[i],
+        }
+        for i in range(count)
+    ]
+
+
+def event_rows(rng, count: int, days: np.ndarray) -> list[dict]:
+    promotions = rng.integers(0, len(PROMOTIONS), count)
+    locations = rng.integers(0, len(LOCATIONS), count)
+    numbers = [0] * len(PROMOTIONS)
+
+    rows = []
+    for i in range(count):
+        numbers[promotions[i]] += 1
+        rows.append({
+            "name": f"{PROMOTIONS[promotions[i]]} {numbers[promotions[i]]}",
+            "location": LOCATIONS[locations[i]],
+            "event_date": FIRST_EVENT + timedelta(days=int(days[i])),
+        })
+    return rows
+
+
+def fight_rows(rng, fighter_ids, skill, debuts, event_ids, event_days, count: int, today: int) -> list[dict]:
+    """
+    Fights between fighters active on the event date.
+
+    - Fights are spread over the events at random, ids in date order
+    - Stronger fighters (latent skill) win more often
+    - Future events get scheduled fights without a result
+    """
+
+    events = np.sort(rng.integers(0, len(event_ids), count))
+    when = event_days[events].astype(float)
+
+    order = np.argsort(debuts)
+    starts = debuts[order]
+    career = CAREER_YEARS * 365.25
+    fighter_1 = _pick_fighters(rng, starts, order, when, career)
+    fighter_2 = _pick_fighters(rng, starts, order, when, career)
+    for _ in range(5):
+        same = np.flatnonzero(fighter_1 == fighter_2)
+        if not len(same):
+            break
+        fighter_2[same] = _pick_fighters(rng, starts, order, when[same], career)
+    same = fighter_1 == fighter_2
+    fighter_2[same] = (fighter_2[same] + 1) % len(fighter_ids)
+
+    # Outcome, winner corner and round
+    shares = np.array([share for _, _, share in OUTCOMES])
+    outcome = rng.choice(len(OUTCOMES), count, p=shares / shares.sum())
+    p_first = 1 / (1 + np.exp(skill[fighter_2] - skill[fighter_1]))
+    first_wins = rng.random(count) < p_first
+
+    scheduled = np.where(rng.random(count) < 0.12, 5, 3)
+    finish = np.empty(count, dtype=np.int64)
+    for rounds, weights in FINISH_ROUNDS.items():
+        mask = scheduled == rounds
+        finish[mask] = rng.choice(rounds, mask.sum(), p=weights) + 1
+
+    rows = []
+    for i in range(count):
+        f1, f2 = int(fighter_ids[fighter_1[i]]), int(fighter_ids[fighter_2[i]])
+        row = {
+            "event_id": int(event_ids[events[i]]),
+            "fighter_1_id": f1,
+            "fighter_2_id": f2,
+            "winner_id": None,
+            "method": None,
+            "round": None,
+        }
+        if event_days[events[i]] <= today:
+            method, has_winner, _ = OUTCOMES[outcome[i]]
+            row["method"] = method
+            row["round"] = int(scheduled[i] if method.startswith("Decision") else finish[i])
+            if has_winner:
+                row["winner_id"] = f1 if first_wins[i] else f2
+        rows.append(row)
+    return rows
+
+
+def generate_dataset(db: Session, fighters: int, events: int, fights: int, seed: int = 7,
+                     today: date | None = None) -> dict:
+    """
+    Insert a synthetic roster, event calendar and fight history.
+
+    Steps:
+    - Events spread from 1993-11-12 to a year past today
+    - Fighters with a debut date, ~9 year career and latent skill
+    - Fights between fighters active on the event date
+    - Bulk INSERT everything, then rebuild fighter records
+      (and ANALYZE on PostgreSQL)
+
+    Rows are added next to any existing data. Core inserts skip
+    the change bus, so restart a running API afterwards.
+    Returns the row counts inserted.
+    """
+
+    if fights and fighters < 2:
+        raise ValueError("Fights need at least two fighters")
+    if fights and not events:
+        raise ValueError("Fights need at least one event")
+
+    rng = np.random.default_rng(seed)
+    today = (today or date.today()) - FIRST_EVENT
+    span = today.days + 365
+
+    event_days = np.sort(rng.integers(0, span, events))
+    debuts = rng.uniform(-CAREER_YEARS * 365.25 / 2, span, fighters)
+    skill = rng.normal(0, 1, fighters)
+
+    fighter_ids = np.array(_insert(db, Fighter, fighter_rows(rng, fighters, debuts)))
+    event_ids = np.array(_insert(db, Event, event_rows(rng, events, event_days)))
+    fight_ids = _insert(db, Fight, fight_rows(
+        rng, fighter_ids, skill, debuts, event_ids, event_days, fights, today.days
+    ))
+    db.commit()
+
+    stats_service.rebuild_fighter_stats(db)
+
+    # Fresh planner statistics; autovacuum would get there later
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("ANALYZE fighters, events, fights, fighter_stats"))
+        db.commit()
+
+    return {"fighters": len(fighter_ids), "events": len(event_ids), "fights": len(fight_ids)}
@@ -1,18 +1,88 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.core.settings import settings
+from app.core.broadcast import broadcaster
+from app.core.cache import ResponseCacheMiddleware, response_cache
+from app.core.metrics import MetricsMiddleware
+from app.core.password_pool import password_pool
+from app.core.readiness import readiness
+from app.database import engine
+from app.database_async import get_async_engine_if_started
+from app.routes import fighter, event, fight, auth, user, metrics, analytics, prediction, export, result, stream
+from app.services.result_service import result_batcher
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # LISTEN before the first stream connects (STREAM_BACKEND=postgres)
+    broadcaster.start()
+    yield
+    # End open streams so shutdown doesn't wait on them
+    broadcaster.close()
+    # Write results still queued, then stop the batch thread
+    result_batcher.shutdown()
+    # Stop the bcrypt worker processes
+    password_pool.shutdown()
 
-from app.routes import fighter, event, fight, auth, user
 
 # Create FastAPI app instance
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+
+# Read-through cache for the public GET routes, invalidated on commit
+if response_cache is not None:
+    app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+
+# Latency / status / SQL metrics for GET /metrics. Added last so it
+# is the outermost middleware and sees cache hits too.
+app.add_middleware(MetricsMiddleware, root_app=app)
 
 # 🔹 Health check endpoint
 @app.get("/health", tags=["Health"])
 def health_check():
     return {"status": "ok"}
 
+# 🔹 Readiness: 503 takes this worker out of the load balancer
+@app.get("/ready", tags=["Health"])
+def readiness_check():
+    """
+    Whether this worker can serve traffic.
+
+    - Database reachable on a pooled connection within
+      READY_DB_TIMEOUT_SECONDS and under READY_DB_LATENCY_MS
+    - Connection pool below READY_POOL_SATURATION
+    - Applied migration matches the Alembic head
+
+    /health stays a no-I/O liveness check.
+    """
+
+    ready, checks = readiness(engine, get_async_engine_if_started())
+
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", "checks": checks},
+    )
+
+# Async stack (settings.ASYNC_DB): async handlers are registered first
+# so they take over the core CRUD paths; everything else stays sync.
+# Hidden from the schema, which is identical to the sync routes.
+if settings.ASYNC_DB:
+    from app.routes import async_fighter, async_event, async_fight
+
+    app.include_router(async_fighter.router, include_in_schema=False)
+    app.include_router(async_event.router, include_in_schema=False)
+    app.include_router(async_fight.router, include_in_schema=False)
+
 # Register routers
 app.include_router(fighter.router)
 app.include_router(event.router)
 app.include_router(fight.router)
 app.include_router(auth.router)
 app.include_router(user.router)
+app.include_router(metrics.router)
+app.include_router(analytics.router)
+app.include_router(prediction.router)
+app.include_router(export.router)
+app.include_router(result.router)
+app.include_router(stream.router)
@@ -1,4 +1,6 @@
 from .fighter import Fighter
 from .fight import Fight
 from .event import Event
-from .user import User
\ No newline at end of file
+from .user import User
+from .fighter_stats import FighterStats
+from .fight_result_update import FightResultUpdate
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import Column, Integer, String, Date, DateTime
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utcnow
 
 class Event(Base):
     """
@@ -22,7 +23,17 @@ class Event(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=True) # Example: UFC 300
     location = Column(String, nullable=True) #Example: Las Vegas, NV
-    event_date = Column(Date, nullable=False)
+    event_date = Column(Date, nullable=False, index=True)
+
+    # Bumped on every ORM / Core update; drives ETag and Last-Modified
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        index=True,
+    )
     
      # One event has many fights
-    fights = relationship("Fight", back_populates="event")
\ No newline at end of file
+    fights = relationship("Fight", back_populates="event", order_by="Fight.id")
\ No newline at end of file
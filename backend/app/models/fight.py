@@ -1,6 +1,17 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.database import Base, utcnow
+
+
+def bout_key(event_id: int, fighter_1_id: int, fighter_2_id: int) -> str:
+    """
+    Identity of a bout: the event and the pair of fighters,
+    whichever corner each is in ("12:40:57").
+    """
+
+    low, high = sorted((fighter_1_id, fighter_2_id))
+    return f"{event_id}:{low}:{high}"
 
 
 class Fight(Base):
@@ -13,6 +24,13 @@ class Fight(Base):
     FOREIGN KEY (fighter_1_id) REFERENCES fighters(id)
     FOREIGN KEY (fighter_2_id) REFERENCES fighters(id)
     FOREIGN KEY (winner_id) REFERENCES fighters(id)
+
+    Every foreign key is indexed so relationship loads
+    (Event.fights, Fighter.fights_as_fighter_1, ...) use index lookups.
+
+    bout_key is set once a result has been ingested for the fight
+    (result_service); result upserts (INSERT ... ON CONFLICT) target
+    its unique index.
     """
 
     __tablename__ = "fights"
@@ -20,17 +38,29 @@ class Fight(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     # Foreign key to Event
-    event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
+    event_id = Column(Integer, ForeignKey("events.id"), nullable=False, index=True)
 
     # Foreign keys to Fighter
-    fighter_1_id = Column(Integer, ForeignKey("fighters.id"), nullable=False)
-    fighter_2_id = Column(Integer, ForeignKey("fighters.id"), nullable=False)
+    fighter_1_id = Column(Integer, ForeignKey("fighters.id"), nullable=False, index=True)
+    fighter_2_id = Column(Integer, ForeignKey("fighters.id"), nullable=False, index=True)
 
     # Winner (can be null if fight hasn't happened yet)
-    winner_id = Column(Integer, ForeignKey("fighters.id"), nullable=True)
+    winner_id = Column(Integer, ForeignKey("fighters.id"), nullable=True, index=True)
 
     method = Column(String, nullable=True)   # KO, Submission, Decision
     round = Column(Integer, nullable=True)
+
+    # "event:low fighter id:high fighter id"; NULL until a result arrives
+    bout_key = Column(String, nullable=True, unique=True, index=True)
+
+    # Bumped on every ORM / Core update; drives event card ETags
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+    )
     
     # ORM (Object-Relational Mapping) Relationships
     event = relationship("Event", back_populates="fights")
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.database import Base, utcnow
+
+
+class FightResultUpdate(Base):
+    """
+    Ledger of result updates received by POST /events/{id}/results.
+
+    One row per idempotency key, claimed with INSERT ... ON CONFLICT
+    DO NOTHING in the same transaction that applies the result, so a
+    retried update is applied once even across workers.
+    """
+
+    __tablename__ = "fight_result_updates"
+
+    idempotency_key = Column(String, primary_key=True)
+    event_id = Column(Integer, nullable=False, index=True)
+    bout_key = Column(String, nullable=False)
+
+    # Why the update was rejected; NULL when it was applied
+    error = Column(String, nullable=True)
+
+    received_at = Column(DateTime(timezone=True), nullable=False, default=utcnow)
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Date
+from sqlalchemy import DDL, Column, Integer, String, Date, DateTime, Index, event, literal_column, text
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.database import Base
+from app.core.names import sql_folds
+from app.database import Base, utcnow
 
 
 class Fighter(Base):
@@ -14,6 +16,13 @@ class Fighter(Base):
     # This tells SQLAlchemy what the table name should be
     __tablename__ = "fighters"
 
+    __table_args__ = (
+        # Supports keyset pagination ordered by (last_name, id)
+        Index("ix_fighters_last_name_id", "last_name", "id"),
+        # Name lookups
+        Index("ix_fighters_last_name_first_name", "last_name", "first_name"),
+    )
+
     # Primary Key (unique identifier for each fighter)
     id = Column(Integer, primary_key=True, index=True)
 
@@ -34,7 +43,17 @@ class Fighter(Base):
     wins = Column(Integer, default=0)
     losses = Column(Integer, default=0)
     draws = Column(Integer, default=0)
-    
+
+    # Bumped on every ORM / Core update; drives ETag and Last-Modified
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        index=True,
+    )
+
     fights_as_fighter_1 = relationship(
         "Fight",
         foreign_keys="Fight.fighter_1_id",
@@ -45,4 +64,68 @@ class Fighter(Base):
         "Fight",
         foreign_keys="Fight.fighter_2_id",
         back_populates="fighter_2"
-    )
\ No newline at end of file
+    )
+
+
+def _pg_trgm(available: bool):
+    """
+    ddl_if / execute_if check: pg_trgm available to install
+    (available=True) or already installed.
+    """
+
+    catalog = "pg_available_extensions WHERE name" if available else "pg_extension WHERE extname"
+
+    def check(ddl, target, bind, **kw):
+        if bind is None or bind.dialect.name != "postgresql":
+            return False
+        return bind.execute(text(f"SELECT 1 FROM {catalog} = 'pg_trgm'")).first() is not None
+
+    return check
+
+
+def _inline(value: str):
+    return literal_column("'" + value.replace("'", "''") + "'")
+
+
+def _search_name():
+    """
+    The full name as normalize() folds it, in SQL: lowercased,
+    accented Latin letters folded, words separated by one space.
+    """
+
+    name = func.lower(
+        Fighter.first_name + literal_column("' '") + Fighter.last_name
+        + literal_column("' '") + func.coalesce(Fighter.nickname, literal_column("''"))
+    )
+    single_from, single_to, ligatures = sql_folds()
+    for letter, letters in ligatures:
+        name = func.replace(name, _inline(letter), _inline(letters))
+    name = func.translate(name, _inline(single_from), _inline(single_to))
+    name = func.regexp_replace(name, _inline("[^[:alnum:]]+"), _inline(" "), _inline("g"))
+    return func.btrim(name)
+
+
+# Full name matched by fighter search on PostgreSQL, folded like the
+# query (and the in-process index): "Saint-Pierre" is two words and
+# "Błachowicz" reads "blachowicz". Letters outside the Latin blocks
+# are kept or split on as the database's LC_CTYPE classifies them
+# ([:alnum:]); with a UTF-8 LC_CTYPE that matches Python's isalnum().
+# The trigram index (pg_trgm only)
+# must use this exact expression. Literals are inlined: a bound
+# parameter would not match the index.
+SEARCH_NAME = _search_name()
+
+event.listen(
+    Fighter.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(callable_=_pg_trgm(available=True)),
+)
+
+# Attached explicitly: the expression's first columns are literals,
+# so Index would not find the table itself
+Fighter.__table__.append_constraint(Index(
+    "ix_fighters_search_name_trgm",
+    SEARCH_NAME.label("search_name"),
+    postgresql_using="gin",
+    postgresql_ops={"search_name": "gin_trgm_ops"},
+).ddl_if(callable_=_pg_trgm(available=False)))
@@ -0,0 +1,161 @@
+from collections import Counter
+
+from sqlalchemy import Column, ForeignKey, Integer, event, insert, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, object_session
+
+from app.database import Base
+from app.models.fight import Fight
+from app.services.fight_results import DRAW, LOSS, NO_CONTEST, WIN, result_for
+
+
+class FighterStats(Base):
+    """
+    Fighter record derived from the fights table.
+
+    Materialized so reading a record is a primary-key lookup.
+    Kept in sync incrementally by the Fight mapper hooks below,
+    inside the same transaction (and flush) as the fight write.
+    A full recompute lives in stats_service.rebuild_fighter_stats.
+    """
+
+    __tablename__ = "fighter_stats"
+
+    fighter_id = Column(
+        Integer,
+        ForeignKey("fighters.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    wins = Column(Integer, nullable=False, default=0, server_default="0")
+    losses = Column(Integer, nullable=False, default=0, server_default="0")
+    draws = Column(Integer, nullable=False, default=0, server_default="0")
+    no_contests = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+# Fight result -> FighterStats column
+RESULT_COLUMNS = {
+    WIN: "wins",
+    LOSS: "losses",
+    DRAW: "draws",
+    NO_CONTEST: "no_contests",
+}
+
+
+def fight_contributions(fighter_1_id, fighter_2_id, winner_id, method) -> Counter:
+    """
+    What one fight adds to each fighter's record.
+
+    Keys are (fighter_id, column).
+    """
+
+    contributions = Counter()
+    for fighter_id in (fighter_1_id, fighter_2_id):
+        result = result_for(fighter_id, winner_id, method)
+        if result is not None:
+            contributions[(fighter_id, RESULT_COLUMNS[result])] += 1
+    return contributions
+
+
+def apply_stats_delta(connection, delta: Counter):
+    """
+    Add a (fighter_id, column) -> count delta to fighter_stats.
+
+    One multi-row upsert on PostgreSQL and SQLite; elsewhere UPDATE,
+    then INSERT when the fighter has no stats row yet.
+    """
+
+    per_fighter: dict[int, dict[str, int]] = {}
+    for (fighter_id, column), count in delta.items():
+        if count:
+            per_fighter.setdefault(fighter_id, {})[column] = count
+
+    if not per_fighter:
+        return
+
+    table = FighterStats.__table__
+    columns = list(RESULT_COLUMNS.values())
+    dialects = {"postgresql": postgresql, "sqlite": sqlite}
+    dialect = dialects.get(connection.dialect.name)
+
+    if dialect is not None:
+        # One multi-row upsert for every affected fighter
+        stmt = dialect.insert(table).values([
+            {"fighter_id": fighter_id, **{column: changes.get(column, 0) for column in columns}}
+            for fighter_id, changes in sorted(per_fighter.items())
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.fighter_id],
+            set_={column: table.c[column] + stmt.excluded[column] for column in columns},
+        )
+        connection.execute(stmt)
+        return
+
+    for fighter_id, changes in per_fighter.items():
+        result = connection.execute(
+            update(table)
+            .where(table.c.fighter_id == fighter_id)
+            .values({column: table.c[column] + count for column, count in changes.items()})
+        )
+        if result.rowcount == 0:
+            connection.execute(insert(table).values(fighter_id=fighter_id, **changes))
+
+
+# Deltas from one flush are collected per session and written
+# with a single upsert once the flush has emitted the fight rows.
+DELTA_KEY = "fighter_stats_delta"
+
+
+def _collect(fight, delta: Counter):
+    session = object_session(fight)
+    session.info.setdefault(DELTA_KEY, Counter()).update(delta)
+
+
+@event.listens_for(Fight, "after_insert")
+def _stats_after_fight_insert(mapper, connection, fight):
+    _collect(
+        fight,
+        fight_contributions(fight.fighter_1_id, fight.fighter_2_id, fight.winner_id, fight.method),
+    )
+
+
+@event.listens_for(Fight, "after_update")
+def _stats_after_fight_update(mapper, connection, fight):
+    state = inspect(fight)
+
+    def previous(attribute):
+        history = state.attrs[attribute].history
+        if history.deleted:
+            return history.deleted[0]
+        return getattr(fight, attribute)
+
+    attributes = ("fighter_1_id", "fighter_2_id", "winner_id", "method")
+    if not any(state.attrs[attribute].history.has_changes() for attribute in attributes):
+        return
+
+    delta = fight_contributions(*(getattr(fight, attribute) for attribute in attributes))
+    delta.subtract(fight_contributions(*(previous(attribute) for attribute in attributes)))
+    _collect(fight, delta)
+
+
+@event.listens_for(Fight, "after_delete")
+def _stats_after_fight_delete(mapper, connection, fight):
+    delta = Counter()
+    delta.subtract(
+        fight_contributions(fight.fighter_1_id, fight.fighter_2_id, fight.winner_id, fight.method)
+    )
+    _collect(fight, delta)
+
+
+@event.listens_for(Session, "after_flush")
+def _stats_after_flush(session, flush_context):
+    delta = session.info.pop(DELTA_KEY, None)
+    if delta:
+        # Same connection and transaction as the fight writes
+        apply_stats_delta(session.connection(), delta)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _stats_discard_on_rollback(session, previous_transaction):
+    # A failed flush must not leak its deltas into the next one
+    session.info.pop(DELTA_KEY, None)
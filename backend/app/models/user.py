@@ -22,4 +22,8 @@ class User(Base):
     
     role = Column(String, default="user", nullable=False)
 
+    # Embedded in issued JWTs; bumping it revokes every outstanding token
+    # (e.g. on deactivation or role change)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
@@ -0,0 +1,93 @@
+from enum import Enum
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.analytics import LEADERBOARD_METRICS
+from app.database import get_db
+from app.schemas.analytics import (
+    FighterAnalytics,
+    LeaderboardEntry,
+    RankingEntry,
+    RatingHistoryEntry,
+)
+from app.services import analytics_service
+
+router = APIRouter(tags=["Analytics"])
+
+LeaderboardMetric = Enum(
+    "LeaderboardMetric", {name: name for name in LEADERBOARD_METRICS}, type=str
+)
+
+
+@router.get("/fighters/{fighter_id}/analytics", response_model=FighterAnalytics)
+def get_fighter_analytics(
+    fighter_id: int,
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve a fighter's streaks, finish rates and activity.
+
+    Served from metrics computed for all fighters at once;
+    the cache is refreshed after fight or event writes.
+    """
+
+    analytics = analytics_service.get_fighter_analytics(db, fighter_id)
+
+    if analytics is None:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    return analytics
+
+
+@router.get("/analytics/leaderboard", response_model=List[LeaderboardEntry])
+def get_leaderboard(
+    metric: LeaderboardMetric = Query(LeaderboardMetric.current_win_streak),
+    limit: int = Query(10, ge=1, le=100),
+    min_fights: int = Query(1, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Rank fighters by an analytics metric, highest first.
+
+    - `min_fights` leaves out fighters with fewer completed fights
+    - Ties are broken by fighter id
+    """
+
+    return analytics_service.get_leaderboard(
+        db, metric.value, limit=limit, min_fights=min_fights
+    )
+
+
+@router.get("/rankings", response_model=List[RankingEntry])
+def get_rankings(
+    limit: int = Query(25, ge=1, le=100),
+    min_fights: int = Query(1, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Rank fighters by Elo rating, highest first.
+
+    The ordering is cached and updated incrementally
+    when fights are recorded.
+    """
+
+    return analytics_service.get_rankings(db, limit=limit, min_fights=min_fights)
+
+
+@router.get("/fighters/{fighter_id}/ratings", response_model=List[RatingHistoryEntry])
+def get_fighter_ratings(
+    fighter_id: int,
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve a fighter's Elo rating over time, oldest bout first.
+    """
+
+    history = analytics_service.get_rating_history(db, fighter_id)
+
+    if history is None:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    return history
@@ -0,0 +1,176 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from app.database_async import get_async_db
+from app.core.conditional import collection_etag, conditional, make_etag
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from app.core.serialization import rows_response
+from app.schemas.event import EventCreate, EventResponse, EventWithFightsResponse
+from app.core.dependencies import Principal, require_admin
+from app.routes.event import EventSort, card_validators, event_cursor
+from app.services import async_event_service
+
+# Async versions of the event routes.
+# Mounted ahead of app.routes.event when settings.ASYNC_DB is enabled.
+router = APIRouter()
+
+
+@router.post("/events", response_model=EventResponse, status_code=201)
+async def create_event_async(
+    event: EventCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Create a new event (admin only).
+    """
+
+    return await async_event_service.create_event(db, event)
+
+
+@router.get("/events", response_model=List[EventResponse])
+async def get_events_async(
+    request: Request,
+    response: Response,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    location: Optional[str] = Query(None, min_length=1),
+    sort: EventSort = Query(EventSort.asc),
+    limit: int = Query(50, ge=1, le=100),
+    after: Optional[tuple[date, int]] = Depends(event_cursor),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve a page of events (public endpoint).
+    """
+
+    etag, last_modified = collection_etag(
+        "events", await async_event_service.get_events_version(db)
+    )
+    not_modified = conditional(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    events, next_key = await async_event_service.get_events(
+        db,
+        date_from=date_from,
+        date_to=date_to,
+        location=location,
+        descending=sort == EventSort.desc,
+        limit=limit,
+        after=after,
+    )
+
+    if next_key is not None:
+        event_date, event_id = next_key
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            event_date.isoformat(), event_id
+        )
+
+    return rows_response(events, response)
+
+
+@router.get("/events/cards", response_model=List[EventWithFightsResponse])
+async def get_event_cards_async(
+    ids: List[int] = Query(..., min_length=1, max_length=50),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve full fight cards for several events at once.
+    """
+
+    return await async_event_service.get_event_cards(db, ids)
+
+
+@router.get("/events/{event_id}", response_model=EventResponse)
+async def get_event_by_id_async(
+    event_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve a specific event by ID.
+    """
+
+    updated_at = await async_event_service.get_event_version(db, event_id)
+
+    if updated_at is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    not_modified = conditional(
+        request, response, make_etag("event", event_id, updated_at), updated_at
+    )
+    if not_modified:
+        return not_modified
+
+    event = await async_event_service.get_event_by_id(db, event_id)
+
+    if not event:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    return event
+
+
+@router.get("/events/{event_id}/card", response_model=EventWithFightsResponse)
+async def get_event_card_async(
+    event_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve an event with its full fight card.
+    """
+
+    version = await async_event_service.get_event_card_version(db, event_id)
+
+    if version is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    not_modified = conditional(request, response, *card_validators(event_id, version))
+    if not_modified:
+        return not_modified
+
+    event = await async_event_service.get_event_card(db, event_id)
+
+    if not event:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    return event
+
+
+@router.delete("/events/{event_id}", status_code=204)
+async def delete_event_async(
+    event_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Delete an event (admin only).
+    """
+
+    event = await async_event_service.delete_event(db, event_id)
+
+    if not event:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    return
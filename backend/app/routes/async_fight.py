@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database_async import get_async_db
+from app.schemas.fight import FightCreate, FightResponse
+from app.core.dependencies import Principal, require_admin
+from app.services import async_fight_service
+
+# Async version of the fight routes.
+# Mounted ahead of app.routes.fight when settings.ASYNC_DB is enabled.
+router = APIRouter()
+
+
+@router.post("/fights", response_model=FightResponse, status_code=201)
+async def create_fight_async(
+    fight: FightCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Create fight (admin only).
+    """
+
+    result = await async_fight_service.create_fight(db, fight)
+
+    # If service returned error dict, convert to HTTPException
+    if isinstance(result, dict) and "error" in result:
+
+        error_message = result["error"]
+
+        if "not found" in error_message.lower():
+            raise HTTPException(status_code=404, detail=error_message)
+
+        raise HTTPException(status_code=400, detail=error_message)
+
+    return result
@@ -0,0 +1,150 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Literal, Optional
+
+from app.database_async import get_async_db
+from app.core.conditional import collection_etag, conditional, make_etag
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from app.core.serialization import rows_response
+from app.schemas.fighter import (
+    FighterCreate,
+    FighterResponse,
+    FighterSearchResult,
+    FighterUpdate,
+)
+from app.core.dependencies import Principal, require_admin
+from app.routes.fighter import fighter_cursor
+from app.services import async_fighter_service, search_service
+
+# Async versions of the fighter CRUD routes.
+# Mounted ahead of app.routes.fighter when settings.ASYNC_DB is enabled.
+router = APIRouter()
+
+
+@router.post("/fighters", response_model=FighterResponse, status_code=201)
+async def create_fighter_async(
+    fighter: FighterCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Create a new fighter (admin only).
+    """
+
+    return await async_fighter_service.create_fighter(db, fighter)
+
+
+@router.get("/fighters", response_model=List[FighterResponse])
+async def get_fighters_async(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    after: Optional[tuple[str, int]] = Depends(fighter_cursor),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve paginated list of fighters ordered by last name.
+    """
+
+    etag, last_modified = collection_etag(
+        "fighters", await async_fighter_service.get_fighters_version(db)
+    )
+    not_modified = conditional(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    fighters, next_key = await async_fighter_service.get_fighters(
+        db, skip=skip, limit=limit, after=after
+    )
+
+    if next_key is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*next_key)
+
+    return rows_response(fighters, response)
+
+
+@router.get("/fighters/search", response_model=List[FighterSearchResult])
+async def search_fighters_async(
+    q: str = Query(..., min_length=1, max_length=100),
+    mode: Literal["search", "autocomplete"] = Query("search"),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Find fighters by first name, last name or nickname.
+
+    Shares the sync implementation (the in-process index loads
+    through a sync session) via run_sync.
+    """
+
+    return await db.run_sync(
+        lambda session: search_service.search_fighters(session, q, limit=limit, mode=mode)
+    )
+
+
+@router.get("/fighters/{fighter_id}", response_model=FighterResponse)
+async def get_fighter_by_id_async(
+    fighter_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Retrieve a single fighter by ID.
+    """
+
+    updated_at = await async_fighter_service.get_fighter_version(db, fighter_id)
+
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    not_modified = conditional(
+        request, response, make_etag("fighter", fighter_id, updated_at), updated_at
+    )
+    if not_modified:
+        return not_modified
+
+    fighter = await async_fighter_service.get_fighter_by_id(db, fighter_id)
+
+    if not fighter:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    return fighter
+
+
+@router.patch("/fighters/{fighter_id}", response_model=FighterResponse)
+async def update_fighter_async(
+    fighter_id: int,
+    fighter_update: FighterUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Update fighter (admin only).
+    """
+
+    fighter = await async_fighter_service.update_fighter(db, fighter_id, fighter_update)
+
+    if not fighter:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    return fighter
+
+
+@router.delete("/fighters/{fighter_id}", status_code=204)
+async def delete_fighter_async(
+    fighter_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Delete fighter (admin only).
+    """
+
+    fighter = await async_fighter_service.delete_fighter(db, fighter_id)
+
+    if not fighter:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    return
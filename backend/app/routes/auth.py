@@ -1,39 +1,38 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, UserLogin, TokenResponse
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import create_access_token
+from app.core.password_pool import password_pool
 from datetime import timedelta
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# The handlers are async so a request waiting on bcrypt holds no
+# threadpool thread; their blocking DB work runs in the threadpool.
 
-@router.post("/register", response_model=UserResponse, status_code=201)
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
-    """
-    Register a new user.
-
-    - Ensure username is unique
-    - Ensure email is unique
-    - Hash password before storing
-    """
 
+def _registration_error(db: Session, user: UserCreate) -> str | None:
     # Check if username exists
     existing_user = db.query(User).filter(User.username == user.username).first()
     if existing_user:
-        raise HTTPException(status_code=400, detail="Username already taken")
+        return "Username already taken"
 
     # Check if email exists
     existing_email = db.query(User).filter(User.email == user.email).first()
     if existing_email:
-        raise HTTPException(status_code=400, detail="Email already registered")
+        return "Email already registered"
 
-    # Hash the password
-    hashed_pw = hash_password(user.password)
+    # Return the DB connection to the pool while bcrypt runs
+    db.rollback()
+    return None
 
+
+def _create_user(db: Session, user: UserCreate, hashed_pw: str) -> User:
     db_user = User(
         username=user.username,
         email=user.email,
@@ -46,32 +45,87 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
 
     return db_user
 
+
+def _load_user(db: Session, username: str) -> User | None:
+    user = db.query(User).filter(User.username == username).first()
+
+    if user is not None:
+        # Detach the user and return the DB connection to the pool
+        # while bcrypt runs, so a login burst can't exhaust the pool
+        db.expunge(user)
+        db.rollback()
+
+    return user
+
+
+def _store_hash(db: Session, user_id: int, new_hash: str):
+    db.query(User).filter(User.id == user_id).update(
+        {"hashed_password": new_hash}
+    )
+    db.commit()
+
+
+@router.post("/register", response_model=UserResponse, status_code=201)
+async def register_user(user: UserCreate, db: Session = Depends(get_db)):
+    """
+    Register a new user.
+
+    - Ensure username is unique
+    - Ensure email is unique
+    - Hash password before storing (in the password worker pool)
+    """
+
+    error = await run_in_threadpool(_registration_error, db, user)
+    if error is not None:
+        raise HTTPException(status_code=400, detail=error)
+
+    # Hash the password (429 if the password pool is saturated)
+    hashed_pw = await password_pool.hash_async(user.password)
+
+    return await run_in_threadpool(_create_user, db, user, hashed_pw)
+
 @router.post("/login", response_model=TokenResponse)
-def login_user(
-    form_data: OAuth2PasswordRequestForm = Depends(), 
+async def login_user(
+    form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """
     Authenticate user and return JWT.
+
+    If the stored hash uses an outdated bcrypt cost factor,
+    it is transparently replaced with a fresh hash.
     """
 
-    user = db.query(User).filter(User.username == form_data.username).first()
+    user = await run_in_threadpool(_load_user, db, form_data.username)
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    if not verify_password(form_data.password, user.hashed_password):
+    valid, new_hash = await password_pool.verify_and_update_async(
+        form_data.password, user.hashed_password
+    )
+
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    if not user.is_active:
+        raise HTTPException(status_code=401, detail="User is inactive")
+
     access_token = create_access_token(
         data={
             "sub": user.username,
-            "role": user.role
+            "uid": user.id,
+            "role": user.role,
+            "ver": user.token_version
         },
         expires_delta=timedelta(minutes=60)
     )
 
+    # Upgrade the stored hash after the cost factor changed
+    if new_hash is not None:
+        await run_in_threadpool(_store_hash, db, user.id, new_hash)
+
     return {
         "access_token": access_token,
         "token_type": "bearer"
-    }
\ No newline at end of file
+    }
@@ -1,22 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from enum import Enum
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from app.database import get_db
-from app.schemas.event import EventCreate, EventResponse
-from app.core.dependencies import require_admin
-from app.models.user import User
+from app.core.conditional import as_utc, collection_etag, conditional, make_etag
+from app.core.pagination import NEXT_CURSOR_HEADER, cursor_id, decode_cursor, encode_cursor
+from app.core.serialization import rows_response
+from app.schemas.event import EventCreate, EventResponse, EventWithFightsResponse
+from app.core.dependencies import Principal, require_admin
 from app.services import event_service
 
 # Router groups all event-related endpoints
 router = APIRouter()
 
 
+class EventSort(str, Enum):
+    """
+    Sort direction on event_date.
+    """
+
+    asc = "asc"
+    desc = "desc"
+
+
+def event_cursor(
+    after: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+) -> Optional[tuple[date, int]]:
+    """
+    Decode ?after= into the (event_date, id) keyset of the last event seen.
+    """
+
+    if after is None:
+        return None
+
+    event_date, event_id = decode_cursor(after, 2)
+    event_id = cursor_id(event_id)
+    try:
+        return (date.fromisoformat(event_date), event_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def card_validators(event_id: int, version: tuple):
+    """
+    (ETag, Last-Modified) of an event card from its version row.
+    """
+
+    event_updated, fights_updated, _, fighters_updated = version
+    timestamps = [t for t in (event_updated, fights_updated, fighters_updated) if t is not None]
+
+    return make_etag("card", event_id, *version), max(timestamps, key=as_utc)
+
+
 @router.post("/events", response_model=EventResponse, status_code=201)
 def create_event(
     event: EventCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ):
     """
     Create a new event (admin only).
@@ -32,25 +75,101 @@ def create_event(
 
 
 @router.get("/events", response_model=List[EventResponse])
-def get_events(db: Session = Depends(get_db)):
+def get_events(
+    request: Request,
+    response: Response,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    location: Optional[str] = Query(None, min_length=1),
+    sort: EventSort = Query(EventSort.asc),
+    limit: int = Query(50, ge=1, le=100),
+    after: Optional[tuple[date, int]] = Depends(event_cursor),
+    db: Session = Depends(get_db),
+):
     """
-    Retrieve all events (public endpoint).
+    Retrieve a page of events (public endpoint).
+
+    - `from` / `to` filter on event_date (inclusive)
+    - `location` filters by case-insensitive substring
+    - `sort` orders by event_date
+    - The cursor for the next page is returned in the
+      X-Next-Cursor header (absent on the last page)
+    - ETag / Last-Modified follow the whole collection;
+      a matching If-None-Match gets 304 from one aggregate query
+    - Rows are encoded straight to JSON with orjson; the
+      response_model only documents the shape
 
     No authentication required.
     """
 
-    return event_service.get_all_events(db)
+    etag, last_modified = collection_etag("events", event_service.get_events_version(db))
+    not_modified = conditional(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    events, next_key = event_service.get_events(
+        db,
+        date_from=date_from,
+        date_to=date_to,
+        location=location,
+        descending=sort == EventSort.desc,
+        limit=limit,
+        after=after,
+    )
+
+    if next_key is not None:
+        event_date, event_id = next_key
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            event_date.isoformat(), event_id
+        )
+
+    return rows_response(events, response)
+
+
+@router.get("/events/cards", response_model=List[EventWithFightsResponse])
+def get_event_cards(
+    ids: List[int] = Query(..., min_length=1, max_length=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve full fight cards for several events at once.
+
+    - Pass ids as repeated query params: ?ids=1&ids=2
+    - Unknown IDs are skipped
+    """
+
+    return event_service.get_event_cards(db, ids)
 
 
 @router.get("/events/{event_id}", response_model=EventResponse)
-def get_event_by_id(event_id: int, db: Session = Depends(get_db)):
+def get_event_by_id(
+    event_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
     """
     Retrieve a specific event by ID.
 
     - Returns 200 if found.
+    - Returns 304 if If-None-Match / If-Modified-Since still match.
     - Returns 404 if not found.
     """
 
+    updated_at = event_service.get_event_version(db, event_id)
+
+    if updated_at is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    not_modified = conditional(
+        request, response, make_etag("event", event_id, updated_at), updated_at
+    )
+    if not_modified:
+        return not_modified
+
     event = event_service.get_event_by_id(db, event_id)
 
     if not event:
@@ -62,11 +181,49 @@ def get_event_by_id(event_id: int, db: Session = Depends(get_db)):
     return event
 
 
+@router.get("/events/{event_id}/card", response_model=EventWithFightsResponse)
+def get_event_card(
+    event_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve an event with its full fight card.
+
+    Fights, fighters and winners are loaded eagerly,
+    so the query count does not grow with the card size.
+    The ETag covers the event, its fights and their fighters.
+    """
+
+    version = event_service.get_event_card_version(db, event_id)
+
+    if version is None:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    not_modified = conditional(request, response, *card_validators(event_id, version))
+    if not_modified:
+        return not_modified
+
+    event = event_service.get_event_card(db, event_id)
+
+    if not event:
+        raise HTTPException(
+            status_code=404,
+            detail="Event not found"
+        )
+
+    return event
+
+
 @router.delete("/events/{event_id}", status_code=204)
 def delete_event(
     event_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ):
     """
     Delete an event (admin only).
@@ -0,0 +1,68 @@
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.conditional import as_utc
+from app.services import export_service
+
+router = APIRouter(tags=["Export"])
+
+# Response header with the updated_since for the next pull: the
+# time the export started, minus EXPORT_OVERLAP_SECONDS
+EXPORT_AS_OF_HEADER = "X-Export-As-Of"
+
+
+def accepts_gzip(request: Request) -> bool:
+    for coding in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip" and params.replace(" ", "") != "q=0":
+            return True
+    return False
+
+
+@router.get(
+    "/export/{table}",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}, "text/csv": {}}}},
+)
+def export_table(
+    table: Literal["fighters", "events", "fights"],
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    updated_since: Optional[datetime] = Query(
+        None, description="Only rows with updated_at at or after this time (UTC if no offset)"
+    ),
+):
+    """
+    Stream a whole table as NDJSON or CSV.
+
+    - Rows are read from a server-side cursor and written as
+      they arrive, so memory stays flat for any table size
+    - Gzipped when the client sends Accept-Encoding: gzip
+    - X-Export-As-Of is the next updated_since for incremental
+      pulls. It reaches EXPORT_OVERLAP_SECONDS before the export
+      started, so writes committing during it aren't missed; rows
+      in the overlap are sent again (upsert them by id)
+    - Deletes are never exported: an incremental pull can't tell
+      that a row is gone, only a full export can
+    """
+
+    if updated_since is not None:
+        updated_since = as_utc(updated_since)
+
+    gzip = accepts_gzip(request)
+    headers = {
+        EXPORT_AS_OF_HEADER: export_service.export_as_of().isoformat(),
+        "Content-Disposition": f'attachment; filename="{table}.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        export_service.stream_export(table, format, updated_since, gzip=gzip),
+        media_type=export_service.MEDIA_TYPES[format],
+        headers=headers,
+    )
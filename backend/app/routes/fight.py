@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from typing import List
 
 from app.database import get_db
-from app.schemas.fight import FightCreate, FightResponse
-from app.core.dependencies import require_admin
-from app.models.user import User
+from app.schemas.fight import FightBulkCreate, FightCreate, FightResponse
+from app.core.dependencies import Principal, require_admin
 from app.services import fight_service
 
 router = APIRouter()
@@ -14,7 +14,7 @@ router = APIRouter()
 def create_fight(
     fight: FightCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ):
     """
     Create fight (admin only).
@@ -32,4 +32,32 @@ def create_fight(
 
         raise HTTPException(status_code=400, detail=error_message)
 
-    return result
\ No newline at end of file
+    return result
+
+
+@router.post("/fights/bulk", response_model=List[FightResponse], status_code=201)
+def create_fights_bulk(
+    payload: FightBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Create a card of fights in one transaction (admin only).
+
+    All-or-nothing: if any fight is invalid, none are created
+    and every invalid fight is listed as {"index", "error"}.
+    The first error decides the status (404 for missing IDs, else 400).
+    """
+
+    result = fight_service.create_fights(db, payload.fights)
+
+    if isinstance(result, dict) and "errors" in result:
+
+        errors = result["errors"]
+
+        if "not found" in errors[0]["error"].lower():
+            raise HTTPException(status_code=404, detail=errors)
+
+        raise HTTPException(status_code=400, detail=errors)
+
+    return result
@@ -1,21 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 
 from app.database import get_db
-from app.schemas.fighter import FighterCreate, FighterResponse, FighterUpdate
-from app.core.dependencies import require_admin
-from app.models.user import User
-from app.services import fighter_service
+from app.core.conditional import collection_etag, conditional, make_etag
+from app.core.pagination import NEXT_CURSOR_HEADER, cursor_id, decode_cursor, encode_cursor
+from app.core.serialization import rows_response
+from app.schemas.fighter import (
+    FighterCreate,
+    FighterImportReport,
+    FighterRecord,
+    FighterResponse,
+    FighterSearchResult,
+    FighterUpdate,
+)
+from app.schemas.fight import FightHistoryEntry
+from app.core.dependencies import Principal, require_admin
+from app.services import fighter_import_service, fighter_service, search_service, stats_service
 
 router = APIRouter()
 
 
+def fighter_cursor(
+    after: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+) -> Optional[tuple[str, int]]:
+    """
+    Decode ?after= into the (last_name, id) keyset of the last fighter seen.
+    """
+
+    if after is None:
+        return None
+
+    last_name, fighter_id = decode_cursor(after, 2)
+    if not isinstance(last_name, str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return (last_name, cursor_id(fighter_id))
+
+
 @router.post("/fighters", response_model=FighterResponse, status_code=201)
 def create_fighter(
     fighter: FighterCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ):
     """
     Create a new fighter (admin only).
@@ -24,29 +54,168 @@ def create_fighter(
     return fighter_service.create_fighter(db, fighter)
 
 
+def fight_history_cursor(
+    after: Optional[str] = Query(None, description="Cursor from X-Next-Cursor"),
+) -> Optional[tuple[date, int]]:
+    """
+    Decode ?after= into the (event_date, fight_id) keyset of the last bout seen.
+    """
+
+    if after is None:
+        return None
+
+    event_date, fight_id = decode_cursor(after, 2)
+    fight_id = cursor_id(fight_id)
+    try:
+        return (date.fromisoformat(event_date), fight_id)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+# Content types accepted by the bulk import, mapped to parser format
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/x-ndjson": "jsonl",
+    "application/jsonl": "jsonl",
+    "application/json-lines": "jsonl",
+}
+
+
+@router.post(
+    "/fighters/bulk",
+    response_model=FighterImportReport,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def bulk_create_fighters(
+    request: Request,
+    format: Optional[Literal["csv", "jsonl"]] = Query(
+        None, description="Overrides the format implied by Content-Type"
+    ),
+    batch_size: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Bulk import fighters from CSV or JSON lines (admin only).
+
+    - Every row is validated with FighterCreate
+    - Valid rows are inserted in batches (COPY on PostgreSQL)
+    - Invalid rows are reported per row; they don't abort the import
+    """
+
+    fmt = format
+    if fmt is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip()
+        fmt = IMPORT_CONTENT_TYPES.get(content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Send text/csv or application/x-ndjson, or pass ?format="
+        )
+
+    try:
+        content = (await request.body()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Body must be UTF-8")
+
+    # The import is blocking DB work; keep it off the event loop
+    return await run_in_threadpool(
+        fighter_import_service.bulk_create_fighters, db, content, fmt, batch_size
+    )
+
+
 @router.get("/fighters", response_model=List[FighterResponse])
 def get_fighters(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    after: Optional[tuple[str, int]] = Depends(fighter_cursor),
     db: Session = Depends(get_db),
 ):
     """
-    Retrieve paginated list of fighters.
+    Retrieve paginated list of fighters ordered by last name.
+
+    - `skip`/`limit` page with OFFSET in the database
+    - `after` switches to keyset pagination (skip is ignored)
+    - The cursor for the next page is returned in the
+      X-Next-Cursor header (absent on the last page)
+    - ETag / Last-Modified follow the whole collection;
+      a matching If-None-Match gets 304 from one aggregate query
+    - Rows are encoded straight to JSON with orjson; the
+      response_model only documents the shape
     """
 
-    fighters = fighter_service.get_all_fighters(db)
-    return fighters[skip : skip + limit]
+    etag, last_modified = collection_etag("fighters", fighter_service.get_fighters_version(db))
+    not_modified = conditional(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    fighters, next_key = fighter_service.get_fighters(
+        db, skip=skip, limit=limit, after=after
+    )
+
+    if next_key is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*next_key)
+
+    return rows_response(fighters, response)
+
+
+# Declared before /fighters/{fighter_id} so "search" isn't read as an id
+@router.get("/fighters/search", response_model=List[FighterSearchResult])
+def search_fighters(
+    q: str = Query(..., min_length=1, max_length=100),
+    mode: Literal["search", "autocomplete"] = Query("search"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    """
+    Find fighters by first name, last name or nickname.
+
+    - `search` tolerates typos and spelling variants and is
+      ranked by similarity
+    - `autocomplete` matches names with a word starting with
+      each word of `q`, for type-ahead
+    - Backed by a pg_trgm index on PostgreSQL, an in-process
+      n-gram index elsewhere
+    """
+
+    return search_service.search_fighters(db, q, limit=limit, mode=mode)
 
 
 @router.get("/fighters/{fighter_id}", response_model=FighterResponse)
 def get_fighter_by_id(
     fighter_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
     Retrieve a single fighter by ID.
+
+    The ETag is derived from updated_at, so a matching
+    If-None-Match gets 304 without loading the fighter.
     """
 
+    updated_at = fighter_service.get_fighter_version(db, fighter_id)
+
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    not_modified = conditional(
+        request, response, make_etag("fighter", fighter_id, updated_at), updated_at
+    )
+    if not_modified:
+        return not_modified
+
     fighter = fighter_service.get_fighter_by_id(db, fighter_id)
 
     if not fighter:
@@ -55,12 +224,64 @@ def get_fighter_by_id(
     return fighter
 
 
+@router.get("/fighters/{fighter_id}/fights", response_model=List[FightHistoryEntry])
+def get_fighter_fights(
+    fighter_id: int,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[tuple[date, int]] = Depends(fight_history_cursor),
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve a fighter's fight history, newest first.
+
+    - One indexed query covers both corners, the event and the opponent
+    - The cursor for the next page is returned in the
+      X-Next-Cursor header (absent on the last page)
+    """
+
+    history = fighter_service.get_fight_history(db, fighter_id, limit=limit, after=after)
+
+    if history is None:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    entries, next_key = history
+
+    if next_key is not None:
+        event_date, fight_id = next_key
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            event_date.isoformat(), fight_id
+        )
+
+    return entries
+
+
+@router.get("/fighters/{fighter_id}/record", response_model=FighterRecord)
+def get_fighter_record(
+    fighter_id: int,
+    db: Session = Depends(get_db),
+):
+    """
+    Retrieve a fighter's record as derived from recorded fights.
+
+    Served from the fighter_stats table, which fight writes
+    keep up to date in the same transaction.
+    """
+
+    record = stats_service.get_fighter_record(db, fighter_id)
+
+    if record is None:
+        raise HTTPException(status_code=404, detail="Fighter not found")
+
+    return record
+
+
 @router.patch("/fighters/{fighter_id}", response_model=FighterResponse)
 def update_fighter(
     fighter_id: int,
     fighter_update: FighterUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ):
     """
     Update fighter (admin only).
@@ -78,7 +299,7 @@ def update_fighter(
 def delete_fighter(
     fighter_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ):
     """
     Delete fighter (admin only).
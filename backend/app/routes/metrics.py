@@ -0,0 +1,46 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, collect_pool, registry
+from app.core.pool import pool_status
+from app.database import engine
+from app.database_async import get_async_engine_if_started
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics():
+    """
+    All metrics of this process in Prometheus text format.
+
+    - http_*: requests, latency histograms and in-flight requests per route
+    - db_*: statement counts and timings, statements per request,
+      slow queries, likely N+1 requests and pool occupancy
+    """
+
+    collect_pool("sync", pool_status(engine))
+    async_engine = get_async_engine_if_started()
+    if async_engine:
+        collect_pool("async", pool_status(async_engine.sync_engine))
+
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/pool")
+def get_pool_metrics():
+    """
+    Connection pool occupancy and checkout wait times for this process.
+
+    - checked_out: connections currently in use
+    - overflow: connections opened beyond pool_size
+    - wait_seconds_*: time spent waiting for a connection
+    - timeouts: checkouts that gave up after pool_timeout
+    """
+
+    async_engine = get_async_engine_if_started()
+
+    return {
+        "sync": pool_status(engine),
+        "async": pool_status(async_engine.sync_engine) if async_engine else None,
+    }
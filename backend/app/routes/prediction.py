@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.database import get_db
+from app.schemas.prediction import (
+    CardPrediction,
+    MatchupBatchRequest,
+    MatchupPrediction,
+    MatchupRequest,
+)
+from app.services import prediction_service
+
+router = APIRouter(tags=["Predictions"])
+
+
+@router.post("/predictions", response_model=MatchupPrediction)
+def predict_matchup(
+    matchup: MatchupRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Predict the winner of a matchup as of today.
+
+    Features come from the precomputed feature store and
+    current Elo ratings; nothing is written.
+    """
+
+    result = prediction_service.predict_matchup(db, matchup)
+
+    if "error" in result:
+
+        error_message = result["error"]
+
+        if "not found" in error_message.lower():
+            raise HTTPException(status_code=404, detail=error_message)
+
+        raise HTTPException(status_code=400, detail=error_message)
+
+    return result
+
+
+@router.post("/predictions/batch", response_model=List[MatchupPrediction])
+def predict_matchups(
+    payload: MatchupBatchRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Predict up to 10,000 matchups in one vectorized pass.
+
+    All-or-nothing: invalid matchups are listed as {"index", "error"}.
+    The first error decides the status (404 for missing IDs, else 400).
+    """
+
+    result = prediction_service.predict_matchups(db, payload.matchups)
+
+    if isinstance(result, dict) and "errors" in result:
+
+        errors = result["errors"]
+
+        if "not found" in errors[0]["error"].lower():
+            raise HTTPException(status_code=404, detail=errors)
+
+        raise HTTPException(status_code=400, detail=errors)
+
+    return result
+
+
+@router.get("/events/{event_id}/predictions", response_model=List[CardPrediction])
+def predict_event_card(
+    event_id: int,
+    db: Session = Depends(get_db),
+):
+    """
+    Predict every fight on an event card, as of the event date.
+    """
+
+    predictions = prediction_service.predict_event_card(db, event_id)
+
+    if predictions is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    return predictions
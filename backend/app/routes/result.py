@@ -0,0 +1,69 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Response, status
+
+from app.core.batcher import QueueFull
+from app.core.dependencies import Principal, require_admin
+from app.schemas.fight import MAX_ID, FightResultAck, FightResultCreate
+from app.services import result_service
+from app.services.result_service import REJECTED, ResultUpdate
+
+router = APIRouter(tags=["Results"])
+
+
+@router.post("/events/{event_id}/results", response_model=FightResultAck, status_code=202)
+async def submit_fight_result(
+    result: FightResultCreate,
+    response: Response,
+    event_id: int = Path(gt=0, le=MAX_ID),
+    idempotency_key: str = Header(..., min_length=1, max_length=200),
+    wait: bool = Query(False, description="Respond once the result is written"),
+    current_user: Principal = Depends(require_admin),
+):
+    """
+    Record a fight result from a live results feed (admin only).
+
+    - Acknowledged with 202 once queued; updates are written in
+      batches (RESULT_BATCH_SIZE / RESULT_BATCH_WAIT_MS) and fighter
+      records follow each batch
+    - An update retried with the same Idempotency-Key is applied once
+    - The bout is matched by its fighters, in either corner; a bout
+      not on the card yet is added
+    - ?wait=true answers after the write: 200, 404 / 400 when the
+      update was rejected, or 503 when it could not be written
+    """
+
+    update = ResultUpdate(idempotency_key=idempotency_key, event_id=event_id, **result.model_dump())
+
+    error = result_service.check_result(update)
+    if error is not None:
+        raise HTTPException(status_code=400, detail=error)
+
+    try:
+        future = result_service.submit_result(update)
+    except QueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many results queued, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    if not wait:
+        return {"idempotency_key": idempotency_key, "status": "queued"}
+
+    try:
+        outcome = await asyncio.wrap_future(future)
+    except Exception:
+        # The write failed even on its own; nothing was recorded
+        # for the key, so the same request can be sent again
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Result could not be written, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    if outcome["status"] == REJECTED:
+        code = 404 if "not found" in outcome["error"].lower() else 400
+        raise HTTPException(status_code=code, detail=outcome["error"])
+
+    response.status_code = 200
+    return {"idempotency_key": idempotency_key, "status": outcome["status"], "fight_id": outcome["fight_id"]}
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.core.broadcast import TooManySubscribers, broadcaster
+from app.database import get_db
+from app.services import event_service, stream_service
+
+router = APIRouter(tags=["Events"])
+
+
+@router.get(
+    "/events/{event_id}/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}, 404: {}, 503: {}},
+)
+async def stream_event(
+    event_id: int,
+    last_event_id: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Live updates of a fight card as server-sent events (public endpoint).
+
+    - "fight" events carry {"op", "fight"} for every committed
+      booking, result or removal on the card; "event" events
+      carry updates and deletion of the event itself
+    - The stream is subscribed before the response starts: open
+      it, then load the card, and nothing committed in between
+      is missed
+    - Reconnects send Last-Event-ID (browsers do it themselves)
+      and get the messages missed meanwhile; a "reset" event
+      means they are gone and the card has to be reloaded
+    - 503 when this worker holds STREAM_MAX_CONNECTIONS streams
+    """
+
+    try:
+        subscription = broadcaster.subscribe(
+            stream_service.card_channel(event_id),
+            stream_service.parse_last_event_id(last_event_id),
+        )
+    except TooManySubscribers:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many open streams, retry shortly",
+            headers={"Retry-After": "5"},
+        )
+
+    try:
+        event = await run_in_threadpool(event_service.get_event_by_id, db, event_id)
+        # The stream may stay open for hours: give the connection back now
+        await run_in_threadpool(db.close)
+    except BaseException:
+        broadcaster.unsubscribe(subscription)
+        raise
+
+    if not event:
+        broadcaster.unsubscribe(subscription)
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    # Unsubscribes when the response ends
+    return stream_service.CardStreamResponse(subscription)
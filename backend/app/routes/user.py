@@ -3,8 +3,9 @@ from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.models.user import User
-from app.schemas.user import UserRoleUpdate
-from app.core.dependencies import require_admin
+from app.schemas.user import UserRoleUpdate, UserStatusUpdate
+from app.core.dependencies import Principal, require_admin
+from app.core.user_status import user_status_cache
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -13,10 +14,13 @@ def update_user_role(
     user_id: int,
     role_update: UserRoleUpdate,
     db: Session = Depends(get_db),
-    current_admin: User = Depends(require_admin),
+    current_admin: Principal = Depends(require_admin),
 ):
     """
     Admin-only endpoint to update a user's role.
+
+    Bumps the user's token version so tokens carrying
+    the old role stop being accepted.
     """
 
     user = db.query(User).filter(User.id == user_id).first()
@@ -34,12 +38,59 @@ def update_user_role(
             detail="You cannot remove your own admin privileges"
         )
 
-    user.role = role_update.role
+    if user.role != role_update.role:
+        user.role = role_update.role
+        user.token_version += 1
+
     db.commit()
     db.refresh(user)
+    user_status_cache.invalidate(user.id)
 
     return {
         "id": user.id,
         "username": user.username,
         "role": user.role
-    }
\ No newline at end of file
+    }
+
+@router.patch("/{user_id}/status")
+def update_user_status(
+    user_id: int,
+    status_update: UserStatusUpdate,
+    db: Session = Depends(get_db),
+    current_admin: Principal = Depends(require_admin),
+):
+    """
+    Admin-only endpoint to activate or deactivate a user.
+
+    Deactivation bumps the user's token version,
+    revoking every token already issued to them.
+    """
+
+    user = db.query(User).filter(User.id == user_id).first()
+
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+
+    # Prevent admin from locking themselves out
+    if user.id == current_admin.id and not status_update.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You cannot deactivate your own account"
+        )
+
+    if user.is_active != status_update.is_active:
+        user.is_active = status_update.is_active
+        user.token_version += 1
+
+    db.commit()
+    db.refresh(user)
+    user_status_cache.invalidate(user.id)
+
+    return {
+        "id": user.id,
+        "username": user.username,
+        "is_active": user.is_active
+    }
@@ -0,0 +1,76 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+from datetime import date
+
+
+class FighterAnalytics(BaseModel):
+    """
+    Fighter metrics derived from completed fights.
+
+    - Rates are fractions of wins (ko_rate = KO wins / wins)
+    - avg_finish_round covers KO and submission wins
+    - fights_last_year counts the last 365 days
+    """
+
+    fighter_id: int
+    fights: int
+    wins: int
+    losses: int
+    draws: int
+    no_contests: int
+    ko_wins: int
+    submission_wins: int
+    decision_wins: int
+    current_win_streak: int
+    longest_win_streak: int
+    ko_rate: float
+    submission_rate: float
+    decision_rate: float
+    finish_rate: float
+    avg_finish_round: Optional[float] = None
+    first_fight_date: Optional[date] = None
+    last_fight_date: Optional[date] = None
+    fights_last_year: int
+    fights_by_year: Dict[int, int] = {}
+
+
+class LeaderboardEntry(BaseModel):
+    """
+    One fighter's place on a metric leaderboard.
+    """
+
+    rank: int
+    fighter_id: int
+    first_name: str
+    last_name: str
+    value: float
+    fights: int
+
+
+class RankingEntry(BaseModel):
+    """
+    One fighter's place in the Elo rankings.
+    """
+
+    rank: int
+    fighter_id: int
+    first_name: str
+    last_name: str
+    rating: float
+    fights: int
+
+
+class RatingHistoryEntry(BaseModel):
+    """
+    Rating movement from one bout.
+
+    score is 1 for a win, 0 for a loss and 0.5 for a draw;
+    no contests and scheduled fights are not rated.
+    """
+
+    fight_id: int
+    event_date: date
+    opponent_id: int
+    score: float
+    rating_before: float
+    rating_after: float
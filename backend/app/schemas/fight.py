@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from datetime import date
 
 # -------------------------
 # Base / Create Schema
@@ -16,6 +17,14 @@ class FightCreate(BaseModel):
     winner_id: Optional[int] = None
     method: Optional[str] = None
     round: Optional[int] = None
+
+
+class FightBulkCreate(BaseModel):
+    """
+    Schema for creating a whole card of fights at once.
+    """
+
+    fights: List[FightCreate] = Field(min_length=1, max_length=500)
     
     
 # -------------------------
@@ -77,4 +86,64 @@ class FightNestedResponse(BaseModel):
     winner: Optional[FighterNested] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# -------------------------
+# Fighter History Entry
+# -------------------------
+
+class FightHistoryEntry(BaseModel):
+    """
+    One bout in a fighter's career timeline,
+    seen from that fighter's side.
+
+    result: win, loss, draw, no contest, or null if not fought yet.
+    """
+
+    fight_id: int
+    event_id: int
+    event_name: Optional[str] = None
+    event_date: date
+    opponent: FighterNested
+    result: Optional[str] = None
+    method: Optional[str] = None
+    round: Optional[int] = None
+
+
+# -------------------------
+# Live Results
+# -------------------------
+
+# Ids are Integer columns: anything outside 1..2**31 - 1 can't
+# exist and is rejected before the update is queued
+MAX_ID = 2**31 - 1
+
+class FightResultCreate(BaseModel):
+    """
+    One fight result from a live results feed.
+
+    The bout is the event in the path plus the two fighters,
+    in either corner. No winner with a method is a draw, or a
+    no contest for "NC" / "No Contest".
+    """
+
+    fighter_1_id: int = Field(gt=0, le=MAX_ID)
+    fighter_2_id: int = Field(gt=0, le=MAX_ID)
+    winner_id: Optional[int] = Field(None, gt=0, le=MAX_ID)
+    method: str = Field(min_length=1)
+    round: Optional[int] = Field(None, ge=1, le=5)
+
+
+class FightResultAck(BaseModel):
+    """
+    Acknowledgement of a result update.
+
+    queued: accepted, written with the next batch
+    applied / duplicate: written (only with ?wait=true); duplicate
+    means the idempotency key had been applied before
+    """
+
+    idempotency_key: str
+    status: Literal["queued", "applied", "duplicate"]
+    fight_id: Optional[int] = None
@@ -1,7 +1,19 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
 from datetime import date
 
+# The hand-entered wins/losses/draws drift from the fights table;
+# the record derived from fights is GET /fighters/{id}/record
+RECORD_FIELDS = ("wins", "losses", "draws")
+RECORD_DEPRECATED = (
+    "Hand-entered at creation and never updated from fights; "
+    "use GET /fighters/{fighter_id}/record"
+)
+
+
+def record_field(default=...):
+    return Field(default, deprecated=RECORD_DEPRECATED, json_schema_extra={"readOnly": True})
+
 
 class FighterCreate(BaseModel):
     """
@@ -20,9 +32,10 @@ class FighterCreate(BaseModel):
     height_cm: Optional[int] = None
     reach_cm: Optional[int] = None
     stance: Optional[str] = None
-    wins: int = 0
-    losses: int = 0
-    draws: int = 0
+    # Initial record (e.g. an imported career record), read-only afterwards
+    wins: int = record_field(0)
+    losses: int = record_field(0)
+    draws: int = record_field(0)
 
 
 class FighterResponse(BaseModel):
@@ -42,9 +55,9 @@ class FighterResponse(BaseModel):
     height_cm: Optional[int] = None
     reach_cm: Optional[int] = None
     stance: Optional[str] = None
-    wins: int
-    losses: int
-    draws: int
+    wins: int = record_field()
+    losses: int = record_field()
+    draws: int = record_field()
 
     class Config:
         # Allows Pydantic to read data directly from SQLAlchemy ORM objects
@@ -57,6 +70,7 @@ class FighterUpdate(BaseModel):
 
     All fields are optional.
     Only provided fields will be updated.
+    wins/losses/draws are read-only and rejected.
     """
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -65,6 +79,63 @@ class FighterUpdate(BaseModel):
     height_cm: Optional[int] = None
     reach_cm: Optional[int] = None
     stance: Optional[str] = None
-    wins: Optional[int] = None
-    losses: Optional[int] = None
-    draws: Optional[int] = None
\ No newline at end of file
+
+    @model_validator(mode="before")
+    @classmethod
+    def reject_record(cls, data):
+        if isinstance(data, dict):
+            for field in RECORD_FIELDS:
+                if field in data:
+                    raise ValueError(f"{field} is read-only: {RECORD_DEPRECATED}")
+        return data
+
+class FighterSearchResult(BaseModel):
+    """
+    Fighter matched by a name search.
+
+    score is the match similarity (0 to 1) in search mode,
+    null in autocomplete mode.
+    """
+
+    id: int
+    first_name: str
+    last_name: str
+    nickname: Optional[str] = None
+    score: Optional[float] = None
+
+
+class FighterImportError(BaseModel):
+    """
+    Validation or database errors for one imported row.
+    """
+
+    row: int
+    errors: List[str]
+
+
+class FighterImportReport(BaseModel):
+    """
+    Result of a bulk fighter import.
+
+    Rows are numbered from 1, not counting the CSV header.
+    """
+
+    received: int
+    inserted: int
+    failed: int
+    errors: List[FighterImportError] = []
+
+
+class FighterRecord(BaseModel):
+    """
+    Fighter record derived from recorded fights.
+
+    Unlike the hand-entered wins/losses/draws on the fighter,
+    this always matches the fights table.
+    """
+
+    fighter_id: int
+    wins: int
+    losses: int
+    draws: int
+    no_contests: int
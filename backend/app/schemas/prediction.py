@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+from app.schemas.fight import MAX_ID
+
+
+class MatchupRequest(BaseModel):
+    """
+    Schema for scoring one matchup.
+    """
+
+    fighter_1_id: int = Field(gt=0, le=MAX_ID)
+    fighter_2_id: int = Field(gt=0, le=MAX_ID)
+
+
+class MatchupBatchRequest(BaseModel):
+    """
+    Schema for scoring many matchups at once (e.g. a what-if sweep).
+    """
+
+    matchups: List[MatchupRequest] = Field(min_length=1, max_length=10000)
+
+
+class MatchupPrediction(BaseModel):
+    """
+    Predicted win probabilities for a matchup.
+
+    The two probabilities always add up to 1 (draws are not modelled).
+    """
+
+    fighter_1_id: int
+    fighter_2_id: int
+    fighter_1_win_probability: float
+    fighter_2_win_probability: float
+
+
+class CardPrediction(MatchupPrediction):
+    """
+    Prediction for one fight on an event card.
+    """
+
+    fight_id: int
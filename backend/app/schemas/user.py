@@ -45,4 +45,9 @@ class UserRoleUpdate(BaseModel):
     Literal restricts valid role, prevents invalid role injection, and makes
     schema self-validating
     """
-    role: Literal["user", "admin"]
\ No newline at end of file
+    role: Literal["user", "admin"]
+class UserStatusUpdate(BaseModel):
+    """
+    Activate or deactivate a user account.
+    """
+    is_active: bool
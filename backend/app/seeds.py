@@ -1,9 +1,19 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
 from sqlalchemy.orm import Session
 
 import app.models # ensures all models are registered
 
+from app.analytics.features import training_set
+from app.analytics.model import OutcomeModel
+from app.analytics.ratings import RatingEngine
+from app.dataset import generate_dataset
 from app.database import SessionLocal
 from app.models.fighter import Fighter
+from app.services import fighter_import_service, stats_service
 
 
 def seed_fighters(db: Session):
@@ -38,11 +48,91 @@ def seed_fighters(db: Session):
     db.commit()
 
 
-def main():
+def import_fighters(db: Session, path: Path, fmt: str | None, batch_size: int):
+    """
+    Bulk import fighters from a CSV or JSON lines file.
+
+    Format defaults to the file extension (.csv, otherwise JSON lines).
+    """
+
+    if fmt is None:
+        fmt = "csv" if path.suffix.lower() == ".csv" else "jsonl"
+
+    content = path.read_text(encoding="utf-8-sig")
+
+    return fighter_import_service.bulk_create_fighters(db, content, fmt, batch_size)
+
+
+def train_model(db: Session, out: Path):
+    """
+    Fit the outcome model on every recorded fight and save it.
+
+    Point this file at PREDICTION_MODEL_PATH to serve it.
+    """
+
+    X, y = training_set(db, RatingEngine().pre_bout_ratings(db))
+    if len(y) == 0:
+        raise SystemExit("No fights with a winner to train on.")
+
+    model = OutcomeModel.fit(X, y)
+    model.save(out)
+
+    return model
+
+
+def main(argv=None):
+    """
+    Usage:
+        python -m app.seeds                          # insert sample fighters
+        python -m app.seeds import-fighters roster.csv
+        python -m app.seeds import-fighters roster.jsonl --batch-size 5000
+        python -m app.seeds rebuild-stats           # recompute fighter records
+        python -m app.seeds train-model model.json  # fit the prediction model
+        python -m app.seeds generate --fighters 50000 --events 20000 --fights 300000
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m app.seeds")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("seed", help="Insert sample fighters (default)")
+
+    import_parser = commands.add_parser("import-fighters", help="Bulk import fighters")
+    import_parser.add_argument("path", type=Path)
+    import_parser.add_argument("--format", choices=fighter_import_service.FORMATS)
+    import_parser.add_argument("--batch-size", type=int, default=1000)
+
+    commands.add_parser("rebuild-stats", help="Recompute fighter records from fights")
+
+    train_parser = commands.add_parser("train-model", help="Fit the prediction model")
+    train_parser.add_argument("out", type=Path)
+
+    generate_parser = commands.add_parser("generate", help="Insert a synthetic dataset")
+    generate_parser.add_argument("--fighters", type=int, default=50000)
+    generate_parser.add_argument("--events", type=int, default=20000)
+    generate_parser.add_argument("--fights", type=int, default=300000)
+    generate_parser.add_argument("--seed", type=int, default=7)
+
+    args = parser.parse_args(argv)
+
     db = SessionLocal()
     try:
-        seed_fighters(db)
-        print("Seed data inserted successfully.")
+        if args.command == "import-fighters":
+            report = import_fighters(db, args.path, args.format, args.batch_size)
+            print(json.dumps(report, indent=2))
+            if report["failed"]:
+                sys.exit(1)
+        elif args.command == "rebuild-stats":
+            count = stats_service.rebuild_fighter_stats(db)
+            print(f"Rebuilt records for {count} fighters.")
+        elif args.command == "train-model":
+            model = train_model(db, args.out)
+            print(f"Trained on {model.trained_on // 2} fights, saved to {args.out}.")
+        elif args.command == "generate":
+            counts = generate_dataset(db, args.fighters, args.events, args.fights, args.seed)
+            print(json.dumps(counts, indent=2))
+        else:
+            seed_fighters(db)
+            print("Seed data inserted successfully.")
     finally:
         db.close()
 
@@ -0,0 +1,99 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.analytics import analytics_engine, rating_engine
+from app.models.fighter import Fighter
+
+
+def get_fighter_analytics(db: Session, fighter_id: int):
+    """
+    Read one fighter's metrics from the analytics cache.
+
+    Returns None if the fighter does not exist.
+    """
+
+    if db.get(Fighter, fighter_id) is None:
+        return None
+
+    return analytics_engine.fighter_analytics(db, fighter_id)
+
+
+def _fighter_names(db: Session, fighter_ids: list[int]) -> dict:
+    return {
+        row.id: row
+        for row in db.execute(
+            select(Fighter.id, Fighter.first_name, Fighter.last_name)
+            .where(Fighter.id.in_(fighter_ids))
+        )
+    }
+
+
+def get_leaderboard(db: Session, metric: str, limit: int, min_fights: int) -> list[dict]:
+    """
+    Rank fighters by a cached metric.
+
+    Steps:
+    - Take the top ids from the analytics cache
+    - Load their names with one IN query
+    """
+
+    top = analytics_engine.leaderboard(db, metric, limit, min_fights)
+    if not top:
+        return []
+
+    names = _fighter_names(db, [fighter_id for fighter_id, _, _ in top])
+
+    return [
+        {
+            "rank": rank,
+            "fighter_id": fighter_id,
+            "first_name": names[fighter_id].first_name,
+            "last_name": names[fighter_id].last_name,
+            "value": value,
+            "fights": fights,
+        }
+        for rank, (fighter_id, value, fights) in enumerate(top, start=1)
+        if fighter_id in names
+    ]
+
+
+def get_rankings(db: Session, limit: int, min_fights: int) -> list[dict]:
+    """
+    Fighters ranked by current Elo rating.
+
+    Steps:
+    - Slice the rating engine's cached ordering
+    - Load names with one IN query
+    """
+
+    top = rating_engine.rankings(db, limit, min_fights)
+    if not top:
+        return []
+
+    names = _fighter_names(db, [fighter_id for fighter_id, _, _ in top])
+
+    return [
+        {
+            "rank": rank,
+            "fighter_id": fighter_id,
+            "first_name": names[fighter_id].first_name,
+            "last_name": names[fighter_id].last_name,
+            "rating": rating,
+            "fights": fights,
+        }
+        for rank, (fighter_id, rating, fights) in enumerate(top, start=1)
+        if fighter_id in names
+    ]
+
+
+def get_rating_history(db: Session, fighter_id: int):
+    """
+    A fighter's rating over time.
+
+    Returns None if the fighter does not exist.
+    """
+
+    if db.get(Fighter, fighter_id) is None:
+        return None
+
+    return rating_engine.history(db, fighter_id)
@@ -0,0 +1,122 @@
+from datetime import date
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import split_page
+from app.models.event import Event
+from app.schemas.event import EventCreate
+from app.services.event_service import (
+    card_load_options,
+    event_card_version_statement,
+    event_page_key,
+    event_version_statement,
+    events_page_statement,
+    events_version_statement,
+)
+
+# Async counterparts of event_service.
+# Same inputs and return values, awaited on an AsyncSession.
+
+
+async def create_event(db: AsyncSession, event_data: EventCreate):
+    """
+    Create a new event.
+    """
+
+    event = Event(**event_data.model_dump())
+    db.add(event)
+    await db.commit()
+    await db.refresh(event)
+
+    return event
+
+
+async def get_events(
+    db: AsyncSession,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    location: str | None = None,
+    descending: bool = False,
+    limit: int = 50,
+    after: tuple[date, int] | None = None,
+):
+    """
+    Retrieve one page of events ordered by (event_date, id).
+
+    Returns (rows, next_key), see event_service.get_events.
+    """
+
+    stmt = events_page_statement(
+        date_from, date_to, location, descending, limit, after
+    )
+    result = await db.execute(stmt)
+
+    return split_page(result.all(), limit, event_page_key)
+
+
+async def get_event_by_id(db: AsyncSession, event_id: int):
+    return await db.get(Event, event_id)
+
+
+async def get_event_card(db: AsyncSession, event_id: int):
+    """
+    Retrieve an event with its fights and fighters eagerly loaded.
+
+    Eager loading is required here: lazy loads are not allowed
+    on an AsyncSession.
+    """
+
+    stmt = select(Event).options(card_load_options()).where(Event.id == event_id)
+    result = await db.scalars(stmt)
+
+    return result.first()
+
+
+async def get_event_cards(db: AsyncSession, event_ids: list[int]):
+    """
+    Retrieve several events with their cards eagerly loaded.
+    """
+
+    stmt = (
+        select(Event)
+        .options(card_load_options())
+        .where(Event.id.in_(event_ids))
+        .order_by(Event.event_date, Event.id)
+    )
+    result = await db.scalars(stmt)
+
+    return result.all()
+
+
+async def delete_event(db: AsyncSession, event_id: int):
+    """
+    Delete an event.
+
+    Returns None if the event does not exist.
+    """
+
+    event = await db.get(Event, event_id)
+
+    if not event:
+        return None
+
+    await db.delete(event)
+    await db.commit()
+
+    return event
+
+
+async def get_event_version(db: AsyncSession, event_id: int):
+    result = await db.execute(event_version_statement(event_id))
+    return result.scalar_one_or_none()
+
+
+async def get_events_version(db: AsyncSession) -> tuple:
+    result = await db.execute(events_version_statement())
+    return tuple(result.one())
+
+
+async def get_event_card_version(db: AsyncSession, event_id: int) -> tuple | None:
+    row = (await db.execute(event_card_version_statement(event_id))).first()
+    return tuple(row) if row is not None else None
@@ -0,0 +1,35 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.fight import Fight
+from app.schemas.fight import FightCreate
+from app.services.fight_service import (
+    existing_ids_statement,
+    referenced_ids,
+    split_existing,
+    validate_fight,
+)
+
+# Async counterpart of fight_service.
+
+
+async def create_fight(db: AsyncSession, fight_data: FightCreate):
+    """
+    Create a Fight with the same validation as fight_service.create_fight.
+
+    Returns the Fight, or {"error": message} when validation fails.
+    """
+
+    event_ids, fighter_ids = referenced_ids([fight_data])
+    result = await db.execute(existing_ids_statement(event_ids, fighter_ids))
+    events, fighters = split_existing(result.all())
+
+    error = validate_fight(fight_data, events, fighters)
+    if error is not None:
+        return {"error": error}
+
+    fight = Fight(**fight_data.model_dump())
+    db.add(fight)
+    await db.flush()
+    await db.commit()
+
+    return fight
@@ -0,0 +1,97 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import split_page
+from app.models.fighter import Fighter
+from app.schemas.fighter import FighterCreate, FighterUpdate
+from app.services.fighter_service import (
+    fighter_page_key,
+    fighter_version_statement,
+    fighters_page_statement,
+    fighters_version_statement,
+)
+
+# Async counterparts of fighter_service.
+# Same inputs and return values, awaited on an AsyncSession.
+
+
+async def create_fighter(db: AsyncSession, fighter_data: FighterCreate):
+    """
+    Create a new fighter.
+    """
+
+    fighter = Fighter(**fighter_data.model_dump())
+    db.add(fighter)
+    await db.commit()
+    await db.refresh(fighter)
+
+    return fighter
+
+
+async def get_fighters(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    after: tuple[str, int] | None = None,
+):
+    """
+    Retrieve one page of fighters ordered by (last_name, id).
+
+    Returns (rows, next_key), see fighter_service.get_fighters.
+    """
+
+    result = await db.execute(fighters_page_statement(skip, limit, after))
+
+    return split_page(result.all(), limit, fighter_page_key)
+
+
+async def get_fighter_by_id(db: AsyncSession, fighter_id: int):
+    return await db.get(Fighter, fighter_id)
+
+
+async def update_fighter(db: AsyncSession, fighter_id: int, fighter_data: FighterUpdate):
+    """
+    Apply a partial update to a fighter.
+
+    Returns None if the fighter does not exist.
+    """
+
+    fighter = await db.get(Fighter, fighter_id)
+
+    if not fighter:
+        return None
+
+    for key, value in fighter_data.model_dump(exclude_unset=True).items():
+        setattr(fighter, key, value)
+
+    await db.commit()
+    await db.refresh(fighter)
+
+    return fighter
+
+
+async def delete_fighter(db: AsyncSession, fighter_id: int):
+    """
+    Delete a fighter.
+
+    Returns None if the fighter does not exist.
+    """
+
+    fighter = await db.get(Fighter, fighter_id)
+
+    if not fighter:
+        return None
+
+    await db.delete(fighter)
+    await db.commit()
+
+    return fighter
+
+
+async def get_fighter_version(db: AsyncSession, fighter_id: int):
+    result = await db.execute(fighter_version_statement(fighter_id))
+    return result.scalar_one_or_none()
+
+
+async def get_fighters_version(db: AsyncSession) -> tuple:
+    result = await db.execute(fighters_version_statement())
+    return tuple(result.one())
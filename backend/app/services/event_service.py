@@ -1,6 +1,17 @@
-from sqlalchemy.orm import Session
+from datetime import date
+
+from sqlalchemy import and_, func, or_, select, union
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from app.core.pagination import split_page
+from app.core.serialization import response_columns
 from app.models.event import Event
-from app.schemas.event import EventCreate
+from app.models.fight import Fight
+from app.models.fighter import Fighter
+from app.schemas.event import EventCreate, EventResponse
+
+# Columns served by list endpoints (one per EventResponse field)
+EVENT_LIST_COLUMNS = response_columns(Event, EventResponse)
 
 
 def create_event(db: Session, event_data: EventCreate):
@@ -36,6 +47,90 @@ def get_all_events(db: Session):
     return db.query(Event).all()
 
 
+def events_page_statement(
+    date_from: date | None = None,
+    date_to: date | None = None,
+    location: str | None = None,
+    descending: bool = False,
+    limit: int = 50,
+    after: tuple[date, int] | None = None,
+):
+    """
+    Build the SELECT for one page of events ordered by (event_date, id).
+
+    Shared by the sync and async services.
+    Selects limit + 1 rows so callers can tell whether another page exists.
+    Only EventResponse columns are selected: rows, not ORM objects.
+    """
+
+    stmt = select(*EVENT_LIST_COLUMNS)
+
+    if date_from is not None:
+        stmt = stmt.where(Event.event_date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(Event.event_date <= date_to)
+    if location:
+        stmt = stmt.where(Event.location.ilike(f"%{location}%"))
+
+    if after is not None:
+        event_date, event_id = after
+        if descending:
+            stmt = stmt.where(
+                or_(
+                    Event.event_date < event_date,
+                    and_(Event.event_date == event_date, Event.id < event_id),
+                )
+            )
+        else:
+            stmt = stmt.where(
+                or_(
+                    Event.event_date > event_date,
+                    and_(Event.event_date == event_date, Event.id > event_id),
+                )
+            )
+
+    if descending:
+        stmt = stmt.order_by(Event.event_date.desc(), Event.id.desc())
+    else:
+        stmt = stmt.order_by(Event.event_date, Event.id)
+
+    return stmt.limit(limit + 1)
+
+
+def event_page_key(event) -> tuple[date, int]:
+    return (event.event_date, event.id)
+
+
+def get_events(
+    db: Session,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    location: str | None = None,
+    descending: bool = False,
+    limit: int = 50,
+    after: tuple[date, int] | None = None,
+):
+    """
+    Retrieve one page of events ordered by (event_date, id).
+
+    - date_from / date_to are inclusive bounds on event_date
+    - location is a case-insensitive substring match
+    - after is the (event_date, id) of the last row already seen
+
+    Returns:
+        (rows, next_key) where rows are EventResponse-shaped Row
+        objects and next_key is the (event_date, id) of the last row,
+        or None when there are no more rows.
+    """
+
+    stmt = events_page_statement(
+        date_from, date_to, location, descending, limit, after
+    )
+    rows = db.execute(stmt).all()
+
+    return split_page(rows, limit, event_page_key)
+
+
 def get_event_by_id(db: Session, event_id: int):
     """
     Retrieve a single event by its ID.
@@ -48,6 +143,116 @@ def get_event_by_id(db: Session, event_id: int):
     return db.query(Event).filter(Event.id == event_id).first()
 
 
+def event_version_statement(event_id: int):
+    """
+    updated_at of one event: the version behind its ETag.
+    """
+
+    return select(Event.updated_at).where(Event.id == event_id)
+
+
+def events_version_statement():
+    """
+    Collection version of the event list: (max updated_at, count).
+    """
+
+    return select(func.max(Event.updated_at), func.count(Event.id))
+
+
+def event_card_version_statement(event_id: int):
+    """
+    Version of an event card in one round trip.
+
+    (event updated_at, latest fight updated_at, fight count,
+    latest updated_at of the fighters on the card), or no row
+    if the event does not exist.
+    """
+
+    card_fighters = union(
+        select(Fight.fighter_1_id).where(Fight.event_id == event_id),
+        select(Fight.fighter_2_id).where(Fight.event_id == event_id),
+    )
+
+    return select(
+        Event.updated_at,
+        select(func.max(Fight.updated_at))
+        .where(Fight.event_id == event_id)
+        .scalar_subquery(),
+        select(func.count(Fight.id))
+        .where(Fight.event_id == event_id)
+        .scalar_subquery(),
+        select(func.max(Fighter.updated_at))
+        .where(Fighter.id.in_(card_fighters))
+        .scalar_subquery(),
+    ).where(Event.id == event_id)
+
+
+def get_event_version(db: Session, event_id: int):
+    """
+    Returns the event's updated_at, or None if it does not exist.
+    """
+
+    return db.execute(event_version_statement(event_id)).scalar_one_or_none()
+
+
+def get_events_version(db: Session) -> tuple:
+    return tuple(db.execute(events_version_statement()).one())
+
+
+def get_event_card_version(db: Session, event_id: int) -> tuple | None:
+    row = db.execute(event_card_version_statement(event_id)).first()
+    return tuple(row) if row is not None else None
+
+
+def card_load_options():
+    """
+    Loader options that fetch the full fight card up front.
+
+    - selectinload: one extra query for all fights of all events
+    - joinedload: fighters and winner joined into that same query
+
+    Two queries total, regardless of how many fights or events.
+    Shared by the sync and async services.
+    """
+
+    return selectinload(Event.fights).options(
+        joinedload(Fight.fighter_1),
+        joinedload(Fight.fighter_2),
+        joinedload(Fight.winner),
+    )
+
+
+def get_event_card(db: Session, event_id: int):
+    """
+    Retrieve an event with its fights and fighters eagerly loaded.
+
+    Returns:
+        Event ORM object if found,
+        None if not found.
+    """
+
+    stmt = select(Event).options(card_load_options()).where(Event.id == event_id)
+
+    return db.scalars(stmt).first()
+
+
+def get_event_cards(db: Session, event_ids: list[int]):
+    """
+    Retrieve several events with their cards eagerly loaded.
+
+    Unknown IDs are skipped. Ordered by event_date.
+    """
+
+    stmt = (
+        select(Event)
+        .options(card_load_options())
+        .where(Event.id.in_(event_ids))
+        .order_by(Event.event_date, Event.id)
+    )
+
+    return db.scalars(stmt).all()
+
+
 def delete_event(db: Session, event_id: int):
     """
     Delete an event by ID.
@@ -0,0 +1,147 @@
+import csv
+import io
+import zlib
+from datetime import datetime, timedelta
+
+import orjson
+from sqlalchemy import func, select
+
+from app.core.conditional import as_utc
+from app.core.serialization import response_columns
+from app.core.settings import settings
+from app.database import SessionLocal
+from app.models.event import Event
+from app.models.fight import Fight
+from app.models.fighter import Fighter
+from app.schemas.event import EventResponse
+from app.schemas.fight import FightResponse
+from app.schemas.fighter import FighterResponse
+
+# Exported tables: the response schema's columns plus updated_at,
+# which clients keep to ask for the next incremental pull
+EXPORT_TABLES = {
+    "fighters": (Fighter, response_columns(Fighter, FighterResponse) + [Fighter.updated_at]),
+    "events": (Event, response_columns(Event, EventResponse) + [Event.updated_at]),
+    "fights": (Fight, response_columns(Fight, FightResponse) + [Fight.updated_at]),
+}
+
+FORMATS = ("ndjson", "csv")
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Rows fetched from the server-side cursor per round trip
+# (and encoded into one chunk of the response body)
+BATCH_SIZE = 1000
+
+
+def export_statement(table: str, updated_since: datetime | None = None):
+    """
+    SELECT of the exported columns in id order.
+
+    updated_since keeps rows with updated_at >= updated_since;
+    ">=" so a row written in the same instant as the previous
+    pull is sent again rather than missed.
+    """
+
+    model, columns = EXPORT_TABLES[table]
+    stmt = select(*columns).order_by(model.id)
+    if updated_since is not None:
+        stmt = stmt.where(model.updated_at >= updated_since)
+    return stmt
+
+
+def export_as_of() -> datetime:
+    """
+    The updated_since for the pull after an export that starts now.
+
+    Read from the database clock before the export's SELECT, then
+    moved back by EXPORT_OVERLAP_SECONDS: a write that flushed
+    (and set updated_at) before that point but committed after
+    the export's snapshot is still sent by the next pull. Rows in
+    the window are sent twice; clients upsert by id.
+    """
+
+    db = SessionLocal()
+    try:
+        now = as_utc(db.scalar(select(func.now())))
+    finally:
+        db.close()
+    return now - timedelta(seconds=settings.EXPORT_OVERLAP_SECONDS)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_batches(batches, keys: list[str], fmt: str):
+    """
+    Encode row batches as NDJSON lines or CSV (header first).
+    Yields one bytes chunk per batch.
+    """
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(keys)
+        yield buffer.getvalue().encode()
+
+        for rows in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(value) for value in row] for row in rows)
+            yield buffer.getvalue().encode()
+        return
+
+    for rows in batches:
+        yield b"".join(
+            orjson.dumps(dict(zip(keys, row))) + b"\n" for row in rows
+        )
+
+
+def gzip_chunks(chunks):
+    """
+    Compress a stream of chunks into one gzip member, chunk by chunk.
+    """
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(table: str, fmt: str, updated_since: datetime | None = None,
+                  gzip: bool = False):
+    """
+    Generator over the body of an export.
+
+    Steps:
+    - Open a session of its own: the request's session is
+      closed before a streaming body is sent
+    - Fetch with yield_per, which streams from a server-side
+      cursor on PostgreSQL, so memory stays at one batch
+      whatever the table size
+    - Encode each batch as it arrives, optionally gzipped
+    """
+
+    def chunks():
+        db = SessionLocal()
+        try:
+            result = db.execute(
+                export_statement(table, updated_since).execution_options(yield_per=BATCH_SIZE)
+            )
+            yield from encode_batches(result.partitions(), list(result.keys()), fmt)
+        finally:
+            db.close()
+
+    if gzip:
+        return gzip_chunks(chunks())
+    return chunks()
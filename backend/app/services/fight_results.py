@@ -0,0 +1,32 @@
+# How a fight ended from one fighter's point of view.
+# Shared by fight history, fighter records and analytics so they agree.
+
+WIN = "win"
+LOSS = "loss"
+DRAW = "draw"
+NO_CONTEST = "no contest"
+
+# Methods recorded for fights with no winner that don't count as a draw
+NO_CONTEST_METHODS = ("nc", "no contest")
+
+
+def is_no_contest(method: str | None) -> bool:
+    return method is not None and method.strip().lower() in NO_CONTEST_METHODS
+
+
+def result_for(fighter_id: int, winner_id: int | None, method: str | None) -> str | None:
+    """
+    Result of a fight for fighter_id.
+
+    - winner set: win / loss
+    - no winner but a method: no contest or draw
+    - no winner and no method: not fought yet (None)
+    """
+
+    if winner_id is not None:
+        return WIN if winner_id == fighter_id else LOSS
+
+    if method is None:
+        return None
+
+    return NO_CONTEST if is_no_contest(method) else DRAW
@@ -1,61 +1,149 @@
-from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import literal, select, union_all
 from sqlalchemy.orm import Session
-from typing import List
 
-from app.database import get_db
 from app.models.fight import Fight
 from app.models.fighter import Fighter
 from app.models.event import Event
-from app.schemas.fight import FightCreate, FightResponse
-from app.core.dependencies import require_admin
-from app.models.user import User
+from app.schemas.fight import FightCreate
 
-router = APIRouter()
 
-@router.post("/fights", response_model=FightResponse, status_code=201)
-def create_fight(
-    fight: FightCreate, 
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin)
-):
+def existing_ids_statement(event_ids: set[int], fighter_ids: set[int]):
+    """
+    One query that returns which of the referenced IDs exist.
+
+    Rows are ("event", id) or ("fighter", id).
+    Shared by the sync and async services.
+    """
+
+    return union_all(
+        select(literal("event").label("kind"), Event.id.label("id"))
+        .where(Event.id.in_(event_ids)),
+        select(literal("fighter").label("kind"), Fighter.id.label("id"))
+        .where(Fighter.id.in_(fighter_ids)),
+    )
+
+
+def referenced_ids(fights: list[FightCreate]) -> tuple[set[int], set[int]]:
+    """
+    Collect every event and fighter ID referenced by the fights.
+    """
+
+    event_ids = {fight.event_id for fight in fights}
+    fighter_ids = set()
+    for fight in fights:
+        fighter_ids.update((fight.fighter_1_id, fight.fighter_2_id))
+        if fight.winner_id is not None:
+            fighter_ids.add(fight.winner_id)
+
+    return event_ids, fighter_ids
+
+
+def split_existing(rows) -> tuple[set[int], set[int]]:
+    events = {row.id for row in rows if row.kind == "event"}
+    fighters = {row.id for row in rows if row.kind == "fighter"}
+    return events, fighters
+
+
+def validate_fight(fight: FightCreate, events: set[int], fighters: set[int]) -> str | None:
+    """
+    Check a fight against the set of existing IDs.
+
+    Checks run in the same order as before (event, fighter 1,
+    fighter 2, self-fight, winner), so the first failing rule
+    decides the error.
+
+    Returns the error message, or None if the fight is valid.
+    """
+
+    if fight.event_id not in events:
+        return "Event not found"
+
+    if fight.fighter_1_id not in fighters:
+        return "Fighter 1 not found"
+
+    if fight.fighter_2_id not in fighters:
+        return "Fighter 2 not found"
+
+    # Prevent same fighter fighting themselves
+    if fight.fighter_1_id == fight.fighter_2_id:
+        return "A fighter cannot fight themselves"
+
+    if fight.winner_id is not None:
+        if fight.winner_id not in fighters:
+            return "Winner not found"
+
+        if fight.winner_id not in (fight.fighter_1_id, fight.fighter_2_id):
+            return "Winner must be one of the two fighters"
+
+    return None
+
+
+def create_fight(db: Session, fight_data: FightCreate):
     """
     Create a Fight with validation:
     - Event must exist
     - Fighters must exist
     - Fighters cannot be the same person
+    - Winner (if set) must exist and be one of the fighters
+
+    Round trips:
+    1. One SELECT checks every referenced ID
+    2. INSERT ... RETURNING id
+    3. COMMIT (no refresh: the instance is detached before commit,
+       so its loaded attributes are not expired)
+
+    Returns the Fight, or {"error": message} when validation fails.
+    """
+
+    event_ids, fighter_ids = referenced_ids([fight_data])
+    events, fighters = split_existing(
+        db.execute(existing_ids_statement(event_ids, fighter_ids)).all()
+    )
+
+    error = validate_fight(fight_data, events, fighters)
+    if error is not None:
+        return {"error": error}
+
+    fight = Fight(**fight_data.model_dump())
+    db.add(fight)
+    db.flush()
+    db.expunge(fight)
+    db.commit()
+
+    return fight
+
+
+def create_fights(db: Session, fights_data: list[FightCreate]):
     """
+    Create a whole card of fights in one transaction.
 
-    # Validate event exists
-    event = db.query(Event).filter(Event.id == fight.event_id).first()
-    if event is None:
-        raise HTTPException(status_code=404, detail="Event not found")
+    - All referenced IDs are validated with a single query
+    - If any fight is invalid nothing is inserted
+    - Inserts are batched by SQLAlchemy (insertmanyvalues)
 
-    # Validate fighter 1 exists
-    fighter_1 = db.query(Fighter).filter(Fighter.id == fight.fighter_1_id).first()
-    if fighter_1 is None:
-        raise HTTPException(status_code=404, detail="Fighter 1 not found")
+    Returns the list of Fights, or {"errors": [{"index", "error"}, ...]}
+    listing every invalid fight.
+    """
 
-    # Validate fighter 2 exists
-    fighter_2 = db.query(Fighter).filter(Fighter.id == fight.fighter_2_id).first()
-    if fighter_2 is None:
-        raise HTTPException(status_code=404, detail="Fighter 2 not found")
+    event_ids, fighter_ids = referenced_ids(fights_data)
+    events, fighters = split_existing(
+        db.execute(existing_ids_statement(event_ids, fighter_ids)).all()
+    )
 
-    # Prevent same fighter fighting themselves
-    if fight.fighter_1_id == fight.fighter_2_id:
-        raise HTTPException(
-            status_code=400,
-            detail="A fighter cannot fight themselves"
-        )
+    errors = []
+    for index, fight_data in enumerate(fights_data):
+        error = validate_fight(fight_data, events, fighters)
+        if error is not None:
+            errors.append({"index": index, "error": error})
 
-    # Optional: validate winner exists if provided
-    if fight.winner_id is not None:
-        winner = db.query(Fighter).filter(Fighter.id == fight.winner_id).first()
-        if winner is None:
-            raise HTTPException(status_code=404, detail="Winner not found")
+    if errors:
+        return {"errors": errors}
 
-    db_fight = Fight(**fight.model_dump())
-    db.add(db_fight)
+    fights = [Fight(**fight_data.model_dump()) for fight_data in fights_data]
+    db.add_all(fights)
+    db.flush()
+    for fight in fights:
+        db.expunge(fight)
     db.commit()
-    db.refresh(db_fight)
 
-    return db_fight
\ No newline at end of file
+    return fights
@@ -0,0 +1,201 @@
+import csv
+import io
+import json
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.cache import response_cache
+from app.core.search import fighter_search_index
+from app.models.fighter import Fighter
+from app.schemas.fighter import FighterCreate
+
+FORMATS = ("csv", "jsonl")
+
+# Columns written by the bulk loader, in COPY order
+COLUMNS = list(FighterCreate.model_fields)
+
+
+def parse_rows(content: str, fmt: str):
+    """
+    Parse a CSV or JSON lines document into raw row dicts.
+
+    Yields (row_number, data, error) with 1-based data row numbers
+    (the CSV header is not counted). Exactly one of data / error is set.
+    Empty CSV cells become None so optional fields take their defaults.
+    """
+
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(content))
+        for row_number, row in enumerate(reader, start=1):
+            yield row_number, {
+                key: (value if value != "" else None)
+                for key, value in row.items()
+                if key is not None
+            }, None
+        return
+
+    row_number = 0
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield row_number, None, f"Invalid JSON: {exc.msg}"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, "Each line must be a JSON object"
+            continue
+        yield row_number, data, None
+
+
+def validate_rows(content: str, fmt: str):
+    """
+    Validate every row with FighterCreate.
+
+    Returns:
+        (valid, errors) where valid is a list of (row_number, dict)
+        ready to insert and errors is the per-row error report.
+    """
+
+    valid = []
+    errors = []
+
+    for row_number, data, error in parse_rows(content, fmt):
+        if error is not None:
+            errors.append({"row": row_number, "errors": [error]})
+            continue
+
+        # CSV cells are strings; drop None so schema defaults apply
+        data = {key: value for key, value in data.items() if value is not None}
+
+        try:
+            fighter = FighterCreate(**data)
+        except ValidationError as exc:
+            errors.append({
+                "row": row_number,
+                "errors": [
+                    f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+                    for err in exc.errors()
+                ],
+            })
+            continue
+
+        valid.append((row_number, fighter.model_dump()))
+
+    return valid, errors
+
+
+def _copy_rows(db: Session, rows: list[dict]):
+    """
+    Load rows with Postgres COPY.
+
+    NULL is spelled \\N so empty strings survive the round trip.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow(
+            "\\N" if row[column] is None else row[column] for column in COLUMNS
+        )
+
+    statement = (
+        f"COPY {Fighter.__tablename__} ({', '.join(COLUMNS)}) "
+        "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+
+    cursor = db.connection().connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            # psycopg2
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+        else:
+            # psycopg 3
+            with cursor.copy(statement) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def _insert_rows(db: Session, rows: list[dict]):
+    """
+    Insert a batch in as few round trips as the backend allows.
+
+    - PostgreSQL (psycopg2 / psycopg 3): COPY
+    - Others: executemany, batched by SQLAlchemy's insertmanyvalues
+    """
+
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql" and bind.dialect.driver in ("psycopg2", "psycopg"):
+        _copy_rows(db, rows)
+    else:
+        db.execute(insert(Fighter), rows)
+
+
+def bulk_create_fighters(db: Session, content: str, fmt: str, batch_size: int = 1000):
+    """
+    Validate and insert fighters from a CSV / JSON lines document.
+
+    Steps:
+    1. Parse and validate every row; invalid rows go to the error report.
+    2. Insert valid rows in batches, each inside a SAVEPOINT.
+    3. If a batch fails in the database, retry its rows one by one
+       so only the offending rows are reported.
+    4. Commit once at the end.
+    5. Invalidate cached fighter lists (COPY bypasses the ORM
+       change hooks).
+
+    Returns the import report.
+    """
+
+    valid, errors = validate_rows(content, fmt)
+    received = len(valid) + len(errors)
+    inserted = 0
+
+    # COPY goes through the raw DBAPI cursor, so its errors are not wrapped
+    db_errors = (SQLAlchemyError, db.get_bind().dialect.dbapi.Error)
+
+    for start in range(0, len(valid), batch_size):
+        batch = valid[start : start + batch_size]
+
+        try:
+            with db.begin_nested():
+                _insert_rows(db, [row for _, row in batch])
+            inserted += len(batch)
+            continue
+        except db_errors:
+            pass
+
+        for row_number, row in batch:
+            try:
+                with db.begin_nested():
+                    _insert_rows(db, [row])
+                inserted += 1
+            except db_errors as exc:
+                errors.append({
+                    "row": row_number,
+                    "errors": [str(getattr(exc, "orig", None) or exc).splitlines()[0]],
+                })
+
+    db.commit()
+
+    # Core inserts aren't published as changes
+    if inserted:
+        fighter_search_index.reset()
+        if response_cache is not None:
+            response_cache.invalidate(["fighters"])
+
+    errors.sort(key=lambda error: error["row"])
+
+    return {
+        "received": received,
+        "inserted": inserted,
+        "failed": len(errors),
+        "errors": errors,
+    }
@@ -1,6 +1,18 @@
+from datetime import date
+
+from sqlalchemy import and_, func, or_, select, union_all
 from sqlalchemy.orm import Session
+
+from app.core.pagination import split_page
+from app.core.serialization import response_columns
+from app.models.event import Event
+from app.models.fight import Fight
 from app.models.fighter import Fighter
-from app.schemas.fighter import FighterCreate, FighterUpdate
+from app.services.fight_results import result_for
+from app.schemas.fighter import FighterCreate, FighterResponse, FighterUpdate
+
+# Columns served by list endpoints (one per FighterResponse field)
+FIGHTER_LIST_COLUMNS = response_columns(Fighter, FighterResponse)
 
 
 def create_fighter(db: Session, fighter_data: FighterCreate):
@@ -36,6 +48,64 @@ def get_all_fighters(db: Session):
     return db.query(Fighter).all()
 
 
+def fighters_page_statement(
+    skip: int = 0,
+    limit: int = 10,
+    after: tuple[str, int] | None = None,
+):
+    """
+    Build the SELECT for one page of fighters ordered by (last_name, id).
+
+    Shared by the sync and async services.
+    Selects limit + 1 rows so callers can tell whether another page exists.
+    Only FighterResponse columns are selected: rows, not ORM objects.
+    """
+
+    stmt = select(*FIGHTER_LIST_COLUMNS).order_by(Fighter.last_name, Fighter.id)
+
+    if after is not None:
+        last_name, fighter_id = after
+        stmt = stmt.where(
+            or_(
+                Fighter.last_name > last_name,
+                and_(Fighter.last_name == last_name, Fighter.id > fighter_id),
+            )
+        )
+    else:
+        stmt = stmt.offset(skip)
+
+    return stmt.limit(limit + 1)
+
+
+def fighter_page_key(fighter) -> tuple[str, int]:
+    return (fighter.last_name, fighter.id)
+
+
+def get_fighters(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    after: tuple[str, int] | None = None,
+):
+    """
+    Retrieves one page of fighters ordered by (last_name, id).
+
+    - Offset mode: LIMIT/OFFSET run in the database
+    - Keyset mode: when `after` is given, seek past that
+      (last_name, id) pair instead of counting rows,
+      so deep pages cost the same as the first one
+
+    Returns:
+        (rows, next_key) where rows are FighterResponse-shaped Row
+        objects and next_key is the (last_name, id) of the last row,
+        or None when there are no more rows.
+    """
+
+    rows = db.execute(fighters_page_statement(skip, limit, after)).all()
+
+    return split_page(rows, limit, fighter_page_key)
+
+
 def update_fighter(db: Session, fighter_id: int, fighter_data: FighterUpdate):
     """
     Updates an existing fighter.
@@ -83,4 +153,146 @@ def delete_fighter(db: Session, fighter_id: int):
     return fighter
 
 def get_fighter_by_id(db: Session, fighter_id: int):
-    return db.query(Fighter).filter(Fighter.id == fighter_id).first()
\ No newline at end of file
+    return db.query(Fighter).filter(Fighter.id == fighter_id).first()
+
+
+def fighter_version_statement(fighter_id: int):
+    """
+    updated_at of one fighter: the version behind its ETag.
+    """
+
+    return select(Fighter.updated_at).where(Fighter.id == fighter_id)
+
+
+def fighters_version_statement():
+    """
+    Collection version of the fighter list: (max updated_at, count).
+
+    max() is read from ix_fighters_updated_at; the count
+    changes on deletes, which leave no updated_at behind.
+    """
+
+    return select(func.max(Fighter.updated_at), func.count(Fighter.id))
+
+
+def get_fighter_version(db: Session, fighter_id: int):
+    """
+    Returns the fighter's updated_at, or None if it does not exist.
+    """
+
+    return db.execute(fighter_version_statement(fighter_id)).scalar_one_or_none()
+
+
+def get_fighters_version(db: Session) -> tuple:
+    return tuple(db.execute(fighters_version_statement()).one())
+
+
+def fight_history_statement(
+    fighter_id: int,
+    limit: int = 20,
+    after: tuple[date, int] | None = None,
+):
+    """
+    Build the single query behind a fighter's fight history.
+
+    - UNION ALL over both corners (fighter_1_id / fighter_2_id),
+      each branch served by its foreign-key index
+    - The other corner becomes opponent_id
+    - Joined to events for ordering and to fighters for the opponent
+    - Newest first, keyset paginated on (event_date, fight_id)
+    """
+
+    as_fighter_1 = select(
+        Fight.id.label("fight_id"),
+        Fight.event_id,
+        Fight.fighter_2_id.label("opponent_id"),
+        Fight.winner_id,
+        Fight.method,
+        Fight.round,
+    ).where(Fight.fighter_1_id == fighter_id)
+
+    as_fighter_2 = select(
+        Fight.id.label("fight_id"),
+        Fight.event_id,
+        Fight.fighter_1_id.label("opponent_id"),
+        Fight.winner_id,
+        Fight.method,
+        Fight.round,
+    ).where(Fight.fighter_2_id == fighter_id)
+
+    bouts = union_all(as_fighter_1, as_fighter_2).subquery("bouts")
+
+    stmt = (
+        select(
+            bouts.c.fight_id,
+            bouts.c.event_id,
+            bouts.c.winner_id,
+            bouts.c.method,
+            bouts.c.round,
+            Event.name.label("event_name"),
+            Event.event_date,
+            Fighter.id.label("opponent_id"),
+            Fighter.first_name.label("opponent_first_name"),
+            Fighter.last_name.label("opponent_last_name"),
+        )
+        .join(Event, Event.id == bouts.c.event_id)
+        .join(Fighter, Fighter.id == bouts.c.opponent_id)
+    )
+
+    if after is not None:
+        event_date, fight_id = after
+        stmt = stmt.where(
+            or_(
+                Event.event_date < event_date,
+                and_(Event.event_date == event_date, bouts.c.fight_id < fight_id),
+            )
+        )
+
+    return stmt.order_by(Event.event_date.desc(), bouts.c.fight_id.desc()).limit(limit + 1)
+
+
+def history_entry(fighter_id: int, row) -> dict:
+    """
+    Shape one history row for FightHistoryEntry.
+    """
+
+    return {
+        "fight_id": row.fight_id,
+        "event_id": row.event_id,
+        "event_name": row.event_name,
+        "event_date": row.event_date,
+        "opponent": {
+            "id": row.opponent_id,
+            "first_name": row.opponent_first_name,
+            "last_name": row.opponent_last_name,
+        },
+        "result": result_for(fighter_id, row.winner_id, row.method),
+        "method": row.method,
+        "round": row.round,
+    }
+
+
+def get_fight_history(
+    db: Session,
+    fighter_id: int,
+    limit: int = 20,
+    after: tuple[date, int] | None = None,
+):
+    """
+    Retrieve one page of a fighter's bouts, newest first.
+
+    Returns:
+        (entries, next_key), or None if the fighter does not exist.
+        next_key is the (event_date, fight_id) of the last entry.
+    """
+
+    rows = db.execute(fight_history_statement(fighter_id, limit, after)).all()
+
+    # Only an empty page needs to tell "no fights" from "no fighter"
+    if not rows and db.get(Fighter, fighter_id) is None:
+        return None
+
+    page, next_key = split_page(rows, limit, lambda row: (row.event_date, row.fight_id))
+
+    return [history_entry(fighter_id, row) for row in page], next_key
+
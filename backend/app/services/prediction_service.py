@@ -0,0 +1,132 @@
+from datetime import date
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.analytics.features import KNOWN, feature_store, matchup_features
+from app.analytics.model import get_model
+from app.analytics.ratings import rating_engine
+from app.models.event import Event
+from app.models.fight import Fight
+from app.schemas.prediction import MatchupRequest
+
+
+def _epoch_day(day: date) -> int:
+    return int(np.datetime64(day, "D").astype(np.int64))
+
+
+def score_matchups(db: Session, fighter_1_ids, fighter_2_ids, day: date):
+    """
+    Win probability of fighter_1 for N matchups, vectorized.
+
+    Steps:
+    - Gather feature rows and ratings once per distinct fighter
+    - Build the (N, features) matrix
+    - One matrix-vector product through the model
+
+    Returns (probabilities, known) where known[i] is False
+    if either fighter of matchup i does not exist.
+    """
+
+    pairs = np.column_stack([fighter_1_ids, fighter_2_ids]).astype(np.int64)
+    ids, inverse = np.unique(pairs, return_inverse=True)
+    inverse = inverse.reshape(pairs.shape)
+
+    rows = feature_store.rows(db, ids)
+    ratings = rating_engine.current_ratings(db, ids)
+
+    side_1 = rows[inverse[:, 0]]
+    side_2 = rows[inverse[:, 1]]
+    X = matchup_features(
+        side_1, side_2, ratings[inverse[:, 0]], ratings[inverse[:, 1]], _epoch_day(day)
+    )
+
+    known = (side_1[:, KNOWN] == 1) & (side_2[:, KNOWN] == 1)
+    return get_model().predict(X), known
+
+
+def _prediction(fighter_1_id: int, fighter_2_id: int, probability: float) -> dict:
+    return {
+        "fighter_1_id": fighter_1_id,
+        "fighter_2_id": fighter_2_id,
+        "fighter_1_win_probability": probability,
+        "fighter_2_win_probability": 1.0 - probability,
+    }
+
+
+def predict_matchups(db: Session, matchups: list[MatchupRequest]):
+    """
+    Score a batch of matchups as of today.
+
+    All-or-nothing like fight_service.create_fights: any invalid
+    matchup returns {"errors": [{"index", "error"}]}.
+    """
+
+    fighter_1_ids = [m.fighter_1_id for m in matchups]
+    fighter_2_ids = [m.fighter_2_id for m in matchups]
+    probabilities, known = score_matchups(db, fighter_1_ids, fighter_2_ids, date.today())
+
+    errors = []
+    for index, matchup in enumerate(matchups):
+        if not known[index]:
+            errors.append({"index": index, "error": "Fighter not found"})
+        elif matchup.fighter_1_id == matchup.fighter_2_id:
+            errors.append({"index": index, "error": "A fighter cannot fight themselves"})
+
+    if errors:
+        return {"errors": errors}
+
+    return [
+        _prediction(f1, f2, p)
+        for f1, f2, p in zip(fighter_1_ids, fighter_2_ids, probabilities.tolist())
+    ]
+
+
+def predict_matchup(db: Session, matchup: MatchupRequest):
+    """
+    Score one matchup. Returns {"error": ...} if it is invalid.
+    """
+
+    result = predict_matchups(db, [matchup])
+
+    if isinstance(result, dict):
+        return {"error": result["errors"][0]["error"]}
+
+    return result[0]
+
+
+def predict_event_card(db: Session, event_id: int):
+    """
+    Score every fight on an event card as of the event date.
+
+    Returns None if the event does not exist.
+    """
+
+    event_date = db.execute(
+        select(Event.event_date).where(Event.id == event_id)
+    ).scalar_one_or_none()
+
+    if event_date is None:
+        return None
+
+    fights = db.execute(
+        select(Fight.id, Fight.fighter_1_id, Fight.fighter_2_id)
+        .where(Fight.event_id == event_id)
+        .order_by(Fight.id)
+    ).all()
+
+    if not fights:
+        return []
+
+    probabilities, _ = score_matchups(
+        db,
+        [fight.fighter_1_id for fight in fights],
+        [fight.fighter_2_id for fight in fights],
+        event_date,
+    )
+
+    return [
+        {"fight_id": fight.id, **_prediction(fight.fighter_1_id, fight.fighter_2_id, p)}
+        for fight, p in zip(fights, probabilities.tolist())
+    ]
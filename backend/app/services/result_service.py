@@ -0,0 +1,386 @@
+import threading
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core import changes
+from app.core.batcher import Batcher
+from app.core.settings import settings
+from app.database import SessionLocal, utcnow
+from app.models.fight import Fight, bout_key
+from app.models.fight_result_update import FightResultUpdate
+from app.models.fighter_stats import apply_stats_delta, fight_contributions
+from app.services.fight_service import existing_ids_statement, referenced_ids, split_existing, validate_fight
+
+APPLIED = "applied"
+DUPLICATE = "duplicate"
+REJECTED = "rejected"
+
+RESULT_COLUMNS = ("winner_id", "method", "round")
+
+UPSERT_DIALECTS = {"postgresql": postgresql, "sqlite": sqlite}
+
+
+@dataclass(frozen=True)
+class ResultUpdate:
+    """
+    One result for a bout, as received from the feed.
+    """
+
+    idempotency_key: str
+    event_id: int
+    fighter_1_id: int
+    fighter_2_id: int
+    winner_id: int | None
+    method: str
+    round: int | None
+
+    @property
+    def bout_key(self) -> str:
+        return bout_key(self.event_id, self.fighter_1_id, self.fighter_2_id)
+
+
+def check_result(update: ResultUpdate) -> str | None:
+    """
+    The checks that need no database (self-fight, winner not in
+    the bout), so the feed hears about them before the 202.
+    """
+
+    ids = {update.event_id}
+    fighters = {update.fighter_1_id, update.fighter_2_id, update.winner_id}
+    return validate_fight(update, ids, fighters)
+
+
+def _claim_keys(connection, rows: list[dict]) -> set[str]:
+    """
+    Insert ledger rows for new idempotency keys; returns the keys
+    claimed by this transaction (the others were seen before).
+    """
+
+    table = FightResultUpdate.__table__
+    dialect = UPSERT_DIALECTS.get(connection.dialect.name)
+
+    if dialect is not None:
+        stmt = (
+            dialect.insert(table)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[table.c.idempotency_key])
+            .returning(table.c.idempotency_key)
+        )
+        return set(connection.scalars(stmt))
+
+    seen = set(connection.scalars(
+        select(table.c.idempotency_key).where(table.c.idempotency_key.in_([row["idempotency_key"] for row in rows]))
+    ))
+    new_rows = [row for row in rows if row["idempotency_key"] not in seen]
+    if new_rows:
+        connection.execute(insert(table), new_rows)
+    return {row["idempotency_key"] for row in new_rows}
+
+
+FIGHT_COLUMNS = (
+    "id", "event_id", "fighter_1_id", "fighter_2_id", "winner_id", "method", "round", "bout_key",
+)
+
+
+def _lock_fights(connection, keys) -> dict:
+    """
+    The fights of these bouts as committed, locked (FOR UPDATE)
+    until the transaction ends.
+    """
+
+    table = Fight.__table__
+    return {
+        row.bout_key: dict(row._mapping)
+        for row in connection.execute(
+            select(*[table.c[name] for name in FIGHT_COLUMNS])
+            .where(table.c.bout_key.in_(keys))
+            .order_by(table.c.id)
+            .with_for_update()
+        )
+    }
+
+
+def _write_fights(connection, rows: list[dict]) -> tuple[list[dict], dict]:
+    """
+    Write the latest result of each bout. Returns the written rows,
+    and the rows they replaced by bout_key (the pre-image the record
+    delta takes back).
+
+    The pre-image is read under the row lock: another worker writing
+    the same bout (with a different idempotency key) waits until
+    this transaction ends, then reads what it wrote.
+
+    Steps (PostgreSQL and SQLite):
+    1. INSERT ... ON CONFLICT (bout_key) DO NOTHING: new bouts,
+       nothing replaced; a bout another worker is inserting waits
+       for it to commit, then conflicts
+    2. SELECT ... FOR UPDATE the bouts that conflicted
+    3. INSERT ... ON CONFLICT (bout_key) DO UPDATE them
+    Elsewhere: lock the bouts, UPDATE the existing ones, INSERT the rest.
+    """
+
+    table = Fight.__table__
+    returning = [table.c[name] for name in FIGHT_COLUMNS]
+    dialect = UPSERT_DIALECTS.get(connection.dialect.name)
+
+    if dialect is not None:
+        inserted = [
+            dict(row._mapping)
+            for row in connection.execute(
+                dialect.insert(table)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=[table.c.bout_key])
+                .returning(*returning)
+            )
+        ]
+        new_keys = {fight["bout_key"] for fight in inserted}
+        rest = [row for row in rows if row["bout_key"] not in new_keys]
+        if not rest:
+            return inserted, {}
+
+        previous = _lock_fights(connection, [row["bout_key"] for row in rest])
+        stmt = dialect.insert(table).values(rest)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.bout_key],
+            set_={
+                **{name: stmt.excluded[name] for name in RESULT_COLUMNS},
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(*returning)
+        return inserted + [dict(row._mapping) for row in connection.execute(stmt)], previous
+
+    previous = _lock_fights(connection, [row["bout_key"] for row in rows])
+    written = []
+    for row in rows:
+        fight = previous.get(row["bout_key"])
+        if fight is not None:
+            stmt = (
+                update(table)
+                .where(table.c.id == fight["id"])
+                .values({name: row[name] for name in (*RESULT_COLUMNS, "updated_at")})
+            )
+        else:
+            stmt = insert(table).values(row)
+        written.append(dict(connection.execute(stmt.returning(*returning)).one()._mapping))
+    return written, previous
+
+
+def apply_results(db: Session, updates: list[ResultUpdate]) -> list[dict]:
+    """
+    Apply a batch of result updates in one transaction.
+
+    Steps:
+    1. One SELECT checks every referenced event and fighter
+    2. Claim the idempotency keys in the ledger
+       (INSERT ... ON CONFLICT DO NOTHING); unclaimed keys are
+       retries and change nothing
+    3. Load the fights on the batch's cards; a booked fight without
+       a bout_key yet gets the key of its bout
+    4. Write the latest update per bout (see _write_fights); the
+       results it replaces are read under the row lock
+    5. Add the record changes to fighter_stats (one upsert)
+    6. Commit, then publish the fight writes to the change bus
+
+    Returns one {"status", "fight_id", "error"} per update, in order.
+    """
+
+    connection = db.connection()
+    received_at = utcnow()
+
+    # 1. Existence checks
+    event_ids, fighter_ids = referenced_ids(updates)
+    events, fighters = split_existing(
+        db.execute(existing_ids_statement(event_ids, fighter_ids)).all()
+    )
+
+    # 2. Ledger: first occurrence of each key in the batch wins
+    first = {}
+    for update_ in updates:
+        first.setdefault(update_.idempotency_key, update_)
+    errors = {key: validate_fight(update_, events, fighters) for key, update_ in first.items()}
+
+    claimed = _claim_keys(connection, [
+        {
+            "idempotency_key": key,
+            "event_id": update_.event_id,
+            "bout_key": update_.bout_key,
+            "error": errors[key],
+            "received_at": received_at,
+        }
+        for key, update_ in first.items()
+    ])
+
+    ledger = {}
+    retried = [key for key in first if key not in claimed]
+    if retried:
+        table = FightResultUpdate.__table__
+        ledger = {
+            row.idempotency_key: row
+            for row in connection.execute(
+                select(table.c.idempotency_key, table.c.bout_key, table.c.error)
+                .where(table.c.idempotency_key.in_(retried))
+            )
+        }
+
+    # Latest update per bout, in arrival order
+    latest = {}
+    for key, update_ in first.items():
+        if key in claimed and errors[key] is None:
+            latest[update_.bout_key] = update_
+
+    # 3. Fights already on the cards, by bout
+    card_events = {update_.event_id for update_ in latest.values()}
+    card_events.update(int(row.bout_key.split(":")[0]) for row in ledger.values())
+
+    existing = {}
+    unkeyed = {}
+    if card_events:
+        for row in connection.execute(
+            select(
+                Fight.id, Fight.event_id, Fight.fighter_1_id, Fight.fighter_2_id,
+                Fight.winner_id, Fight.method, Fight.round, Fight.bout_key,
+            )
+            .where(Fight.event_id.in_(card_events))
+            .order_by(Fight.id)
+        ):
+            fight = dict(row._mapping)
+            if fight["bout_key"] is not None:
+                existing[fight["bout_key"]] = fight
+            else:
+                unkeyed.setdefault(bout_key(row.event_id, row.fighter_1_id, row.fighter_2_id), fight)
+
+    adopted = []
+    for key in latest:
+        if key not in existing and key in unkeyed:
+            existing[key] = {**unkeyed[key], "bout_key": key}
+            adopted.append({"fight_id": existing[key]["id"], "key": key})
+    if adopted:
+        connection.execute(
+            update(Fight.__table__)
+            .where(Fight.__table__.c.id == bindparam("fight_id"))
+            .values(bout_key=bindparam("key")),
+            adopted,
+        )
+
+    # 4. Write
+    written, replaced = [], {}
+    if latest:
+        written, replaced = _write_fights(connection, [
+            {
+                "event_id": update_.event_id,
+                "fighter_1_id": update_.fighter_1_id,
+                "fighter_2_id": update_.fighter_2_id,
+                "winner_id": update_.winner_id,
+                "method": update_.method,
+                "round": update_.round,
+                "bout_key": key,
+                "updated_at": received_at,
+            }
+            for key, update_ in latest.items()
+        ])
+
+    # 5. Records: add the new results, take back the ones they replace
+    delta = Counter()
+    committed = []
+    for fight in written:
+        previous = replaced.get(fight["bout_key"])
+        delta.update(fight_contributions(
+            fight["fighter_1_id"], fight["fighter_2_id"], fight["winner_id"], fight["method"]
+        ))
+        if previous is not None:
+            delta.subtract(fight_contributions(
+                previous["fighter_1_id"], previous["fighter_2_id"], previous["winner_id"], previous["method"]
+            ))
+
+        committed.append(changes.Change(
+            table="fights",
+            op="insert" if previous is None else "update",
+            id=fight["id"],
+            values={**fight, "updated_at": received_at},
+            previous={} if previous is None else {
+                name: previous[name] for name in RESULT_COLUMNS if previous[name] != fight[name]
+            },
+        ))
+    apply_stats_delta(connection, delta)
+
+    # 6. Commit and publish
+    db.commit()
+    changes.publish(committed)
+
+    fight_ids = {fight["bout_key"]: fight["id"] for fight in written}
+    fight_ids.update({key: fight["id"] for key, fight in existing.items() if key not in fight_ids})
+
+    # Retries report what happened to the first update with their key
+    outcomes = []
+    for update_ in updates:
+        key = update_.idempotency_key
+        if key in claimed:
+            error, key_bout = errors[key], first[key].bout_key
+        else:
+            error, key_bout = ledger[key].error, ledger[key].bout_key
+
+        if error is not None:
+            status = REJECTED
+        elif key in claimed and first[key] is update_:
+            status = APPLIED
+        else:
+            status = DUPLICATE
+
+        outcomes.append({
+            "status": status,
+            "fight_id": None if error is not None else fight_ids.get(key_bout),
+            "error": error,
+        })
+
+    return outcomes
+
+
+def _flush(updates: list[ResultUpdate]) -> list[dict]:
+    db = SessionLocal()
+    try:
+        return apply_results(db, updates)
+    finally:
+        db.close()
+
+
+result_batcher = Batcher(
+    "fight_results",
+    _flush,
+    max_size=settings.RESULT_BATCH_SIZE,
+    max_wait=settings.RESULT_BATCH_WAIT_MS / 1000,
+    max_pending=settings.RESULT_QUEUE_LIMIT,
+)
+
+# Futures of queued updates by idempotency key: a retry that arrives
+# before the first attempt is written shares its future
+_queued: dict[str, Future] = {}
+_queued_lock = threading.Lock()
+
+
+def submit_result(update: ResultUpdate) -> Future:
+    """
+    Queue a result update for the next batch.
+
+    The Future resolves to the update's outcome once its batch
+    is committed. Raises batcher.QueueFull when the queue is full.
+    """
+
+    key = update.idempotency_key
+    with _queued_lock:
+        future = _queued.get(key)
+        if future is not None:
+            return future
+        future = _queued[key] = result_batcher.submit(update)
+
+    def forget(_):
+        with _queued_lock:
+            if _queued.get(key) is future:
+                del _queued[key]
+
+    future.add_done_callback(forget)
+    return future
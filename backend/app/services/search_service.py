@@ -0,0 +1,104 @@
+from sqlalchemy import and_, func, literal, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.core.search import fighter_search_index, normalize
+from app.models.fighter import SEARCH_NAME, Fighter
+
+# Whether pg_trgm is installed, per database URL
+_trigram_support = {}
+
+
+def has_trigram_support(db: Session) -> bool:
+    """
+    True on PostgreSQL databases with the pg_trgm extension
+    (checked once per database).
+    """
+
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+
+    key = str(bind.url)
+    if key not in _trigram_support:
+        _trigram_support[key] = db.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        ).first() is not None
+
+    return _trigram_support[key]
+
+
+def trigram_search_statement(query: str, limit: int):
+    """
+    pg_trgm search: word_similarity of the query against the
+    full name, filtered with <% so the GIN index is used.
+    """
+
+    q = " ".join(normalize(query))
+    score = func.word_similarity(q, SEARCH_NAME)
+
+    return (
+        select(
+            Fighter.id,
+            Fighter.first_name,
+            Fighter.last_name,
+            Fighter.nickname,
+            score.label("score"),
+        )
+        .where(literal(q).op("<%")(SEARCH_NAME))
+        .order_by(score.desc(), Fighter.last_name, Fighter.first_name, Fighter.id)
+        .limit(limit)
+    )
+
+
+def trigram_autocomplete_statement(query: str, limit: int):
+    """
+    Prefix match on any name word, one LIKE pair per query word
+    (the trigram index serves LIKE as well).
+    """
+
+    conditions = [
+        or_(SEARCH_NAME.like(f"{token}%"), SEARCH_NAME.like(f"% {token}%"))
+        for token in dict.fromkeys(normalize(query))
+    ]
+
+    return (
+        select(
+            Fighter.id,
+            Fighter.first_name,
+            Fighter.last_name,
+            Fighter.nickname,
+            literal(None).label("score"),
+        )
+        .where(and_(*conditions))
+        .order_by(Fighter.last_name, Fighter.first_name, Fighter.id)
+        .limit(limit)
+    )
+
+
+def search_fighters(db: Session, query: str, limit: int = 10, mode: str = "search") -> list[dict]:
+    """
+    Find fighters by first name, last name or nickname.
+
+    - "search" tolerates typos and spelling variants
+      (Nurmagomedov / Nurmagomedow), best match first
+    - "autocomplete" matches name words starting with each
+      query word
+
+    Steps:
+    - PostgreSQL with pg_trgm: one query on the trigram index
+    - Otherwise: the in-process n-gram index
+    """
+
+    if not normalize(query):
+        return []
+
+    if has_trigram_support(db):
+        if mode == "autocomplete":
+            stmt = trigram_autocomplete_statement(query, limit)
+        else:
+            stmt = trigram_search_statement(query, limit)
+        return [dict(row._mapping) for row in db.execute(stmt)]
+
+    if mode == "autocomplete":
+        return fighter_search_index.autocomplete(db, query, limit)
+    return fighter_search_index.search(db, query, limit)
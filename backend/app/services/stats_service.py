@@ -0,0 +1,107 @@
+from sqlalchemy import case, delete, func, insert, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.fight import Fight
+from app.models.fighter import Fighter
+from app.models.fighter_stats import FighterStats
+from app.services.fight_results import NO_CONTEST_METHODS
+
+
+def _record_aggregate(fighter_ids: list[int] | None = None):
+    """
+    One set-based SELECT computing every fighter's record from fights.
+
+    Mirrors fight_results.result_for in SQL:
+    - winner set: win / loss
+    - no winner, method set: no contest or draw
+    - no winner, no method: not fought yet, not counted
+    """
+
+    corners = union_all(
+        select(Fight.fighter_1_id.label("fighter_id"), Fight.winner_id, Fight.method),
+        select(Fight.fighter_2_id.label("fighter_id"), Fight.winner_id, Fight.method),
+    ).subquery("corners")
+
+    no_winner = corners.c.winner_id.is_(None)
+    no_contest = func.lower(func.trim(corners.c.method)).in_(NO_CONTEST_METHODS)
+
+    def count_when(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    stmt = (
+        select(
+            Fighter.id,
+            count_when(corners.c.winner_id == Fighter.id),
+            count_when(~no_winner & (corners.c.winner_id != Fighter.id)),
+            count_when(no_winner & corners.c.method.is_not(None) & ~no_contest),
+            count_when(no_winner & no_contest),
+        )
+        .select_from(Fighter)
+        .outerjoin(corners, corners.c.fighter_id == Fighter.id)
+        .group_by(Fighter.id)
+    )
+
+    if fighter_ids is not None:
+        stmt = stmt.where(Fighter.id.in_(fighter_ids))
+
+    return stmt
+
+
+def rebuild_fighter_stats(db: Session, fighter_ids: list[int] | None = None) -> int:
+    """
+    Recompute fighter records from scratch.
+
+    - DELETE the affected stats rows
+    - INSERT ... SELECT one aggregate over fights
+    - Commit
+
+    Rebuilds every fighter unless fighter_ids is given.
+    Returns the number of stats rows written.
+    """
+
+    clear = delete(FighterStats)
+    if fighter_ids is not None:
+        clear = clear.where(FighterStats.fighter_id.in_(fighter_ids))
+    db.execute(clear)
+
+    result = db.execute(
+        insert(FighterStats).from_select(
+            ["fighter_id", "wins", "losses", "draws", "no_contests"],
+            _record_aggregate(fighter_ids),
+        )
+    )
+    db.commit()
+
+    return result.rowcount
+
+
+def get_fighter_record(db: Session, fighter_id: int):
+    """
+    Read a fighter's derived record (one primary-key join).
+
+    Fighters without a stats row yet have an empty record.
+    Returns None if the fighter does not exist.
+    """
+
+    row = db.execute(
+        select(
+            Fighter.id,
+            FighterStats.wins,
+            FighterStats.losses,
+            FighterStats.draws,
+            FighterStats.no_contests,
+        )
+        .outerjoin(FighterStats, FighterStats.fighter_id == Fighter.id)
+        .where(Fighter.id == fighter_id)
+    ).first()
+
+    if row is None:
+        return None
+
+    return {
+        "fighter_id": row.id,
+        "wins": row.wins or 0,
+        "losses": row.losses or 0,
+        "draws": row.draws or 0,
+        "no_contests": row.no_contests or 0,
+    }
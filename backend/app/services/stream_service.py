@@ -0,0 +1,117 @@
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from app.core import changes
+from app.core.broadcast import Subscription, broadcaster
+from app.core.settings import settings
+
+FIGHT_FIELDS = ("id", "event_id", "fighter_1_id", "fighter_2_id", "winner_id", "method", "round")
+EVENT_FIELDS = ("id", "name", "location", "event_date")
+
+HEARTBEAT = b": ping\n\n"
+
+
+def card_channel(event_id: int) -> str:
+    return f"event:{event_id}"
+
+
+def messages_for_changes(committed: list[changes.Change]) -> list[tuple[str, str, dict]]:
+    """
+    Stream messages for committed writes, as (channel, event, data).
+
+    - "fight": a fight on the card was added, updated (results
+      included) or removed; a fight moved to another event is
+      removed from the old card
+    - "event": the event itself was updated or deleted
+    """
+
+    messages = []
+
+    for change in committed:
+        if change.table == "fights":
+            fight = {name: change.values.get(name) for name in FIGHT_FIELDS}
+            fight["id"] = change.id
+            if fight["event_id"] is None:
+                continue
+            messages.append((card_channel(fight["event_id"]), "fight", {"op": change.op, "fight": fight}))
+
+            moved_from = change.previous.get("event_id")
+            if change.op == "update" and moved_from is not None and moved_from != fight["event_id"]:
+                messages.append((
+                    card_channel(moved_from), "fight",
+                    {"op": "delete", "fight": {**fight, "event_id": moved_from}},
+                ))
+        elif change.table == "events" and change.op != "insert":
+            event = {name: change.values.get(name) for name in EVENT_FIELDS}
+            event["id"] = change.id
+            messages.append((card_channel(change.id), "event", {"op": change.op, "event": event}))
+
+    return messages
+
+
+@changes.subscribe
+def _publish_card_updates(committed):
+    broadcaster.publish(messages_for_changes(committed))
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    if value is None or not value.strip():
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        # Not one of ours: resume impossible, the stream starts with a reset
+        return -1
+
+
+async def stream_card(subscription: Subscription) -> AsyncIterator[bytes]:
+    """
+    Server-sent events for one fight card's subscription.
+
+    Steps:
+    1. Tell the client how long to wait before reconnecting
+    2. Replay what it missed since Last-Event-ID, or send a
+       "reset" event when that can't be done
+    3. Write messages as they are published; a comment line
+       every STREAM_HEARTBEAT_SECONDS keeps idle connections
+       open through proxies and detects gone clients
+    4. Stop when the subscription closes (shutdown, or the
+       client fell too far behind)
+    """
+
+    yield f"retry: {settings.STREAM_RETRY_MS}\n\n".encode()
+    if subscription.reset:
+        yield b"event: reset\ndata: {}\n\n"
+
+    while True:
+        messages = await subscription.get(settings.STREAM_HEARTBEAT_SECONDS)
+        if messages is None:
+            return
+        if not messages:
+            yield HEARTBEAT
+            continue
+        yield b"".join(message.encode() for message in messages)
+
+
+class CardStreamResponse(StreamingResponse):
+    """
+    Streams a subscription taken before the response was built,
+    and unsubscribes however the response ends (even when the
+    client leaves before the body starts).
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(self, subscription: Subscription):
+        super().__init__(
+            stream_card(subscription),
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        self.subscription = subscription
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            broadcaster.unsubscribe(self.subscription)
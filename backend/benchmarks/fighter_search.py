@@ -0,0 +1,138 @@
+"""
+Fighter search latency on a large roster.
+
+Seeds --fighters fighters with generated names, then times
+search_service.search_fighters for:
+
+1. autocomplete: prefixes of 1 to 6 letters of real name words,
+   some with a second word ("khab nur")
+2. search:       whole name words with one letter changed
+
+Reports p50 / p95 / max in milliseconds, and the one-off time
+to build the in-process index (non-PostgreSQL databases, or
+PostgreSQL without pg_trgm).
+
+Usage (from backend/, against a scratch database):
+    python -m benchmarks.fighter_search --fighters 100000 --queries 2000
+"""
+import argparse
+import json
+import random
+import statistics
+import string
+import time
+
+from sqlalchemy import insert
+
+import app.models  # ensures all models are registered
+from app.core.search import fighter_search_index
+from app.database import Base, SessionLocal, engine
+from app.models.fighter import Fighter
+from app.services import search_service
+
+SYLLABLES = [
+    "ka", "ha", "bib", "nur", "ma", "go", "med", "ov", "is", "lam", "khe", "chev",
+    "jon", "es", "da", "nil", "son", "al", "ex", "pe", "rei", "ra", "jan", "bla",
+    "cho", "wicz", "dus", "tin", "po", "ir", "ier", "sean", "o", "mal", "ley",
+    "val", "en", "ti", "na", "shev", "che", "zo", "ri", "an", "tu", "kov", "ski",
+]
+
+
+def make_name(rng: random.Random) -> str:
+    return "".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+
+
+def setup_data(count: int, seed: int):
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(seed)
+    db = SessionLocal()
+    try:
+        existing = db.query(Fighter).count()
+        rows = [
+            {
+                "first_name": make_name(rng),
+                "last_name": make_name(rng),
+                "nickname": make_name(rng) if rng.random() < 0.3 else None,
+            }
+            for _ in range(existing, count)
+        ]
+        for start in range(0, len(rows), 10000):
+            db.execute(insert(Fighter), rows[start:start + 10000])
+        db.commit()
+    finally:
+        db.close()
+
+
+def make_queries(count: int, seed: int) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed + 1)
+    words = [make_name(rng).lower() for _ in range(count)]
+
+    autocomplete = []
+    for word in words:
+        prefix = word[:rng.randint(1, 6)]
+        if rng.random() < 0.3:
+            prefix = f"{prefix} {make_name(rng).lower()[:rng.randint(1, 3)]}"
+        autocomplete.append(prefix)
+
+    search = []
+    for word in words:
+        i = rng.randrange(len(word))
+        search.append(word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:])
+
+    return autocomplete, search
+
+
+def measure(db, queries: list[str], mode: str, limit: int) -> dict:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        search_service.search_fighters(db, query, limit=limit, mode=mode)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95)], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def main(args):
+    setup_data(args.fighters, args.seed)
+    autocomplete, search = make_queries(args.queries, args.seed)
+
+    db = SessionLocal()
+    try:
+        trigram = search_service.has_trigram_support(db)
+
+        build_ms = None
+        if not trigram:
+            fighter_search_index.reset()
+            start = time.perf_counter()
+            fighter_search_index.search(db, "warmup", 1)
+            build_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        results = {
+            "autocomplete": measure(db, autocomplete, "autocomplete", args.limit),
+            "search": measure(db, search, "search", args.limit),
+        }
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "backend": "pg_trgm" if trigram else "in-process index",
+        "fighters": args.fighters,
+        "queries": args.queries,
+        "index_build_ms": build_ms,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fighters", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
@@ -0,0 +1,132 @@
+"""
+Rows per second for list responses: ORM + Pydantic vs column rows + orjson.
+
+For pages of GET /fighters, compares:
+
+1. pydantic: load Fighter objects, validate each through
+   FighterResponse (from_attributes), dump and encode with json
+   (what FastAPI does for response_model=List[FighterResponse])
+2. fast:     select the FighterResponse columns as Row objects and
+   encode them with orjson (app.core.serialization.rows_response)
+
+Each is timed end to end (query + serialization) and for
+serialization alone on already-fetched data.
+
+Usage (from backend/, against a scratch database):
+    python -m benchmarks.list_serialization --page-size 100 --pages 500
+"""
+import argparse
+import json
+import time
+from datetime import date
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+import app.models  # ensures all models are registered
+from app.core.serialization import rows_response
+from app.database import Base, SessionLocal, engine
+from app.models.fighter import Fighter
+from app.schemas.fighter import FighterResponse
+from app.services.fighter_service import fighters_page_statement
+
+FIGHTER_LIST = TypeAdapter(List[FighterResponse])
+
+
+def setup_data(count: int):
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        existing = db.query(Fighter).count()
+        db.add_all(
+            Fighter(
+                first_name=f"Bench{i}",
+                last_name=f"Fighter{i:05d}",
+                nickname="The Benchmark",
+                date_of_birth=date(1990, 1, 1),
+                height_cm=180,
+                reach_cm=185,
+                stance="Orthodox",
+                wins=10,
+                losses=2,
+                draws=0,
+            )
+            for i in range(existing, count)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def pydantic_body(fighters) -> bytes:
+    validated = FIGHTER_LIST.validate_python(fighters, from_attributes=True)
+    content = FIGHTER_LIST.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+
+def fast_body(rows) -> bytes:
+    return rows_response(rows).body
+
+
+def orm_page(db, page_size):
+    return db.scalars(select(Fighter).order_by(Fighter.last_name, Fighter.id).limit(page_size)).all()
+
+
+def row_page(db, page_size):
+    return db.execute(fighters_page_statement(0, page_size - 1)).all()
+
+
+def measure(pages: int, page_size: int, fetch, encode, prefetched: bool) -> dict:
+    db = SessionLocal()
+    try:
+        data = fetch(db, page_size)
+        encode(data)  # warm up
+
+        start = time.perf_counter()
+        for _ in range(pages):
+            if not prefetched:
+                db.expunge_all()
+                data = fetch(db, page_size)
+            encode(data)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    return {
+        "rows_per_second": round(pages * page_size / elapsed),
+        "ms_per_page": round(elapsed / pages * 1000, 3),
+    }
+
+
+def main(args):
+    setup_data(args.page_size)
+
+    with SessionLocal() as db:
+        assert json.loads(pydantic_body(orm_page(db, args.page_size))) == json.loads(
+            fast_body(row_page(db, args.page_size))
+        ), "fast path must produce the same JSON"
+
+    results = {}
+    for mode, prefetched in (("end_to_end", False), ("serialization_only", True)):
+        pydantic = measure(args.pages, args.page_size, orm_page, pydantic_body, prefetched)
+        fast = measure(args.pages, args.page_size, row_page, fast_body, prefetched)
+        results[mode] = {
+            "pydantic": pydantic,
+            "fast": fast,
+            "speedup": round(fast["rows_per_second"] / pydantic["rows_per_second"], 2),
+        }
+
+    print(json.dumps({
+        "database": engine.dialect.name,
+        "page_size": args.page_size,
+        "pages": args.pages,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=500)
+    main(parser.parse_args())
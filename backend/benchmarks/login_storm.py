@@ -0,0 +1,158 @@
+"""
+Latency of unrelated GETs during a login storm.
+
+Drives the app in-process (httpx ASGI transport) and measures
+GET /fighters latency:
+
+1. baseline: no logins running
+2. inline:   bcrypt runs in the request threads (PASSWORD_HASH_WORKERS=0)
+3. pool:     bcrypt runs in the bounded worker process pool
+
+Usage (from backend/, against a scratch database):
+    python -m benchmarks.login_storm --logins 200 --login-concurrency 64
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+import app.models  # ensures all models are registered
+from app.core import password_pool as password_pool_module
+from app.core.password_pool import PasswordHashPool
+from app.core.security import hash_password
+from app.core.settings import settings
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models.fighter import Fighter
+from app.models.user import User
+from app.routes import auth
+
+USERNAME = "bench_login_user"
+PASSWORD = "BenchPassword123!"
+
+
+def setup_data():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if not db.query(User).filter(User.username == USERNAME).first():
+            db.add(User(
+                username=USERNAME,
+                email=f"{USERNAME}@bench.local",
+                hashed_password=hash_password(PASSWORD),
+            ))
+        if db.query(Fighter).count() < 50:
+            db.add_all(
+                Fighter(first_name=f"Bench{i}", last_name="Fighter") for i in range(50)
+            )
+        db.commit()
+    finally:
+        db.close()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "count": len(samples),
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(samples) * 1000, 2),
+    }
+
+
+async def run_gets(client: httpx.AsyncClient, count: int, concurrency: int) -> list[float]:
+    latencies = []
+    remaining = iter(range(count))
+
+    async def worker():
+        for _ in remaining:
+            start = time.perf_counter()
+            response = await client.get("/fighters?limit=20")
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def run_logins(client: httpx.AsyncClient, count: int, concurrency: int) -> dict:
+    statuses: dict[int, int] = {}
+    remaining = iter(range(count))
+
+    async def worker():
+        for _ in remaining:
+            response = await client.post(
+                "/auth/login", data={"username": USERNAME, "password": PASSWORD}
+            )
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return statuses
+
+
+async def scenario(name: str, args, storm: bool) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up (worker processes, connection pool)
+        await client.post("/auth/login", data={"username": USERNAME, "password": PASSWORD})
+        await client.get("/fighters")
+
+        start = time.perf_counter()
+        if storm:
+            logins_task = asyncio.create_task(
+                run_logins(client, args.logins, args.login_concurrency)
+            )
+            # Give the storm a head start so GETs land in the middle of it
+            await asyncio.sleep(0.05)
+            latencies = await run_gets(client, args.gets, args.get_concurrency)
+            login_statuses = await logins_task
+        else:
+            latencies = await run_gets(client, args.gets, args.get_concurrency)
+            login_statuses = {}
+
+    return {
+        "scenario": name,
+        "elapsed_s": round(time.perf_counter() - start, 2),
+        "get_fighters": summarize(latencies),
+        "login_statuses": login_statuses,
+    }
+
+
+def use_pool(pool: PasswordHashPool):
+    auth.password_pool.shutdown()
+    auth.password_pool = pool
+    password_pool_module.password_pool = pool
+
+
+async def main(args):
+    setup_data()
+    results = [await scenario("baseline", args, storm=False)]
+
+    use_pool(PasswordHashPool(workers=0, queue_depth=0))
+    results.append(await scenario("inline", args, storm=True))
+
+    use_pool(PasswordHashPool(workers=args.workers, queue_depth=args.queue_depth))
+    results.append(await scenario("pool", args, storm=True))
+    auth.password_pool.shutdown()
+
+    print(json.dumps({"bcrypt_rounds": settings.BCRYPT_ROUNDS, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--login-concurrency", type=int, default=64)
+    parser.add_argument("--gets", type=int, default=400)
+    parser.add_argument("--get-concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS or 2)
+    parser.add_argument("--queue-depth", type=int, default=settings.PASSWORD_HASH_QUEUE_DEPTH)
+    asyncio.run(main(parser.parse_args()))
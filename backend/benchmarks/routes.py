@@ -0,0 +1,512 @@
+"""
+Throughput and latency of every API route on a synthetic dataset.
+
+Generates the dataset (app.dataset) if the database has fewer than
+--fighters fighters, then sends --requests requests per route with
+--concurrency workers through one of two clients:
+
+1. asgi: the app in-process (httpx ASGI transport)
+2. http: a running server at --base-url, over real connections
+
+Per route it reports throughput, p50 / p95 / p99 latency, database
+queries per request (from the Server-Timing header), response-cache
+hits and unexpected statuses. Writes go to "Benchmark" fighters,
+events and users, removed at the end.
+
+Baselines live in benchmarks/baselines/NAME.json:
+    --save NAME     write this run as the baseline
+    --compare NAME  exit 1 if a route's p95 grew by more than
+                    --tolerance, or it runs more queries per request
+
+Usage (from backend/, against a scratch database):
+    python -m benchmarks.routes --fighters 50000 --events 20000 --fights 300000 --save sqlite-asgi
+    python -m benchmarks.routes --compare sqlite-asgi
+
+    uvicorn app.main:app --workers 4 &
+    python -m benchmarks.routes --client http --base-url http://127.0.0.1:8000
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+from sqlalchemy import delete, func, select
+
+import app.models  # ensures all models are registered
+from app.analytics import LEADERBOARD_METRICS
+from app.core.security import hash_password
+from app.database import Base, SessionLocal, engine
+from app.dataset import generate_dataset
+from app.models.event import Event
+from app.models.fight import Fight
+from app.models.fight_result_update import FightResultUpdate
+from app.models.fighter import Fighter
+from app.models.fighter_stats import FighterStats
+from app.models.user import User
+from benchmarks.login_storm import summarize
+
+BASELINES = Path(__file__).resolve().parent / "baselines"
+
+ADMIN = "bench_routes_admin"
+PASSWORD = "BenchPassword123!"
+MARKER = "Benchmark"
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Context:
+    """
+    Ids to request, plus the rows this run created.
+    """
+
+    rng: random.Random
+    fighter_ids: list[int]
+    event_ids: list[int]
+    future_event_ids: list[int]
+    names: list[str]
+    card_event_id: int
+    user_ids: list[int]
+    result_fighters: list[int]
+    admin_headers: dict = field(default_factory=dict)
+    created_fighters: list[int] = field(default_factory=list)
+    created_events: list[int] = field(default_factory=list)
+    counter: itertools.count = field(default_factory=itertools.count)
+
+    def fighter(self) -> int:
+        return self.rng.choice(self.fighter_ids)
+
+    def matchup(self) -> dict:
+        first, second = self.rng.sample(self.fighter_ids, 2)
+        return {"fighter_1_id": first, "fighter_2_id": second}
+
+    def result(self) -> dict:
+        first, second = self.result_fighters
+        return {
+            "fighter_1_id": first,
+            "fighter_2_id": second,
+            "winner_id": self.rng.choice(self.result_fighters),
+            "method": "KO/TKO",
+            "round": self.rng.randint(1, 3),
+        }
+
+    def typo(self) -> str:
+        name = self.rng.choice(self.names).lower()
+        i = self.rng.randrange(len(name))
+        return name[:i] + self.rng.choice("aeiourstn") + name[i + 1:]
+
+
+@dataclass
+class Scenario:
+    """
+    One route: how to build a request, and how to read the response.
+
+    share scales --requests for expensive or state-consuming routes.
+    """
+
+    method: str
+    route: str
+    build: Callable[[Context], dict]
+    expect: tuple[int, ...] = (200,)
+    share: float = 1.0
+    label: str = ""
+    after: Optional[Callable[[Context, httpx.Response], None]] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.route}{self.label}"
+
+
+def _created(ids_attr: str):
+    def record(ctx: Context, response: httpx.Response):
+        if response.status_code == 201:
+            getattr(ctx, ids_attr).append(response.json()["id"])
+    return record
+
+
+def _take(ids: list[int]) -> int:
+    # Nothing left to delete (e.g. --only without the POST): a 404
+    return ids.pop() if ids else 0
+
+
+def _bulk_csv(ctx: Context) -> str:
+    batch = next(ctx.counter)
+    rows = [f"Bulk{batch}x{i},{MARKER}" for i in range(20)]
+    return "first_name,last_name\n" + "\n".join(rows) + "\n"
+
+
+def _admin(ctx: Context, **request) -> dict:
+    return {**request, "headers": {**ctx.admin_headers, **request.get("headers", {})}}
+
+
+# Order matters: writes that create rows run before the ones that
+# patch or delete them.
+SCENARIOS = [
+    Scenario("GET", "/health", lambda ctx: {"url": "/health"}),
+    # 503 on databases created without alembic
+    Scenario("GET", "/ready", lambda ctx: {"url": "/ready"}, expect=(200, 503)),
+    Scenario("GET", "/metrics", lambda ctx: {"url": "/metrics"}, share=0.25),
+    Scenario("GET", "/metrics/pool", lambda ctx: {"url": "/metrics/pool"}),
+
+    Scenario("GET", "/fighters", lambda ctx: {
+        "url": "/fighters", "params": {"limit": 20, "skip": ctx.rng.randrange(0, 500)},
+    }),
+    Scenario("GET", "/fighters/search", lambda ctx: {
+        "url": "/fighters/search", "params": {"q": ctx.typo()},
+    }),
+    Scenario("GET", "/fighters/search", lambda ctx: {
+        "url": "/fighters/search",
+        "params": {"q": ctx.rng.choice(ctx.names)[:ctx.rng.randint(1, 4)], "mode": "autocomplete"},
+    }, label="?mode=autocomplete"),
+    Scenario("GET", "/fighters/{fighter_id}", lambda ctx: {"url": f"/fighters/{ctx.fighter()}"}),
+    Scenario("GET", "/fighters/{fighter_id}/fights", lambda ctx: {
+        "url": f"/fighters/{ctx.fighter()}/fights",
+    }),
+    Scenario("GET", "/fighters/{fighter_id}/record", lambda ctx: {
+        "url": f"/fighters/{ctx.fighter()}/record",
+    }),
+    Scenario("GET", "/fighters/{fighter_id}/analytics", lambda ctx: {
+        "url": f"/fighters/{ctx.fighter()}/analytics",
+    }),
+    Scenario("GET", "/fighters/{fighter_id}/ratings", lambda ctx: {
+        "url": f"/fighters/{ctx.fighter()}/ratings",
+    }),
+
+    Scenario("GET", "/events", lambda ctx: {
+        "url": "/events",
+        "params": {"from": str(date(1994, 1, 1) + timedelta(days=ctx.rng.randrange(11000))), "limit": 50},
+    }),
+    Scenario("GET", "/events/cards", lambda ctx: {
+        "url": "/events/cards", "params": {"ids": ctx.rng.sample(ctx.event_ids, 5)},
+    }),
+    Scenario("GET", "/events/{event_id}", lambda ctx: {"url": f"/events/{ctx.rng.choice(ctx.event_ids)}"}),
+    Scenario("GET", "/events/{event_id}/card", lambda ctx: {
+        "url": f"/events/{ctx.rng.choice(ctx.event_ids)}/card",
+    }),
+    Scenario("GET", "/events/{event_id}/predictions", lambda ctx: {
+        "url": f"/events/{ctx.rng.choice(ctx.future_event_ids or ctx.event_ids)}/predictions",
+    }),
+
+    Scenario("GET", "/analytics/leaderboard", lambda ctx: {
+        "url": "/analytics/leaderboard",
+        "params": {"metric": ctx.rng.choice(LEADERBOARD_METRICS), "min_fights": 5},
+    }),
+    Scenario("GET", "/rankings", lambda ctx: {"url": "/rankings", "params": {"min_fights": 5}}),
+    Scenario("POST", "/predictions", lambda ctx: {"url": "/predictions", "json": ctx.matchup()}),
+    Scenario("POST", "/predictions/batch", lambda ctx: {
+        "url": "/predictions/batch", "json": {"matchups": [ctx.matchup() for _ in range(50)]},
+    }),
+    Scenario("GET", "/export/{table}", lambda ctx: {
+        "url": "/export/events", "params": {"format": "csv"},
+    }, share=0.05),
+
+    Scenario("POST", "/auth/register", lambda ctx: {
+        "url": "/auth/register",
+        "json": {
+            "username": f"bench_{time.time_ns()}_{next(ctx.counter)}",
+            "email": f"bench_{time.time_ns()}_{next(ctx.counter)}@example.com",
+            "password": PASSWORD,
+        },
+    }, expect=(201,), share=0.1, after=_created("user_ids")),
+    Scenario("POST", "/auth/login", lambda ctx: {
+        "url": "/auth/login", "data": {"username": ADMIN, "password": PASSWORD},
+    }, share=0.1),
+    Scenario("PATCH", "/users/{user_id}/role", lambda ctx: _admin(
+        ctx, url=f"/users/{ctx.rng.choice(ctx.user_ids)}/role", json={"role": "user"},
+    ), share=0.1),
+    Scenario("PATCH", "/users/{user_id}/status", lambda ctx: _admin(
+        ctx, url=f"/users/{ctx.rng.choice(ctx.user_ids)}/status", json={"is_active": True},
+    ), share=0.1),
+
+    Scenario("POST", "/fighters", lambda ctx: _admin(
+        ctx, url="/fighters", json={"first_name": f"Created{next(ctx.counter)}", "last_name": MARKER},
+    ), expect=(201,), after=_created("created_fighters")),
+    Scenario("PATCH", "/fighters/{fighter_id}", lambda ctx: _admin(
+        ctx, url=f"/fighters/{ctx.rng.choice(ctx.created_fighters or ctx.fighter_ids)}", json={"nickname": "Bench"},
+    )),
+    Scenario("DELETE", "/fighters/{fighter_id}", lambda ctx: _admin(
+        ctx, url=f"/fighters/{_take(ctx.created_fighters)}",
+    ), expect=(204,)),
+    Scenario("POST", "/fighters/bulk", lambda ctx: _admin(
+        ctx, url="/fighters/bulk", content=_bulk_csv(ctx), headers={"Content-Type": "text/csv"},
+    ), share=0.1),
+
+    Scenario("POST", "/events", lambda ctx: _admin(
+        ctx, url="/events",
+        json={"name": f"{MARKER} {next(ctx.counter)}", "event_date": str(date.today() + timedelta(days=400))},
+    ), expect=(201,), after=_created("created_events")),
+    Scenario("DELETE", "/events/{event_id}", lambda ctx: _admin(
+        ctx, url=f"/events/{_take(ctx.created_events)}",
+    ), expect=(204,)),
+    Scenario("POST", "/fights", lambda ctx: _admin(
+        ctx, url="/fights", json={"event_id": ctx.card_event_id, **ctx.matchup()},
+    ), expect=(201,)),
+    Scenario("POST", "/fights/bulk", lambda ctx: _admin(
+        ctx, url="/fights/bulk",
+        json={"fights": [{"event_id": ctx.card_event_id, **ctx.matchup()} for _ in range(10)]},
+    ), expect=(201,), share=0.25),
+    Scenario("POST", "/events/{event_id}/results", lambda ctx: _admin(
+        ctx, url=f"/events/{ctx.card_event_id}/results", params={"wait": True}, json=ctx.result(),
+        headers={"Idempotency-Key": f"bench-{time.time_ns()}-{next(ctx.counter)}"},
+    )),
+]
+
+
+def setup_data(args) -> Context:
+    """
+    Generate the dataset if needed, create the admin, a user to
+    patch and the event benchmark fights are booked on, and sample
+    request ids.
+    """
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if db.scalar(select(func.count(Fighter.id))) < args.fighters:
+            counts = generate_dataset(db, args.fighters, args.events, args.fights, args.seed)
+            print(f"Generated {counts}", file=sys.stderr)
+
+        if not db.scalar(select(User.id).where(User.username == ADMIN)):
+            db.add(User(
+                username=ADMIN,
+                email=f"{ADMIN}@bench.local",
+                hashed_password=hash_password(PASSWORD),
+                role="admin",
+            ))
+        user = User(
+            username=f"bench_{time.time_ns()}",
+            email=f"bench_{time.time_ns()}@bench.local",
+            hashed_password=hash_password(PASSWORD),
+        )
+        card = Event(name=f"{MARKER} card", event_date=date.today() + timedelta(days=400))
+        # Results are written for one bout between two fighters of
+        # the run, so their records go with the cleanup
+        corners = [Fighter(first_name=name, last_name=MARKER) for name in ("Red", "Blue")]
+        db.add_all([user, card, *corners])
+        db.commit()
+
+        rng = random.Random(args.seed)
+        active = db.scalars(
+            select(FighterStats.fighter_id).where(FighterStats.wins + FighterStats.losses >= 3)
+        ).all()
+        fighter_ids = rng.sample(active, min(len(active), 5000))
+        names = db.scalars(select(Fighter.last_name).where(Fighter.id.in_(fighter_ids[:500]))).all()
+
+        today = date.today()
+        booked = select(Fight.event_id).distinct()
+        event_ids = db.scalars(
+            select(Event.id).where(Event.id.in_(booked), Event.event_date <= today)
+        ).all()
+        future_event_ids = db.scalars(
+            select(Event.id).where(Event.id.in_(booked), Event.event_date > today)
+        ).all()
+
+        return Context(
+            rng=rng,
+            fighter_ids=fighter_ids,
+            event_ids=rng.sample(event_ids, min(len(event_ids), 5000)),
+            future_event_ids=future_event_ids,
+            names=names,
+            card_event_id=card.id,
+            user_ids=[user.id],
+            result_fighters=[corner.id for corner in corners],
+        )
+    finally:
+        db.close()
+
+
+def cleanup():
+    """
+    Remove the fighters, events, fights and users written by the run.
+    """
+
+    db = SessionLocal()
+    try:
+        events = select(Event.id).where(Event.name.like(f"{MARKER}%"))
+        db.execute(delete(FightResultUpdate).where(FightResultUpdate.event_id.in_(events)))
+        db.execute(delete(Fight).where(Fight.event_id.in_(events)))
+        db.execute(delete(Event).where(Event.name.like(f"{MARKER}%")))
+        fighters = select(Fighter.id).where(Fighter.last_name == MARKER)
+        db.execute(delete(FighterStats).where(FighterStats.fighter_id.in_(fighters)))
+        db.execute(delete(Fighter).where(Fighter.last_name == MARKER))
+        db.execute(delete(User).where(User.username.like("bench\\_%", escape="\\"), User.username != ADMIN))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, ctx: Context,
+                       count: int, concurrency: int) -> dict:
+    latencies = []
+    queries = []
+    statuses: dict[int, int] = {}
+    cache_hits = 0
+    remaining = iter(range(count))
+
+    async def worker():
+        nonlocal cache_hits
+        for _ in remaining:
+            request = scenario.build(ctx)
+            start = time.perf_counter()
+            response = await client.request(scenario.method, **request)
+            await response.aread()
+            latencies.append(time.perf_counter() - start)
+
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            match = SERVER_TIMING_QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                queries.append(int(match.group(1)))
+            cache_hits += response.headers.get("x-cache") == "HIT"
+            if scenario.after:
+                scenario.after(ctx, response)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        **summarize(latencies),
+        "throughput_rps": round(count / elapsed, 1),
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "cache_hit_ratio": round(cache_hits / count, 3),
+        "errors": sum(n for status, n in statuses.items() if status not in scenario.expect),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+    }
+
+
+def uncovered_routes(openapi: dict) -> list[str]:
+    covered = {(scenario.method, scenario.route) for scenario in SCENARIOS}
+    return sorted(
+        f"{method.upper()} {path}"
+        for path, operations in openapi["paths"].items()
+        for method in operations
+        if (method.upper(), path) not in covered
+    )
+
+
+def compare(baseline: dict, current: dict, tolerance: float, min_delta_ms: float) -> list[dict]:
+    """
+    Routes whose p95 grew by more than tolerance (and min_delta_ms,
+    to ignore noise on sub-millisecond routes), or that now run
+    more queries per request.
+    """
+
+    regressions = []
+    for name, now in current["routes"].items():
+        before = baseline["routes"].get(name)
+        if before is None:
+            continue
+
+        if now["p95_ms"] > before["p95_ms"] * (1 + tolerance) and now["p95_ms"] - before["p95_ms"] > min_delta_ms:
+            regressions.append({"route": name, "metric": "p95_ms", "baseline": before["p95_ms"], "current": now["p95_ms"]})
+
+        if (now["queries_per_request"] or 0) > (before["queries_per_request"] or 0) + 0.5:
+            regressions.append({
+                "route": name, "metric": "queries_per_request",
+                "baseline": before["queries_per_request"], "current": now["queries_per_request"],
+            })
+
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_client(args) -> httpx.AsyncClient:
+    if args.client == "http":
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        return httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60)
+
+    from app.main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+
+async def main(args):
+    ctx = setup_data(args)
+    selected = [s for s in SCENARIOS if not args.only or any(part in s.name for part in args.only)]
+
+    results = {}
+    try:
+        async with make_client(args) as client:
+            login = await client.post("/auth/login", data={"username": ADMIN, "password": PASSWORD})
+            login.raise_for_status()
+            ctx.admin_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+            openapi = (await client.get("/openapi.json")).json()
+
+            for scenario in selected:
+                count = max(1, int(args.requests * scenario.share))
+                # Untimed warm-up: lazily built engines, indexes and pools
+                await run_scenario(client, scenario, ctx, min(args.warmup, count), 1)
+                results[scenario.name] = await run_scenario(client, scenario, ctx, count, args.concurrency)
+                print(f"{scenario.name}: {results[scenario.name]['p95_ms']} ms p95", file=sys.stderr)
+    finally:
+        cleanup()
+
+    db = SessionLocal()
+    try:
+        dataset = {
+            "fighters": db.scalar(select(func.count(Fighter.id))),
+            "events": db.scalar(select(func.count(Event.id))),
+            "fights": db.scalar(select(func.count(Fight.id))),
+        }
+    finally:
+        db.close()
+
+    report = {
+        "commit": git_commit(),
+        "database": engine.dialect.name,
+        "client": args.client,
+        "dataset": dataset,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "uncovered": uncovered_routes(openapi),
+        "routes": results,
+    }
+
+    if args.save:
+        BASELINES.mkdir(exist_ok=True)
+        (BASELINES / f"{args.save}.json").write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads((BASELINES / f"{args.compare}.json").read_text())
+        report["baseline_commit"] = baseline.get("commit")
+        report["regressions"] = compare(baseline, report, args.tolerance, args.min_delta_ms)
+
+    print(json.dumps(report, indent=2))
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--client", choices=["asgi", "http"], default="asgi")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Run routes whose name contains any of these")
+    parser.add_argument("--fighters", type=int, default=50000)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--fights", type=int, default=300000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", metavar="NAME")
+    parser.add_argument("--compare", metavar="NAME")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 growth (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,169 @@
+"""
+Delivery latency of GET /events/{id}/stream with many idle streams.
+
+Against a running server (streams need real connections):
+
+1. open --streams streams on one card and wait until all are live
+2. post --updates results for a bout on that card (?wait=true)
+3. report, per update, the time from posting it until each stream
+   received it, and how many deliveries were missed
+
+With --server-pid, the server's resident memory is sampled before
+and after the streams open, for the cost of one idle stream. The
+card, its fighters and results are "Benchmark" rows, removed at the
+end; run it against the server's database (DATABASE_URL).
+
+Usage (from backend/, against a scratch database):
+    uvicorn app.main:app --port 8000 &
+    python -m benchmarks.stream_fanout --streams 2000 --updates 50 --server-pid $!
+
+    STREAM_BACKEND=postgres uvicorn app.main:app --workers 4 &
+    python -m benchmarks.stream_fanout --streams 2000
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+
+import httpx
+
+import app.models  # ensures all models are registered
+from app.core.security import hash_password
+from app.database import Base, SessionLocal, engine
+from app.models.event import Event
+from app.models.fighter import Fighter
+from app.models.user import User
+from benchmarks.login_storm import summarize
+from benchmarks.routes import ADMIN, MARKER, PASSWORD, cleanup
+
+
+def setup_data() -> tuple[int, int, int]:
+    """
+    The admin, and a card with one bout between two new fighters.
+    """
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if not db.query(User).filter(User.username == ADMIN).first():
+            db.add(User(
+                username=ADMIN,
+                email=f"{ADMIN}@bench.local",
+                hashed_password=hash_password(PASSWORD),
+                role="admin",
+            ))
+        card = Event(name=f"{MARKER} stream card", event_date=date.today() + timedelta(days=400))
+        red = Fighter(first_name="Red", last_name=MARKER)
+        blue = Fighter(first_name="Blue", last_name=MARKER)
+        db.add_all([card, red, blue])
+        db.commit()
+        return card.id, red.id, blue.id
+    finally:
+        db.close()
+
+
+def rss_mb(pid: int | None) -> float | None:
+    if pid is None:
+        return None
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return None
+
+
+async def listen(client: httpx.AsyncClient, url: str, live: list, received: dict):
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line.startswith("retry:"):
+                live.append(True)
+            elif line.startswith("data: "):
+                fight = json.loads(line[6:]).get("fight") or {}
+                # The update number travels in the method
+                update = fight.get("method", "").rpartition("#")[2]
+                if update.isdigit():
+                    received.setdefault(int(update), []).append(time.perf_counter())
+
+
+async def main(args):
+    event_id, red, blue = setup_data()
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    timeout = httpx.Timeout(None, connect=30)
+
+    try:
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout) as client:
+            login = await client.post("/auth/login", data={"username": ADMIN, "password": PASSWORD})
+            login.raise_for_status()
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            rss_before = rss_mb(args.server_pid)
+            live, received = [], {}
+            start = time.perf_counter()
+            readers = [
+                asyncio.create_task(listen(client, f"/events/{event_id}/stream", live, received))
+                for _ in range(args.streams)
+            ]
+            while len(live) < args.streams:
+                failed = [task for task in readers if task.done()]
+                if failed:
+                    failed[0].result()
+                await asyncio.sleep(0.05)
+            connect_s = time.perf_counter() - start
+            await asyncio.sleep(1)
+            rss_after = rss_mb(args.server_pid)
+
+            sent = {}
+            for update in range(args.updates):
+                sent[update] = time.perf_counter()
+                response = await client.post(
+                    f"/events/{event_id}/results",
+                    params={"wait": True},
+                    headers={**headers, "Idempotency-Key": f"bench-stream-{time.time_ns()}-{update}"},
+                    json={
+                        "fighter_1_id": red,
+                        "fighter_2_id": blue,
+                        "winner_id": (red, blue)[update % 2],
+                        "method": f"KO/TKO #{update}",
+                        "round": 1,
+                    },
+                )
+                response.raise_for_status()
+                await asyncio.sleep(args.interval)
+
+            # Let the last update reach every stream
+            deadline = time.perf_counter() + 10
+            while (sum(len(times) for times in received.values()) < args.streams * args.updates
+                   and time.perf_counter() < deadline):
+                await asyncio.sleep(0.05)
+
+            for task in readers:
+                task.cancel()
+            await asyncio.gather(*readers, return_exceptions=True)
+    finally:
+        cleanup()
+
+    latencies = [at - sent[update] for update, times in received.items() for at in times]
+    result = {
+        "streams": args.streams,
+        "updates": args.updates,
+        "connect_s": round(connect_s, 2),
+        "delivery": summarize(latencies) if latencies else None,
+        "missed": args.streams * args.updates - len(latencies),
+    }
+    if rss_before is not None:
+        result["server_rss_mb"] = {"before": round(rss_before, 1), "after": round(rss_after, 1)}
+        result["kb_per_stream"] = round((rss_after - rss_before) * 1024 / args.streams, 1)
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--streams", type=int, default=1000)
+    parser.add_argument("--updates", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.1, help="Seconds between updates")
+    parser.add_argument("--server-pid", type=int, default=None)
+    asyncio.run(main(parser.parse_args()))
@@ -1,6 +1,12 @@
 import os
+
+# Hash inline with a cheap cost factor; the worker pool is covered in test_password_pool.py
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
@@ -8,6 +14,11 @@ from app.main import app as fastapi_app
 from app.database import Base
 from app.database import get_db  # <-- adjust if needed
 from app.core.settings import settings
+from app.core.user_status import user_status_cache
+from app.core.broadcast import broadcaster
+from app.core.cache import response_cache
+from app.core.search import fighter_search_index
+from app.analytics import analytics_engine, feature_store, rating_engine
 # Force model imports
 import app.models
 
@@ -23,6 +34,14 @@ TestingSessionLocal = sessionmaker(
 def setup_test_db():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # User ids are reused after the reset
+    user_status_cache.clear()
+    analytics_engine.invalidate()
+    rating_engine.reset()
+    feature_store.reset()
+    response_cache.clear()
+    fighter_search_index.reset()
+    broadcaster.reset()
     yield
 
 @pytest.fixture()
@@ -33,6 +52,27 @@ def db_session():
     finally:
         session.close()
 
+@pytest.fixture()
+def count_queries():
+    """
+    Context manager that records SQL statements sent through the test engine.
+    """
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
+
 @pytest.fixture()
 def client(db_session):
     def override_get_db():
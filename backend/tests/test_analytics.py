@@ -0,0 +1,178 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.analytics.loader import (
+    METHOD_DECISION,
+    METHOD_KO,
+    METHOD_NO_CONTEST,
+    METHOD_SUBMISSION,
+    classify_method,
+    load_fight_columns,
+)
+from app.analytics.metrics import build_appearances, win_streaks
+from app.models import Event, Fight, Fighter
+
+
+def seed_career(db_session):
+    """
+    Red's career, oldest first:
+    W (KO r1), W (Sub r3), L, W (Dec), NC, W (TKO r2), scheduled.
+    """
+
+    today = date.today()
+    red = Fighter(first_name="Alex", last_name="Pereira")
+    blue = Fighter(first_name="Israel", last_name="Adesanya")
+    db_session.add_all([red, blue])
+
+    bouts = [
+        (today - timedelta(days=900), "red", "KO", 1),
+        (today - timedelta(days=700), "red", "Submission", 3),
+        (today - timedelta(days=500), "blue", "Decision", 3),
+        (today - timedelta(days=300), "red", "Unanimous Decision", 3),
+        (today - timedelta(days=200), None, "NC", 1),
+        (today - timedelta(days=100), "red", "TKO", 2),
+        (today + timedelta(days=30), None, None, None),
+    ]
+    for day, winner, method, round_ in bouts:
+        event = Event(name=f"Card {day}", event_date=day)
+        db_session.add(event)
+        db_session.add(Fight(
+            event=event,
+            fighter_1=red,
+            fighter_2=blue,
+            winner={"red": red, "blue": blue, None: None}[winner],
+            method=method,
+            round=round_,
+        ))
+
+    db_session.commit()
+    return red.id, blue.id
+
+
+def test_classify_method():
+    assert classify_method("KO/TKO") == METHOD_KO
+    assert classify_method("Submission (RNC)") == METHOD_SUBMISSION
+    assert classify_method("Split Decision") == METHOD_DECISION
+    assert classify_method(" No Contest ") == METHOD_NO_CONTEST
+
+
+def test_fighter_analytics(client, db_session):
+    red_id, blue_id = seed_career(db_session)
+
+    response = client.get(f"/fighters/{red_id}/analytics")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert (data["fights"], data["wins"], data["losses"], data["no_contests"]) == (6, 4, 1, 1)
+    # The no contest doesn't break the streak
+    assert data["current_win_streak"] == 2
+    assert data["longest_win_streak"] == 2
+    assert data["ko_rate"] == 0.5
+    assert data["submission_rate"] == 0.25
+    assert data["decision_rate"] == 0.25
+    assert data["finish_rate"] == 0.75
+    assert data["avg_finish_round"] == 2.0
+    assert data["fights_last_year"] == 3
+    assert sum(data["fights_by_year"].values()) == 6
+
+    blue = client.get(f"/fighters/{blue_id}/analytics").json()
+    assert blue["current_win_streak"] == 0
+    assert blue["longest_win_streak"] == 1
+    assert blue["avg_finish_round"] is None
+
+    assert client.get("/fighters/9999/analytics").status_code == 404
+
+
+def test_fighter_without_fights(client, db_session):
+    fighter = Fighter(first_name="New", last_name="Prospect")
+    db_session.add(fighter)
+    db_session.commit()
+
+    data = client.get(f"/fighters/{fighter.id}/analytics").json()
+    assert data["fights"] == 0
+    assert data["last_fight_date"] is None
+
+
+def test_cache_refreshes_after_fight_write(client, db_session, admin_token):
+    red_id, blue_id = seed_career(db_session)
+    assert client.get(f"/fighters/{red_id}/analytics").json()["wins"] == 4
+
+    event = db_session.query(Event).order_by(Event.event_date.desc()).first()
+    response = client.post(
+        "/fights",
+        json={
+            "event_id": event.id,
+            "fighter_1_id": red_id,
+            "fighter_2_id": blue_id,
+            "winner_id": red_id,
+            "method": "KO",
+            "round": 1,
+        },
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 201
+
+    data = client.get(f"/fighters/{red_id}/analytics").json()
+    assert data["wins"] == 5
+    assert data["current_win_streak"] == 3
+
+
+def test_leaderboard(client, db_session):
+    red_id, blue_id = seed_career(db_session)
+
+    response = client.get("/analytics/leaderboard", params={"metric": "wins"})
+    assert response.status_code == 200
+    rows = response.json()
+    assert [(row["rank"], row["fighter_id"], row["value"]) for row in rows] == [
+        (1, red_id, 4),
+        (2, blue_id, 1),
+    ]
+    assert rows[0]["last_name"] == "Pereira"
+
+    rows = client.get(
+        "/analytics/leaderboard", params={"metric": "finish_rate", "min_fights": 7}
+    ).json()
+    assert rows == []
+
+    assert client.get("/analytics/leaderboard", params={"metric": "bogus"}).status_code == 422
+
+
+def test_streaks_match_row_by_row(db_session):
+    rng = np.random.default_rng(7)
+    fighters = [Fighter(first_name="F", last_name=str(i)) for i in range(20)]
+    db_session.add_all(fighters)
+    event = Event(name="Big Card", event_date=date(2024, 1, 1))
+    db_session.add(event)
+
+    for _ in range(400):
+        a, b = rng.choice(20, size=2, replace=False)
+        outcome = rng.integers(4)
+        db_session.add(Fight(
+            event=event,
+            fighter_1=fighters[a],
+            fighter_2=fighters[b],
+            winner=[fighters[a], fighters[b], None, None][outcome],
+            method=["KO", "Decision", "Draw", "NC"][outcome],
+        ))
+    db_session.commit()
+
+    apps = build_appearances(load_fight_columns(db_session))
+    current, longest = win_streaks(apps)
+
+    for fighter in fighters:
+        fights = (
+            db_session.query(Fight)
+            .filter((Fight.fighter_1_id == fighter.id) | (Fight.fighter_2_id == fighter.id))
+            .order_by(Fight.id)
+            .all()
+        )
+        run = best = 0
+        for fight in fights:
+            if fight.method == "NC":
+                continue
+            run = run + 1 if fight.winner_id == fighter.id else 0
+            best = max(best, run)
+
+        pos = int(np.searchsorted(apps.fighter_ids, fighter.id))
+        assert (current[pos], longest[pos]) == (run, best)
@@ -0,0 +1,87 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.dependencies import require_admin
+from app.core.settings import settings
+from app.database_async import get_async_db, to_async_url
+from app.routes import async_event, async_fight, async_fighter
+
+
+def test_to_async_url():
+    assert to_async_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert to_async_url("postgresql+psycopg2://u:p@db/app") == "postgresql+asyncpg://u:p@db/app"
+    assert to_async_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+@pytest.fixture()
+def async_client():
+    # NullPool: connections never outlive the TestClient event loop
+    engine = create_async_engine(to_async_url(settings.DATABASE_URL), poolclass=NullPool)
+    session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_fighter.router)
+    app.include_router(async_event.router)
+    app.include_router(async_fight.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[require_admin] = lambda: None
+
+    with TestClient(app) as c:
+        yield c
+
+
+def test_async_crud_flow(async_client):
+    event = async_client.post(
+        "/events",
+        json={"name": "UFC 300", "location": "Las Vegas, NV", "event_date": "2024-04-13"},
+    )
+    assert event.status_code == 201
+
+    fighter_ids = []
+    for last_name in ["Pereira", "Hill"]:
+        response = async_client.post(
+            "/fighters", json={"first_name": "Test", "last_name": last_name}
+        )
+        assert response.status_code == 201
+        fighter_ids.append(response.json()["id"])
+
+    page = async_client.get("/fighters?limit=1")
+    assert [f["last_name"] for f in page.json()] == ["Hill"]
+    assert "X-Next-Cursor" in page.headers
+
+    search = async_client.get("/fighters/search", params={"q": "pereria"})
+    assert search.status_code == 200
+    assert search.json()[0]["last_name"] == "Pereira"
+
+    fight = async_client.post(
+        "/fights",
+        json={
+            "event_id": event.json()["id"],
+            "fighter_1_id": fighter_ids[0],
+            "fighter_2_id": fighter_ids[1],
+            "winner_id": fighter_ids[0],
+            "method": "KO",
+            "round": 1,
+        },
+    )
+    assert fight.status_code == 201
+
+    card = async_client.get(f"/events/{event.json()['id']}/card")
+    assert card.status_code == 200
+    assert card.json()["fights"][0]["winner"]["last_name"] == "Pereira"
+
+
+def test_async_create_fight_validation(async_client):
+    response = async_client.post(
+        "/fights",
+        json={"event_id": 99999, "fighter_1_id": 1, "fighter_2_id": 2},
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Event not found"
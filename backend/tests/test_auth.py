@@ -0,0 +1,91 @@
+from app.core.security import hash_password
+from app.models.user import User
+
+
+def create_user(db_session, username, role="user"):
+    user = User(
+        username=username,
+        email=f"{username}@test.com",
+        hashed_password=hash_password("StrongPassword123!"),
+        role=role,
+        is_active=True
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def login(client, username):
+    response = client.post(
+        "/auth/login",
+        data={"username": username, "password": "StrongPassword123!"}
+    )
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def test_authenticated_request_skips_user_lookup(client, admin_token, count_queries):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    payload = {"first_name": "Jon", "last_name": "Jones"}
+
+    # First request warms the user status cache
+    assert client.post("/fighters", json=payload, headers=headers).status_code == 201
+
+    with count_queries() as statements:
+        assert client.post("/fighters", json=payload, headers=headers).status_code == 201
+
+    assert not any("FROM users" in statement for statement in statements)
+
+
+def test_role_change_revokes_old_tokens(client, admin_token, db_session):
+    other = create_user(db_session, "otheradmin", role="admin")
+    other_headers = login(client, "otheradmin")
+
+    assert client.post(
+        "/fighters", json={"first_name": "A", "last_name": "B"}, headers=other_headers
+    ).status_code == 201
+
+    response = client.patch(
+        f"/users/{other.id}/role",
+        json={"role": "user"},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    assert response.status_code == 200
+
+    # Token still claims role=admin but its version is stale
+    response = client.post(
+        "/fighters", json={"first_name": "A", "last_name": "B"}, headers=other_headers
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+    # A fresh token carries the new role
+    response = client.post(
+        "/fighters", json={"first_name": "A", "last_name": "B"}, headers=login(client, "otheradmin")
+    )
+    assert response.status_code == 403
+
+
+def test_deactivation_revokes_tokens_and_blocks_login(client, admin_token, db_session):
+    user = create_user(db_session, "regular", role="admin")
+    user_headers = login(client, "regular")
+
+    response = client.patch(
+        f"/users/{user.id}/status",
+        json={"is_active": False},
+        headers={"Authorization": f"Bearer {admin_token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+    response = client.post(
+        "/fighters", json={"first_name": "A", "last_name": "B"}, headers=user_headers
+    )
+    assert response.status_code == 401
+
+    response = client.post(
+        "/auth/login",
+        data={"username": "regular", "password": "StrongPassword123!"}
+    )
+    assert response.status_code == 401
@@ -0,0 +1,106 @@
+from datetime import date
+
+import pytest
+
+from app.models import Event, Fight, Fighter
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache(monkeypatch):
+    """
+    Exercise the routes themselves, not cached copies.
+    """
+    import app.core.cache as cache_module
+    monkeypatch.setattr(cache_module.ResponseCache, "get", lambda self, key: None)
+
+
+def test_fighter_etag_and_304(client, db_session, count_queries):
+    fighter = Fighter(first_name="Alex", last_name="Pereira")
+    db_session.add(fighter)
+    db_session.commit()
+
+    first = client.get(f"/fighters/{fighter.id}")
+    etag = first.headers["etag"]
+    assert etag.startswith('"')
+    assert first.headers["last-modified"].endswith("GMT")
+
+    with count_queries() as queries:
+        response = client.get(f"/fighters/{fighter.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert len(queries) == 1
+
+    # Last-Modified works as a fallback validator
+    response = client.get(
+        f"/fighters/{fighter.id}",
+        headers={"If-Modified-Since": first.headers["last-modified"]},
+    )
+    assert response.status_code == 304
+
+    # Any update moves updated_at and the ETag
+    fighter.nickname = "Poatan"
+    db_session.commit()
+    response = client.get(f"/fighters/{fighter.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_collection_versions(client, db_session, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    db_session.add_all([Fighter(first_name="A", last_name="One"), Fighter(first_name="B", last_name="Two")])
+    db_session.commit()
+
+    etag = client.get("/fighters").headers["etag"]
+    assert client.get("/fighters?limit=1", headers={"If-None-Match": etag}).status_code == 304
+
+    fighter_id = db_session.query(Fighter).filter_by(last_name="Two").one().id
+    assert client.delete(f"/fighters/{fighter_id}", headers=headers).status_code == 204
+    assert client.get("/fighters", headers={"If-None-Match": etag}).status_code == 200
+
+    db_session.add(Event(name="UFC 300", event_date=date(2024, 4, 13)))
+    db_session.commit()
+    etag = client.get("/events").headers["etag"]
+    assert client.get("/events", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/events", headers={"If-None-Match": '"stale", ' + etag}).status_code == 304
+    assert client.get("/events", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_card_etag_follows_fights_and_fighters(client, db_session):
+    event = Event(name="UFC 300", event_date=date(2024, 4, 13))
+    red = Fighter(first_name="Alex", last_name="Pereira")
+    blue = Fighter(first_name="Jamahal", last_name="Hill")
+    db_session.add_all([event, red, blue])
+    db_session.commit()
+
+    def card_etag():
+        response = client.get(f"/events/{event.id}/card")
+        assert response.status_code == 200
+        return response.headers["etag"]
+
+    empty = card_etag()
+    assert client.get(f"/events/{event.id}/card", headers={"If-None-Match": empty}).status_code == 304
+
+    db_session.add(Fight(event=event, fighter_1=red, fighter_2=blue))
+    db_session.commit()
+    with_fight = card_etag()
+    assert with_fight != empty
+
+    red.nickname = "Poatan"
+    db_session.commit()
+    assert card_etag() != with_fight
+
+    assert client.get("/events/999/card").status_code == 404
+
+
+def test_cached_hit_answers_304(client, db_session, monkeypatch):
+    monkeypatch.undo()  # use the response cache
+    fighter = Fighter(first_name="Alex", last_name="Pereira")
+    db_session.add(fighter)
+    db_session.commit()
+
+    etag = client.get(f"/fighters/{fighter.id}").headers["etag"]
+    response = client.get(f"/fighters/{fighter.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["x-cache"] == "HIT"
+    assert response.headers["etag"] == etag
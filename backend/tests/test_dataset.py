@@ -0,0 +1,52 @@
+from datetime import date
+
+from sqlalchemy import func, select
+
+from app.dataset import generate_dataset
+from app.models import Event, Fight, Fighter
+from app.models.fighter_stats import FighterStats
+
+
+def test_generate_dataset(db_session):
+    today = date(2024, 6, 1)
+    counts = generate_dataset(db_session, fighters=200, events=40, fights=600, seed=3, today=today)
+    assert counts == {"fighters": 200, "events": 40, "fights": 600}
+
+    fights = db_session.execute(
+        select(Fight.fighter_1_id, Fight.fighter_2_id, Fight.winner_id, Fight.method, Fight.round,
+               Event.event_date)
+        .join(Event, Event.id == Fight.event_id)
+    ).all()
+    assert len(fights) == 600
+
+    for fighter_1, fighter_2, winner, method, rounds, event_date in fights:
+        assert fighter_1 != fighter_2
+        if event_date > today:
+            # Scheduled, not fought yet
+            assert (winner, method, rounds) == (None, None, None)
+            continue
+
+        assert winner in (fighter_1, fighter_2) or method.startswith("Decision") or method == "NC"
+        if method.startswith("Decision"):
+            assert rounds in (3, 5)
+        else:
+            assert 1 <= rounds <= 5
+
+    methods = {fight.method for fight in fights}
+    assert {"KO/TKO", "Submission", "Decision - Unanimous"} <= methods
+
+    # Records were rebuilt from the generated fights
+    decided = sum(1 for fight in fights if fight.winner_id is not None)
+    assert db_session.scalar(select(func.sum(FighterStats.wins))) == decided
+    assert db_session.scalar(select(func.count(FighterStats.fighter_id))) == 200
+
+
+def test_generate_dataset_is_deterministic(db_session):
+    generate_dataset(db_session, fighters=50, events=10, fights=100, seed=11, today=date(2024, 6, 1))
+    generate_dataset(db_session, fighters=50, events=10, fights=100, seed=11, today=date(2024, 6, 1))
+
+    names = db_session.execute(select(Fighter.first_name, Fighter.last_name).order_by(Fighter.id)).all()
+    assert names[:50] == names[50:]
+
+    fights = db_session.execute(select(Fight.method, Fight.round).order_by(Fight.id)).all()
+    assert fights[:100] == fights[100:]
@@ -0,0 +1,103 @@
+def create_events(client, admin_token):
+    headers = {
+        "Authorization": f"Bearer {admin_token}"
+    }
+
+    events = [
+        {"name": "UFC 300", "location": "Las Vegas, NV", "event_date": "2024-04-13"},
+        {"name": "UFC 229", "location": "Las Vegas, NV", "event_date": "2018-10-06"},
+        {"name": "UFC 251", "location": "Abu Dhabi, UAE", "event_date": "2020-07-11"},
+    ]
+
+    for event in events:
+        response = client.post("/events", json=event, headers=headers)
+        assert response.status_code == 201
+
+
+def test_get_events_filters(client, admin_token):
+    create_events(client, admin_token)
+
+    response = client.get("/events?from=2019-01-01&to=2024-12-31")
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()] == ["UFC 251", "UFC 300"]
+
+    response = client.get("/events?location=las vegas&sort=desc")
+    assert response.status_code == 200
+    assert [e["name"] for e in response.json()] == ["UFC 300", "UFC 229"]
+
+
+def test_get_events_cursor_pagination(client, admin_token):
+    create_events(client, admin_token)
+
+    first_page = client.get("/events?limit=2&sort=desc")
+    assert first_page.status_code == 200
+    assert [e["name"] for e in first_page.json()] == ["UFC 300", "UFC 251"]
+
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get(f"/events?limit=2&sort=desc&after={cursor}")
+    assert second_page.status_code == 200
+    assert [e["name"] for e in second_page.json()] == ["UFC 229"]
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def seed_card(db_session, name, bouts):
+    from datetime import date
+    from app.models import Event, Fight, Fighter
+
+    event = Event(name=name, location="Las Vegas, NV", event_date=date(2024, 4, 13))
+    db_session.add(event)
+
+    for i in range(bouts):
+        red = Fighter(first_name=f"Red{i}", last_name="Corner")
+        blue = Fighter(first_name=f"Blue{i}", last_name="Corner")
+        db_session.add_all([red, blue])
+        db_session.add(
+            Fight(event=event, fighter_1=red, fighter_2=blue, winner=red, method="KO", round=1)
+        )
+
+    db_session.commit()
+    return event.id
+
+
+def test_get_event_card_constant_queries(client, db_session, count_queries):
+    small_id = seed_card(db_session, "UFC 1", bouts=1)
+    large_id = seed_card(db_session, "UFC 2", bouts=12)
+    db_session.expunge_all()
+
+    with count_queries() as small_queries:
+        response = client.get(f"/events/{small_id}/card")
+    assert response.status_code == 200
+
+    db_session.expunge_all()
+
+    with count_queries() as large_queries:
+        response = client.get(f"/events/{large_id}/card")
+    assert response.status_code == 200
+
+    card = response.json()
+    assert len(card["fights"]) == 12
+    assert card["fights"][0]["fighter_1"]["first_name"] == "Red0"
+    assert card["fights"][0]["winner"]["first_name"] == "Red0"
+
+    # Card version (ETag) + event + fights with fighters
+    assert len(large_queries) == len(small_queries) == 3
+
+
+def test_get_event_cards_bulk(client, db_session, count_queries):
+    event_ids = [seed_card(db_session, f"UFC {i}", bouts=i + 1) for i in range(3)]
+    db_session.expunge_all()
+
+    query = "&".join(f"ids={event_id}" for event_id in event_ids)
+
+    with count_queries() as queries:
+        response = client.get(f"/events/cards?{query}&ids=99999")
+    assert response.status_code == 200
+
+    assert [len(card["fights"]) for card in response.json()] == [1, 2, 3]
+    assert len(queries) == 2
+
+
+def test_get_event_card_not_found(client):
+    response = client.get("/events/99999/card")
+    assert response.status_code == 404
@@ -0,0 +1,131 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.core.settings import settings
+from app.models import Event, Fight, Fighter
+from app.services import export_service
+
+
+def seed(db_session):
+    fighters = [
+        Fighter(first_name=f"Fighter{i}", last_name=f"Export{i}", height_cm=180 + i)
+        for i in range(5)
+    ]
+    event = Event(name="UFC Export", location="Las Vegas, NV", event_date=date(2024, 3, 9))
+    db_session.add_all(fighters + [event])
+    db_session.flush()
+    db_session.add(Fight(
+        event_id=event.id,
+        fighter_1_id=fighters[0].id,
+        fighter_2_id=fighters[1].id,
+        winner_id=fighters[0].id,
+        method="KO",
+        round=1,
+    ))
+    db_session.commit()
+    return fighters, event
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_ndjson(client, db_session):
+    fighters, event = seed(db_session)
+
+    response = client.get("/export/fighters")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "x-export-as-of" in response.headers
+    rows = read_ndjson(response)
+    assert [row["id"] for row in rows] == [fighter.id for fighter in fighters]
+    assert rows[0]["first_name"] == "Fighter0"
+    assert rows[0]["height_cm"] == 180
+    assert "updated_at" in rows[0]
+
+    fights = read_ndjson(client.get("/export/fights"))
+    assert fights[0]["winner_id"] == fighters[0].id
+    assert fights[0]["method"] == "KO"
+
+    events = read_ndjson(client.get("/export/events"))
+    assert events[0]["event_date"] == "2024-03-09"
+
+
+def test_export_csv(client, db_session):
+    seed(db_session)
+
+    response = client.get("/export/fighters", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 5
+    assert rows[2]["last_name"] == "Export2"
+    assert rows[2]["nickname"] == ""
+    assert rows[2]["height_cm"] == "182"
+
+
+def test_export_gzip(client, db_session):
+    seed(db_session)
+
+    response = client.get(
+        "/export/fighters", headers={"Accept-Encoding": "gzip"}, params={"format": "csv"}
+    )
+
+    # The test client decodes Content-Encoding: gzip transparently
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.text.splitlines()) == 6
+
+    with client.stream(
+        "GET", "/export/fighters", headers={"Accept-Encoding": "gzip"}
+    ) as streamed:
+        raw = b"".join(streamed.iter_raw())
+    assert len(gzip.decompress(raw).splitlines()) == 5
+
+    plain = client.get("/export/fighters", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+def test_export_updated_since(client, db_session):
+    fighters, _ = seed(db_session)
+    # Written well before the overlap window
+    db_session.execute(update(Fighter).values(updated_at=datetime.now(timezone.utc) - timedelta(hours=1)))
+    db_session.commit()
+
+    started = datetime.now(timezone.utc)
+    as_of = client.get("/export/fighters").headers["x-export-as-of"]
+    # Reaches back over writes still committing during the export
+    assert datetime.fromisoformat(as_of) <= started - timedelta(seconds=settings.EXPORT_OVERLAP_SECONDS) + timedelta(seconds=1)
+    assert read_ndjson(client.get("/export/fighters", params={"updated_since": as_of})) == []
+
+    fighters[3].nickname = "Changed"
+    db_session.commit()
+
+    rows = read_ndjson(client.get("/export/fighters", params={"updated_since": as_of}))
+    assert [row["id"] for row in rows] == [fighters[3].id]
+    assert rows[0]["nickname"] == "Changed"
+
+    # Naive timestamps are read as UTC
+    naive = (datetime.now(timezone.utc) - timedelta(hours=2)).replace(tzinfo=None)
+    rows = read_ndjson(client.get("/export/fighters", params={"updated_since": naive.isoformat()}))
+    assert len(rows) == 5
+
+
+def test_export_streams_in_batches(client, db_session, monkeypatch):
+    seed(db_session)
+    monkeypatch.setattr(export_service, "BATCH_SIZE", 2)
+
+    chunks = list(export_service.stream_export("fighters", "ndjson"))
+
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+def test_export_unknown_table(client):
+    assert client.get("/export/users").status_code == 422
+    assert client.get("/export/fighters", params={"format": "xml"}).status_code == 422
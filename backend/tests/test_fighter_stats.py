@@ -0,0 +1,112 @@
+from datetime import date
+
+from app.models import Event, Fight, Fighter, FighterStats
+from app.services import stats_service
+
+
+def record(client, fighter_id):
+    response = client.get(f"/fighters/{fighter_id}/record")
+    assert response.status_code == 200
+    data = response.json()
+    return (data["wins"], data["losses"], data["draws"], data["no_contests"])
+
+
+def test_record_follows_fight_writes(client, admin_token, db_session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    event = Event(name="UFC 300", event_date=date(2024, 4, 13))
+    red = Fighter(first_name="Alex", last_name="Pereira")
+    blue = Fighter(first_name="Jamahal", last_name="Hill")
+    db_session.add_all([event, red, blue])
+    db_session.commit()
+    event_id, red_id, blue_id = event.id, red.id, blue.id
+
+    # No fights yet: empty record
+    assert record(client, red_id) == (0, 0, 0, 0)
+
+    bouts = [
+        {"winner_id": red_id, "method": "KO"},
+        {"winner_id": None, "method": "Decision"},
+        {"winner_id": None, "method": "No Contest"},
+        {"winner_id": None, "method": None},  # scheduled, not counted
+    ]
+    for bout in bouts:
+        response = client.post(
+            "/fights",
+            json={"event_id": event_id, "fighter_1_id": red_id, "fighter_2_id": blue_id, **bout},
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    assert record(client, red_id) == (1, 0, 1, 1)
+    assert record(client, blue_id) == (0, 1, 1, 1)
+
+    # Updating a result moves the counts
+    fight = db_session.query(Fight).filter(Fight.method == "Decision").one()
+    fight.winner_id = blue_id
+    db_session.commit()
+
+    assert record(client, red_id) == (1, 1, 0, 1)
+    assert record(client, blue_id) == (1, 1, 0, 1)
+
+    # Deleting a fight removes its contribution
+    db_session.delete(db_session.query(Fight).filter(Fight.method == "KO").one())
+    db_session.commit()
+
+    assert record(client, red_id) == (0, 1, 0, 1)
+    assert record(client, blue_id) == (1, 0, 0, 1)
+
+
+def test_rebuild_matches_incremental(db_session):
+    event = Event(name="UFC 1", event_date=date(1993, 11, 12))
+    fighters = [Fighter(first_name=f"F{i}", last_name="Test") for i in range(4)]
+    db_session.add_all([event, *fighters])
+    db_session.flush()
+
+    a, b, c, d = fighters
+    db_session.add_all([
+        Fight(event=event, fighter_1=a, fighter_2=b, winner=a, method="KO"),
+        Fight(event=event, fighter_1=c, fighter_2=a, winner=c, method="Submission"),
+        Fight(event=event, fighter_1=b, fighter_2=c, method="Draw"),
+        Fight(event=event, fighter_1=a, fighter_2=c, method="NC"),
+    ])
+    db_session.commit()
+
+    def snapshot():
+        db_session.expire_all()
+        return {
+            stats.fighter_id: (stats.wins, stats.losses, stats.draws, stats.no_contests)
+            for stats in db_session.query(FighterStats)
+        }
+
+    incremental = snapshot()
+
+    assert stats_service.rebuild_fighter_stats(db_session) == 4
+    rebuilt = snapshot()
+
+    # Rebuild also writes an empty row for fighters without fights
+    assert rebuilt == {**incremental, d.id: (0, 0, 0, 0)}
+    assert rebuilt[a.id] == (1, 1, 0, 1)
+
+
+def test_record_unknown_fighter(client):
+    response = client.get("/fighters/99999/record")
+    assert response.status_code == 404
+
+
+def test_hand_entered_record_is_read_only(client, admin_token, db_session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    fighter = Fighter(first_name="Alex", last_name="Pereira", wins=9)
+    db_session.add(fighter)
+    db_session.commit()
+
+    response = client.patch(f"/fighters/{fighter.id}", json={"wins": 10}, headers=headers)
+    assert response.status_code == 422
+    assert client.get(f"/fighters/{fighter.id}").json()["wins"] == 9
+
+    # Still served, marked deprecated for clients
+    schema = client.get("/openapi.json").json()["components"]["schemas"]
+    for field in ("wins", "losses", "draws"):
+        assert schema["FighterResponse"]["properties"][field]["deprecated"] is True
+        assert schema["FighterResponse"]["properties"][field]["readOnly"] is True
+        assert field not in schema["FighterUpdate"]["properties"]
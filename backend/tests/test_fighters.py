@@ -1,3 +1,6 @@
+from app.core.pagination import encode_cursor
+
+
 def test_create_fighter(client, admin_token):
     payload = {
         "first_name": "Jon",
@@ -78,4 +81,193 @@ def test_get_fighters_pagination(client, admin_token):
     assert response.status_code == 200
 
     data = response.json()
-    assert len(data) == 1
\ No newline at end of file
+    assert len(data) == 1
+
+def test_get_fighters_keyset_cursor(client, admin_token):
+    headers = {
+        "Authorization": f"Bearer {admin_token}"
+    }
+
+    for last_name in ["Silva", "Adesanya", "Jones", "Adesanya"]:
+        response = client.post(
+            "/fighters",
+            json={"first_name": "Test", "last_name": last_name},
+            headers=headers
+        )
+        assert response.status_code == 201
+
+    first_page = client.get("/fighters?limit=3")
+    assert first_page.status_code == 200
+    assert [f["last_name"] for f in first_page.json()] == ["Adesanya", "Adesanya", "Jones"]
+
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get(f"/fighters?limit=3&after={cursor}")
+    assert second_page.status_code == 200
+    assert [f["last_name"] for f in second_page.json()] == ["Silva"]
+
+    # Last page carries no cursor
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_get_fighters_invalid_cursor(client):
+    response = client.get("/fighters?after=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+    # JSON true is not fighter 1, nor "1" and 1.5
+    for fighter_id in (True, "1", 1.5):
+        cursor = encode_cursor("Jones", fighter_id)
+        assert client.get(f"/fighters?after={cursor}").status_code == 400
+        assert client.get(f"/fighters/1/fights?after={encode_cursor('2024-01-01', fighter_id)}").status_code == 400
+
+
+def test_bulk_import_csv_reports_bad_rows(client, admin_token):
+    headers = {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "text/csv",
+    }
+
+    content = (
+        "first_name,last_name,nickname,date_of_birth,height_cm,reach_cm,stance\n"
+        "Israel,Adesanya,The Last Stylebender,1989-07-22,193,203,Switch\n"
+        "Alex,,,,,,\n"
+        "Alex,Pereira,Poatan,not-a-date,193,200,Orthodox\n"
+        "Max,Holloway,Blessed,,180,175,\n"
+    )
+
+    response = client.post("/fighters/bulk?batch_size=2", content=content, headers=headers)
+    assert response.status_code == 200
+
+    report = response.json()
+    assert report["received"] == 4
+    assert report["inserted"] == 2
+    assert report["failed"] == 2
+    assert [error["row"] for error in report["errors"]] == [2, 3]
+    assert report["errors"][0]["errors"] == ["last_name: Field required"]
+
+    fighters = client.get("/fighters").json()
+    assert [f["last_name"] for f in fighters] == ["Adesanya", "Holloway"]
+    assert fighters[0]["nickname"] == "The Last Stylebender"
+
+
+def test_bulk_import_jsonl(client, admin_token):
+    headers = {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "application/x-ndjson",
+    }
+
+    content = "\n".join([
+        '{"first_name": "Jon", "last_name": "Jones", "wins": 27}',
+        "not json",
+        '["not", "an", "object"]',
+        "",
+        '{"first_name": "Stipe", "last_name": "Miocic"}',
+    ])
+
+    response = client.post("/fighters/bulk", content=content, headers=headers)
+    assert response.status_code == 200
+
+    report = response.json()
+    assert report["inserted"] == 2
+    assert [error["row"] for error in report["errors"]] == [2, 3]
+
+
+def test_bulk_import_requires_known_format(client, admin_token):
+    headers = {
+        "Authorization": f"Bearer {admin_token}",
+        "Content-Type": "text/plain",
+    }
+
+    response = client.post("/fighters/bulk", content="x", headers=headers)
+    assert response.status_code == 415
+
+
+def test_fighter_fight_history(client, db_session, count_queries):
+    from datetime import date
+    from app.models import Event, Fight, Fighter
+
+    khabib = Fighter(first_name="Khabib", last_name="Nurmagomedov")
+    conor = Fighter(first_name="Conor", last_name="McGregor")
+    dustin = Fighter(first_name="Dustin", last_name="Poirier")
+    justin = Fighter(first_name="Justin", last_name="Gaethje")
+    db_session.add_all([khabib, conor, dustin, justin])
+
+    ufc_229 = Event(name="UFC 229", event_date=date(2018, 10, 6))
+    ufc_242 = Event(name="UFC 242", event_date=date(2019, 9, 7))
+    ufc_254 = Event(name="UFC 254", event_date=date(2020, 10, 24))
+    db_session.add_all([ufc_229, ufc_242, ufc_254])
+
+    db_session.add_all([
+        Fight(event=ufc_229, fighter_1=khabib, fighter_2=conor, winner=khabib, method="Submission", round=4),
+        Fight(event=ufc_242, fighter_1=dustin, fighter_2=khabib, winner=khabib, method="Submission", round=3),
+        Fight(event=ufc_254, fighter_1=khabib, fighter_2=justin, winner=khabib, method="Submission", round=2),
+        # Someone else's fight must not show up
+        Fight(event=ufc_254, fighter_1=conor, fighter_2=dustin, winner=dustin, method="KO", round=2),
+    ])
+    db_session.commit()
+    khabib_id, conor_id = khabib.id, conor.id
+    db_session.expunge_all()
+
+    with count_queries() as statements:
+        response = client.get(f"/fighters/{khabib_id}/fights?limit=2")
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+    first_page = response.json()
+    assert [entry["event_name"] for entry in first_page] == ["UFC 254", "UFC 242"]
+    assert first_page[1]["opponent"]["last_name"] == "Poirier"
+    assert first_page[1]["result"] == "win"
+    assert first_page[1]["round"] == 3
+
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/fighters/{khabib_id}/fights?limit=2&after={cursor}")
+    assert [entry["opponent"]["last_name"] for entry in response.json()] == ["McGregor"]
+    assert "X-Next-Cursor" not in response.headers
+
+    conor_history = client.get(f"/fighters/{conor_id}/fights").json()
+    assert [entry["result"] for entry in conor_history] == ["loss", "loss"]
+
+
+def test_fight_history_unknown_fighter(client):
+    response = client.get("/fighters/99999/fights")
+    assert response.status_code == 404
+
+
+def test_list_fast_path_matches_pydantic(client, db_session):
+    from datetime import date
+    from typing import List
+
+    from pydantic import TypeAdapter
+
+    from app.models.event import Event
+    from app.models.fighter import Fighter
+    from app.schemas.event import EventResponse
+    from app.schemas.fighter import FighterResponse
+
+    db_session.add_all([
+        Fighter(first_name="Alex", last_name="Pereira", nickname="Poatan",
+                date_of_birth=date(1987, 7, 7), height_cm=193, reach_cm=201, stance="Orthodox"),
+        Fighter(first_name="Jamahal", last_name="Hill"),
+        Event(name="UFC 300", location="Las Vegas", event_date=date(2024, 4, 13)),
+    ])
+    db_session.commit()
+
+    for url, model, schema in (
+        ("/fighters", Fighter, FighterResponse),
+        ("/events", Event, EventResponse),
+    ):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        expected = TypeAdapter(List[schema]).dump_python(
+            [schema.model_validate(obj) for obj in db_session.query(model).order_by(model.id)],
+            mode="json",
+        )
+        assert sorted(response.json(), key=lambda row: row["id"]) == expected
+
+    # The documented response shape is unchanged
+    schema = client.get("/openapi.json").json()
+    fighters_200 = schema["paths"]["/fighters"]["get"]["responses"]["200"]
+    assert fighters_200["content"]["application/json"]["schema"]["items"]["$ref"].endswith("/FighterResponse")
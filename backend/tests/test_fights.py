@@ -0,0 +1,103 @@
+import pytest
+
+
+@pytest.fixture()
+def card(client, admin_token):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    event = client.post(
+        "/events",
+        json={"name": "UFC 300", "location": "Las Vegas, NV", "event_date": "2024-04-13"},
+        headers=headers,
+    )
+    assert event.status_code == 201
+
+    fighter_ids = []
+    for last_name in ["Pereira", "Hill", "Zhang", "Yan"]:
+        response = client.post(
+            "/fighters", json={"first_name": "Test", "last_name": last_name}, headers=headers
+        )
+        assert response.status_code == 201
+        fighter_ids.append(response.json()["id"])
+
+    return {"headers": headers, "event_id": event.json()["id"], "fighter_ids": fighter_ids}
+
+
+def test_create_fight_single_validation_query(client, card, count_queries):
+    f1, f2, _, _ = card["fighter_ids"]
+    payload = {
+        "event_id": card["event_id"],
+        "fighter_1_id": f1,
+        "fighter_2_id": f2,
+        "winner_id": f1,
+        "method": "KO",
+        "round": 1,
+    }
+
+    with count_queries() as statements:
+        response = client.post("/fights", json=payload, headers=card["headers"])
+
+    assert response.status_code == 201
+    assert response.json()["winner_id"] == f1
+
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT INTO FIGHTS ")]
+    assert len(selects) == 1
+    assert len(inserts) == 1
+
+
+@pytest.mark.parametrize(
+    "overrides, status_code, detail",
+    [
+        ({"event_id": 99999}, 404, "Event not found"),
+        ({"fighter_1_id": 99999}, 404, "Fighter 1 not found"),
+        ({"fighter_2_id": 99999}, 404, "Fighter 2 not found"),
+        ({"fighter_2_id": "f1"}, 400, "A fighter cannot fight themselves"),
+        ({"winner_id": 99999}, 404, "Winner not found"),
+        ({"winner_id": "f3"}, 400, "Winner must be one of the two fighters"),
+    ],
+)
+def test_create_fight_validation(client, card, overrides, status_code, detail):
+    f1, f2, f3, _ = card["fighter_ids"]
+    aliases = {"f1": f1, "f3": f3}
+
+    payload = {"event_id": card["event_id"], "fighter_1_id": f1, "fighter_2_id": f2}
+    payload.update({key: aliases.get(value, value) for key, value in overrides.items()})
+
+    response = client.post("/fights", json=payload, headers=card["headers"])
+    assert response.status_code == status_code
+    assert response.json()["detail"] == detail
+
+
+def test_create_fights_bulk(client, card):
+    f1, f2, f3, f4 = card["fighter_ids"]
+    fights = [
+        {"event_id": card["event_id"], "fighter_1_id": f1, "fighter_2_id": f2, "winner_id": f1},
+        {"event_id": card["event_id"], "fighter_1_id": f3, "fighter_2_id": f4},
+    ]
+
+    response = client.post("/fights/bulk", json={"fights": fights}, headers=card["headers"])
+    assert response.status_code == 201
+    assert [fight["fighter_1_id"] for fight in response.json()] == [f1, f3]
+
+    card_response = client.get(f"/events/{card['event_id']}/card")
+    assert len(card_response.json()["fights"]) == 2
+
+
+def test_create_fights_bulk_is_all_or_nothing(client, card):
+    f1, f2, f3, _ = card["fighter_ids"]
+    fights = [
+        {"event_id": card["event_id"], "fighter_1_id": f1, "fighter_2_id": f2},
+        {"event_id": card["event_id"], "fighter_1_id": f3, "fighter_2_id": 99999},
+        {"event_id": card["event_id"], "fighter_1_id": f3, "fighter_2_id": f3},
+    ]
+
+    response = client.post("/fights/bulk", json={"fights": fights}, headers=card["headers"])
+    assert response.status_code == 404
+    assert response.json()["detail"] == [
+        {"index": 1, "error": "Fighter 2 not found"},
+        {"index": 2, "error": "A fighter cannot fight themselves"},
+    ]
+
+    card_response = client.get(f"/events/{card['event_id']}/card")
+    assert card_response.json()["fights"] == []
@@ -1,4 +1,112 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.core import readiness
+from app.core.readiness import script_heads
+from app.core.settings import settings
+from app.database import engine
+
+
 def test_health(client):
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
\ No newline at end of file
+    assert response.json() == {"status": "ok"}
+
+@pytest.fixture()
+def alembic_version():
+    """
+    Create alembic_version holding the given revisions (create_all doesn't).
+    """
+
+    def stamp(*revisions):
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+            connection.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+            for revision in revisions:
+                connection.execute(text("INSERT INTO alembic_version VALUES (:r)"), {"r": revision})
+
+    yield stamp
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+
+def test_ready(client, alembic_version):
+    alembic_version(*script_heads())
+
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["checks"]["database"]["status"] == "ok"
+    assert body["checks"]["migrations"]["current"] == sorted(script_heads())
+    assert body["checks"]["pool"]["status"] in ("ok", "skipped")
+
+
+def test_ready_fails_on_migration_mismatch(client, alembic_version, monkeypatch):
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["migrations"]["error"] == "alembic_version table missing"
+
+    alembic_version("f25c1ea433e4")
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["migrations"]["current"] == ["f25c1ea433e4"]
+
+    monkeypatch.setattr(settings, "READY_CHECK_MIGRATIONS", False)
+    assert client.get("/ready").status_code == 200
+
+
+def test_ready_fails_on_latency_and_timeout(client, monkeypatch):
+    monkeypatch.setattr(settings, "READY_CHECK_MIGRATIONS", False)
+
+    monkeypatch.setattr(settings, "READY_DB_LATENCY_MS", 0.0)
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"]["status"] == "fail"
+    monkeypatch.setattr(settings, "READY_DB_LATENCY_MS", 500.0)
+
+    # A probe that hangs is abandoned; the next one fails fast while it runs
+    release = threading.Event()
+    original = readiness._probe
+
+    def hanging_probe(engine):
+        release.wait(5)
+        return original(engine)
+
+    monkeypatch.setattr(readiness, "_probe", hanging_probe)
+    monkeypatch.setattr(settings, "READY_DB_TIMEOUT_SECONDS", 0.05)
+
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"]["error"] == "timed out after 0.05s"
+    assert client.get("/ready").json()["checks"]["database"]["error"] == "previous probe still running"
+
+    release.set()
+    monkeypatch.setattr(settings, "READY_DB_TIMEOUT_SECONDS", 2.0)
+    for _ in range(50):
+        if client.get("/ready").status_code == 200:
+            break
+        time.sleep(0.02)
+    else:
+        raise AssertionError("probe did not recover")
+
+
+def test_ready_fails_on_pool_saturation(client, monkeypatch):
+    monkeypatch.setattr(settings, "READY_CHECK_MIGRATIONS", False)
+    if not isinstance(engine.pool, QueuePool):
+        pytest.skip("in-memory database has no queue pool")
+
+    monkeypatch.setattr(settings, "READY_POOL_SATURATION", 0.1)
+    with engine.connect(), engine.connect():
+        response = client.get("/ready")
+
+    assert response.status_code == 503
+    pool = response.json()["checks"]["pool"]
+    assert pool["status"] == "fail"
+    assert pool["checked_out"] >= 2
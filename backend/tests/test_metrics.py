@@ -0,0 +1,124 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core import metrics
+from app.core.metrics import MetricsMiddleware
+from app.core.pool import engine_options
+from app.core.settings import settings
+from app.database import SessionLocal, engine
+
+
+def test_engine_options_from_settings(monkeypatch):
+    from app.core.settings import settings
+
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 20)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    options = engine_options("postgresql://u:p@db/app")
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    async_options = engine_options("postgresql+asyncpg://u:p@db/app", is_async=True)
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+    # In-memory SQLite keeps its single-connection pool
+    assert engine_options("sqlite://") == {}
+
+
+def test_pool_metrics(client):
+    # Hold a connection from the app engine while reading the metrics
+    with engine.connect():
+        response = client.get("/metrics/pool")
+
+    assert response.status_code == 200
+
+    sync_pool = response.json()["sync"]
+    assert sync_pool["checked_out"] >= 1
+    assert sync_pool["checkouts"] >= 1
+    assert "wait_seconds_max" in sync_pool
+
+
+@pytest.fixture()
+def metrics_app():
+    """
+    Small app behind MetricsMiddleware whose routes use the
+    app's own (instrumented) engine.
+    """
+
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, root_app=app)
+
+    @app.get("/fighters/{fighter_id}/repeat")
+    def repeat(fighter_id: int, times: int = 1):
+        with SessionLocal() as db:
+            for i in range(times):
+                db.execute(text("SELECT id FROM fighters WHERE id = :id"), {"id": fighter_id + i})
+        return {"ok": True}
+
+    metrics.registry.clear()
+    with TestClient(app) as c:
+        yield c
+
+
+def test_request_metrics(metrics_app, monkeypatch):
+    monkeypatch.setattr(settings, "N_PLUS_ONE_THRESHOLD", 10)
+
+    response = metrics_app.get("/fighters/1/repeat?times=3")
+    assert response.status_code == 200
+    assert response.headers["server-timing"].endswith('desc="3 queries"')
+    metrics_app.get("/nowhere")
+
+    route = "/fighters/{fighter_id}/repeat"
+    assert metrics.http_requests.value("GET", route, "200") == 1
+    assert metrics.http_requests.value("GET", "unmatched", "404") == 1
+    assert metrics.http_request_duration.count("GET", route) == 1
+    assert metrics.db_queries.value(route) == 3
+    assert metrics.http_in_flight.value() == 0
+    assert metrics.db_n_plus_one.value("GET", route) == 0
+
+
+def test_n_plus_one_and_slow_query_logs(metrics_app, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "N_PLUS_ONE_THRESHOLD", 4)
+
+    with caplog.at_level(logging.WARNING, logger="app.core.metrics"):
+        metrics_app.get("/fighters/1/repeat?times=4")
+        assert "N+1" not in caplog.text
+
+        metrics_app.get("/fighters/1/repeat?times=5")
+        assert "Possible N+1 on GET /fighters/{fighter_id}/repeat: 5 similar statements" in caplog.text
+        assert metrics.db_n_plus_one.value("GET", "/fighters/{fighter_id}/repeat") == 1
+
+        monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+        metrics_app.get("/fighters/1/repeat?times=1")
+        assert "Slow query" in caplog.text
+        assert metrics.db_slow_queries.value("/fighters/{fighter_id}/repeat") >= 1
+
+
+def test_fingerprint():
+    assert metrics.fingerprint(
+        "SELECT * FROM fights WHERE id IN (%(id_1_1)s, %(id_1_2)s) LIMIT 10"
+    ) == metrics.fingerprint("SELECT * FROM fights WHERE id IN (?) LIMIT 5")
+
+
+def test_prometheus_endpoint(client):
+    metrics.registry.clear()
+    client.get("/fighters/999")
+    client.get("/fighters")
+    assert client.get("/fighters").headers["x-cache"] == "HIT"
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_requests_total{method="GET",route="/fighters/{fighter_id}",status="404"} 1' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/fighters/{fighter_id}",le="+Inf"} 1' in body
+    # Cache hits never reach routing but keep their route label
+    assert 'http_requests_total{method="GET",route="/fighters",status="200"} 2' in body
+    assert 'db_pool_connections{engine="sync",state="checked_out"}' in body
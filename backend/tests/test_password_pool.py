@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from app.core.password_pool import PasswordHashPool
+from app.core.security import pwd_context
+from app.models.user import User
+
+
+def test_pool_hashes_in_worker_process():
+    pool = PasswordHashPool(workers=1, queue_depth=0)
+    try:
+        hashed = pool.hash("StrongPassword123!")
+        assert pool.verify_and_update("StrongPassword123!", hashed) == (True, None)
+        assert pool.verify_and_update("wrong-password", hashed)[0] is False
+    finally:
+        pool.shutdown()
+
+
+def test_pool_async_waits_on_the_event_loop():
+    pool = PasswordHashPool(workers=1, queue_depth=0)
+    try:
+        async def run():
+            hashed = await pool.hash_async("StrongPassword123!")
+            return await pool.verify_and_update_async("StrongPassword123!", hashed)
+
+        assert asyncio.run(run()) == (True, None)
+
+        # Saturated: 429 before anything is submitted
+        assert pool._slots.acquire(blocking=False)
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(pool.hash_async("StrongPassword123!"))
+        assert exc_info.value.status_code == 429
+    finally:
+        pool.shutdown()
+
+
+def test_pool_rejects_when_saturated():
+    pool = PasswordHashPool(workers=1, queue_depth=0)
+
+    # Occupy the only slot
+    assert pool._slots.acquire(blocking=False)
+
+    with pytest.raises(HTTPException) as exc_info:
+        pool.hash("StrongPassword123!")
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers["Retry-After"] == "1"
+
+
+def test_login_rehashes_outdated_cost_factor(client, db_session):
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5)
+    old_hash = old_context.hash("StrongPassword123!")
+    assert pwd_context.needs_update(old_hash)
+
+    user = User(
+        username="oldhash",
+        email="oldhash@test.com",
+        hashed_password=old_hash,
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    response = client.post(
+        "/auth/login",
+        data={"username": "oldhash", "password": "StrongPassword123!"}
+    )
+    assert response.status_code == 200
+
+    stored = db_session.query(User).filter(User.username == "oldhash").one()
+    assert stored.hashed_password != old_hash
+    assert not pwd_context.needs_update(stored.hashed_password)
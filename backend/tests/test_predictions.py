@@ -0,0 +1,134 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.analytics.features import KNOWN, MATCHUP_FEATURES, training_set
+from app.analytics.model import OutcomeModel
+from app.analytics.ratings import INITIAL_RATING, RatingEngine
+from app.models import Event, Fight, Fighter
+from app.services import prediction_service
+
+
+def seed_card(db_session):
+    event = Event(name="UFC 300", event_date=date(2024, 4, 13))
+    red = Fighter(first_name="Alex", last_name="Pereira", height_cm=193, reach_cm=201, stance="Orthodox")
+    blue = Fighter(first_name="Jamahal", last_name="Hill", height_cm=193, reach_cm=201, stance="Southpaw")
+    db_session.add_all([event, red, blue])
+    db_session.add(Fight(event=event, fighter_1=red, fighter_2=blue, winner=red, method="KO", round=1))
+    db_session.commit()
+    return event, red, blue
+
+
+def test_predict_matchup(client, db_session):
+    event, red, blue = seed_card(db_session)
+
+    response = client.post("/predictions", json={"fighter_1_id": red.id, "fighter_2_id": blue.id})
+    assert response.status_code == 200
+    data = response.json()
+
+    # Untrained model: the Elo expectation after one 16-point exchange
+    expected = 1 / (1 + 10 ** (-32 / 400))
+    assert data["fighter_1_win_probability"] == pytest.approx(expected)
+    assert data["fighter_1_win_probability"] + data["fighter_2_win_probability"] == pytest.approx(1)
+
+    swapped = client.post("/predictions", json={"fighter_1_id": blue.id, "fighter_2_id": red.id}).json()
+    assert swapped["fighter_1_win_probability"] == pytest.approx(data["fighter_2_win_probability"])
+
+    assert client.post("/predictions", json={"fighter_1_id": red.id, "fighter_2_id": 999}).status_code == 404
+    assert client.post("/predictions", json={"fighter_1_id": red.id, "fighter_2_id": red.id}).status_code == 400
+
+
+def test_batch_and_card(client, db_session):
+    event, red, blue = seed_card(db_session)
+
+    response = client.post("/predictions/batch", json={"matchups": [
+        {"fighter_1_id": red.id, "fighter_2_id": blue.id},
+        {"fighter_1_id": blue.id, "fighter_2_id": 999},
+    ]})
+    assert response.status_code == 404
+    assert response.json()["detail"] == [{"index": 1, "error": "Fighter not found"}]
+
+    sweep = [{"fighter_1_id": red.id, "fighter_2_id": blue.id}] * 10000
+    response = client.post("/predictions/batch", json={"matchups": sweep})
+    assert response.status_code == 200
+    assert len(response.json()) == 10000
+
+    card = client.get(f"/events/{event.id}/predictions").json()
+    assert [row["fighter_1_id"] for row in card] == [red.id]
+    assert client.get("/events/999/predictions").status_code == 404
+
+
+def test_feature_store_follows_writes(client, db_session):
+    event, red, blue = seed_card(db_session)
+    before = client.post("/predictions", json={"fighter_1_id": red.id, "fighter_2_id": blue.id}).json()
+
+    # Fighter created after the store was built
+    newcomer = Fighter(first_name="New", last_name="Comer")
+    db_session.add(newcomer)
+    db_session.commit()
+    response = client.post("/predictions", json={"fighter_1_id": newcomer.id, "fighter_2_id": red.id})
+    assert response.status_code == 200
+
+    # A rematch win for blue moves the prediction
+    db_session.add(Fight(event_id=event.id, fighter_1_id=red.id, fighter_2_id=blue.id, winner_id=blue.id, method="Submission"))
+    db_session.commit()
+    after = client.post("/predictions", json={"fighter_1_id": red.id, "fighter_2_id": blue.id}).json()
+    assert after["fighter_1_win_probability"] < before["fighter_1_win_probability"]
+
+    rows = prediction_service.feature_store.rows(db_session, np.array([red.id]))
+    fresh = prediction_service.feature_store.__class__()
+    np.testing.assert_array_equal(rows, fresh.rows(db_session, np.array([red.id])))
+
+
+def test_out_of_range_ids(client, db_session):
+    event, red, blue = seed_card(db_session)
+
+    for bad in (0, -1, 2**31, 2**70):
+        response = client.post("/predictions", json={"fighter_1_id": red.id, "fighter_2_id": bad})
+        assert response.status_code == 422
+
+    # Past the schema: unknown, without wrapping around or growing the table
+    store = prediction_service.feature_store
+    rows = store.rows(db_session, np.array([red.id, -1, 2**40]))
+    assert rows[:, KNOWN].tolist() == [1, 0, 0]
+    assert len(store._table) < 1000
+
+    ratings = prediction_service.rating_engine.current_ratings(db_session, np.array([-1, 2**40]))
+    assert ratings.tolist() == [INITIAL_RATING, INITIAL_RATING]
+
+
+def test_training_is_point_in_time(db_session):
+    rng = np.random.default_rng(11)
+    fighters = [Fighter(first_name="F", last_name=str(i), height_cm=170 + i) for i in range(10)]
+    events = [Event(name=f"Card {i}", event_date=date(2020, 1, 1) + timedelta(days=60 * i)) for i in range(20)]
+    db_session.add_all(fighters + events)
+
+    # Taller fighter always wins
+    for event in events:
+        for _ in range(5):
+            a, b = rng.choice(10, size=2, replace=False)
+            winner = fighters[max(a, b)]
+            db_session.add(Fight(event=event, fighter_1=fighters[a], fighter_2=fighters[b], winner=winner, method="Decision"))
+    db_session.commit()
+
+    X, y = training_set(db_session, RatingEngine().pre_bout_ratings(db_session))
+    assert X.shape == (200, len(MATCHUP_FEATURES))
+
+    # Nobody has history going into their first bout
+    first = X[0]
+    assert first[MATCHUP_FEATURES.index("experience")] == 0
+    assert first[MATCHUP_FEATURES.index("rating")] == 0
+
+    model = OutcomeModel.fit(X, y)
+    assert model.weights[MATCHUP_FEATURES.index("height")] > 0
+    assert ((model.predict(X) > 0.5) == (y == 1)).mean() > 0.9
+
+
+def test_model_round_trip(tmp_path):
+    model = OutcomeModel(np.arange(len(MATCHUP_FEATURES), dtype=float), trained_on=4)
+    model.save(tmp_path / "model.json")
+
+    loaded = OutcomeModel.load(tmp_path / "model.json")
+    np.testing.assert_array_equal(loaded.weights, model.weights)
+    assert loaded.trained_on == 4
@@ -0,0 +1,106 @@
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import insert, select, text
+
+from app.models import Event, Fight, Fighter
+
+# Large enough that the planner prefers an index over a full scan
+FIGHTERS = 3000
+EVENTS = 300
+FIGHTS = 15000
+
+
+@pytest.fixture()
+def large_dataset(db_session):
+    rng = random.Random(7)
+
+    db_session.execute(insert(Fighter), [
+        {"first_name": f"First{i}", "last_name": f"Last{i % 1000}"}
+        for i in range(FIGHTERS)
+    ])
+    db_session.execute(insert(Event), [
+        {"name": f"Event {i}", "location": "Las Vegas, NV",
+         "event_date": date(2000, 1, 1) + timedelta(days=7 * i)}
+        for i in range(EVENTS)
+    ])
+
+    fights = []
+    for _ in range(FIGHTS):
+        fighter_1, fighter_2 = rng.sample(range(1, FIGHTERS + 1), 2)
+        fights.append({
+            "event_id": rng.randint(1, EVENTS),
+            "fighter_1_id": fighter_1,
+            "fighter_2_id": fighter_2,
+            "winner_id": rng.choice([fighter_1, fighter_2, None]),
+            "method": "Decision",
+            "round": 3,
+        })
+    db_session.execute(insert(Fight), fights)
+    db_session.commit()
+
+    # Fresh planner statistics
+    db_session.execute(text("ANALYZE"))
+    db_session.commit()
+
+    return db_session
+
+
+def sequential_scans(db_session, stmt) -> list[str]:
+    """
+    Return the tables read with a full sequential scan by stmt.
+
+    - PostgreSQL: "Seq Scan" nodes in EXPLAIN (FORMAT JSON)
+    - SQLite: "SCAN <table>" steps not backed by an index
+    """
+
+    bind = db_session.get_bind()
+    sql = str(stmt.compile(bind, compile_kwargs={"literal_binds": True}))
+
+    if bind.dialect.name == "postgresql":
+        plan = db_session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        tables = []
+        stack = [plan[0]["Plan"]]
+        while stack:
+            node = stack.pop()
+            if node["Node Type"] == "Seq Scan":
+                tables.append(node["Relation Name"])
+            stack.extend(node.get("Plans", []))
+        return tables
+
+    rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return [
+        row.detail.split()[1]
+        for row in rows
+        if row.detail.startswith("SCAN ") and "USING" not in row.detail
+    ]
+
+
+ACCESS_PATHS = {
+    "event fights": select(Fight).where(Fight.event_id == 42),
+    "fights as fighter 1": select(Fight).where(Fight.fighter_1_id == 42),
+    "fights as fighter 2": select(Fight).where(Fight.fighter_2_id == 42),
+    "fights won": select(Fight).where(Fight.winner_id == 42),
+    "fighter by name": select(Fighter).where(
+        Fighter.last_name == "Last42", Fighter.first_name == "First42"
+    ),
+    "fighters first page": select(Fighter).order_by(Fighter.last_name, Fighter.id).limit(11),
+    "events in date range": select(Event).where(
+        Event.event_date.between(date(2001, 1, 1), date(2001, 3, 1))
+    ),
+}
+
+
+def test_access_paths_use_indexes(large_dataset):
+    # One seeded dataset for every path; report all offenders at once
+    scans = {
+        name: sequential_scans(large_dataset, stmt)
+        for name, stmt in ACCESS_PATHS.items()
+    }
+
+    assert {name: tables for name, tables in scans.items() if tables} == {}
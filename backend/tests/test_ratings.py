@@ -0,0 +1,147 @@
+import threading
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.analytics.ratings import INITIAL_RATING, RatingEngine, rating_engine
+from app.database import SessionLocal
+from app.models import Event, Fight, Fighter
+from app.schemas.fight import FightCreate
+from app.services import fight_service
+
+
+def assert_matches_full_replay(db_session):
+    fresh = RatingEngine()
+    fresh._load(db_session)
+
+    assert rating_engine._loaded
+    np.testing.assert_array_equal(rating_engine.fight_id, fresh.fight_id)
+    np.testing.assert_allclose(rating_engine.pre_a, fresh.pre_a)
+    np.testing.assert_allclose(rating_engine.delta, fresh.delta)
+    size = min(len(rating_engine.ratings), len(fresh.ratings))
+    np.testing.assert_allclose(rating_engine.ratings[:size], fresh.ratings[:size])
+
+
+def test_rankings_and_history(client, db_session):
+    event = Event(name="UFC 300", event_date=date(2024, 4, 13))
+    red = Fighter(first_name="Alex", last_name="Pereira")
+    blue = Fighter(first_name="Jamahal", last_name="Hill")
+    db_session.add_all([event, red, blue])
+    db_session.add(Fight(event=event, fighter_1=red, fighter_2=blue, winner=red, method="KO"))
+    db_session.commit()
+
+    rows = client.get("/rankings").json()
+    assert [row["fighter_id"] for row in rows] == [red.id, blue.id]
+    assert rows[0]["rating"] == pytest.approx(INITIAL_RATING + 16)
+    assert rows[1]["rating"] == pytest.approx(INITIAL_RATING - 16)
+
+    history = client.get(f"/fighters/{blue.id}/ratings").json()
+    assert history == [{
+        "fight_id": history[0]["fight_id"],
+        "event_date": "2024-04-13",
+        "opponent_id": red.id,
+        "score": 0.0,
+        "rating_before": INITIAL_RATING,
+        "rating_after": pytest.approx(INITIAL_RATING - 16),
+    }]
+
+    assert client.get("/fighters/9999/ratings").status_code == 404
+    assert client.get("/rankings", params={"min_fights": 2}).json() == []
+
+
+def test_incremental_updates_match_full_replay(client, db_session):
+    rng = np.random.default_rng(3)
+    fighters = [Fighter(first_name="F", last_name=str(i)) for i in range(12)]
+    events = [
+        Event(name=f"Card {i}", event_date=date(2020, 1, 1) + timedelta(days=30 * i))
+        for i in range(10)
+    ]
+    db_session.add_all(fighters + events)
+    db_session.commit()
+
+    def random_fight(event):
+        a, b = rng.choice(len(fighters), size=2, replace=False)
+        outcome = int(rng.integers(4))
+        return FightCreate(
+            event_id=event.id,
+            fighter_1_id=fighters[a].id,
+            fighter_2_id=fighters[b].id,
+            winner_id=[fighters[a].id, fighters[b].id, None, None][outcome],
+            method=["KO", "Decision", "Draw", "NC"][outcome],
+        )
+
+    for event in events[:6]:
+        for _ in range(5):
+            fight_service.create_fight(db_session, random_fight(event))
+
+    # Load the engine, then write through the service
+    client.get("/rankings")
+    assert rating_engine._loaded
+
+    # Latest card, then a backdated card: both replay from the insertion point
+    fight_service.create_fight(db_session, random_fight(events[9]))
+    assert_matches_full_replay(db_session)
+
+    fight_service.create_fights(db_session, [random_fight(events[1]) for _ in range(3)])
+    assert_matches_full_replay(db_session)
+
+    # Result changes and deletes
+    fight = db_session.query(Fight).order_by(Fight.id).first()
+    fight.winner_id = fight.fighter_2_id
+    fight.method = "Submission"
+    db_session.commit()
+    assert_matches_full_replay(db_session)
+
+    db_session.delete(db_session.query(Fight).order_by(Fight.id.desc()).first())
+    db_session.commit()
+    assert_matches_full_replay(db_session)
+
+    # A card moving to another date forces a reload
+    events[2].event_date = date(2030, 1, 1)
+    db_session.commit()
+    assert not rating_engine._loaded
+    client.get("/rankings")
+    assert_matches_full_replay(db_session)
+
+
+def test_writes_do_not_wait_for_a_load(db_session, monkeypatch):
+    event = Event(name="UFC 300", event_date=date(2024, 4, 13))
+    red = Fighter(first_name="Alex", last_name="Pereira")
+    blue = Fighter(first_name="Jamahal", last_name="Hill")
+    db_session.add_all([event, red, blue])
+    db_session.add(Fight(event=event, fighter_1=red, fighter_2=blue, winner=red, method="KO"))
+    db_session.commit()
+
+    # The first read holds the lock after loading, before its write lands
+    loaded, release = threading.Event(), threading.Event()
+    load = rating_engine._load
+
+    def slow_load(db):
+        load(db)
+        loaded.set()
+        release.wait(5)
+
+    monkeypatch.setattr(rating_engine, "_load", slow_load)
+
+    def read():
+        db = SessionLocal()
+        try:
+            rating_engine.rankings(db, limit=10, min_fights=1)
+        finally:
+            db.close()
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    assert loaded.wait(5)
+
+    start = time.monotonic()
+    db_session.add(Fight(event=event, fighter_1=blue, fighter_2=red, winner=blue, method="Decision"))
+    db_session.commit()
+    assert time.monotonic() - start < 1
+
+    release.set()
+    reader.join(5)
+    assert_matches_full_replay(db_session)
+    assert len(rating_engine.fight_id) == 2
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.cache import MemoryBackend, RedisBackend, ResponseCache, ResponseCacheMiddleware
+from app.core.settings import settings
+from app.database_async import to_async_url
+from app.main import app as fastapi_app
+from app.models import Event, Fighter
+
+
+class FakeRedis:
+    """
+    The subset of the redis-py client used by RedisBackend.
+    """
+
+    def __init__(self):
+        self.data = {}
+        # Calls made on a running event loop (they would block it)
+        self.on_loop = []
+
+    def _track(self, name):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.on_loop.append(name)
+
+    def get(self, key):
+        self._track("get")
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self._track("set")
+        self.data[key] = value
+
+    def mget(self, keys):
+        self._track("mget")
+        return [self.data.get(key) for key in keys]
+
+    def incr(self, key):
+        self._track("incr")
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request, monkeypatch):
+    """
+    Run each test against both backends.
+    """
+
+    if request.param == "memory":
+        backend = MemoryBackend(max_entries=100)
+    else:
+        backend = RedisBackend(FakeRedis())
+
+    cache = ResponseCache(backend, ttl=60)
+    import app.core.cache as cache_module
+    monkeypatch.setattr(cache_module, "response_cache", cache)
+
+    for middleware in fastapi_app.user_middleware:
+        if middleware.cls is ResponseCacheMiddleware:
+            monkeypatch.setitem(middleware.kwargs, "cache", cache)
+    fastapi_app.middleware_stack = None  # rebuilt with the patched cache
+    yield cache
+    fastapi_app.middleware_stack = None
+
+
+def get(client, url, **params):
+    response = client.get(url, params=params)
+    assert response.status_code == 200
+    return response
+
+
+def test_reads_are_cached_until_a_write(cache, client, admin_token, db_session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    fighter = Fighter(first_name="Alex", last_name="Pereira")
+    db_session.add(fighter)
+    db_session.commit()
+
+    assert get(client, f"/fighters/{fighter.id}").headers["x-cache"] == "MISS"
+    hit = get(client, f"/fighters/{fighter.id}")
+    assert hit.headers["x-cache"] == "HIT"
+    assert hit.json()["last_name"] == "Pereira"
+
+    # Query parameters are part of the key, in any order
+    get(client, "/fighters", skip=0, limit=5)
+    assert client.get("/fighters?limit=5&skip=0").headers["x-cache"] == "HIT"
+    assert get(client, "/fighters", limit=6).headers["x-cache"] == "MISS"
+
+    response = client.patch(f"/fighters/{fighter.id}", json={"nickname": "Poatan"}, headers=headers)
+    assert response.status_code == 200
+
+    fresh = get(client, f"/fighters/{fighter.id}")
+    assert fresh.headers["x-cache"] == "MISS"
+    assert fresh.json()["nickname"] == "Poatan"
+    assert get(client, "/fighters", skip=0, limit=5).headers["x-cache"] == "MISS"
+
+
+def test_invalidation_is_precise(cache, client, admin_token, db_session):
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    event = Event(name="UFC 300", event_date=date(2024, 4, 13))
+    red = Fighter(first_name="Alex", last_name="Pereira")
+    blue = Fighter(first_name="Jamahal", last_name="Hill")
+    db_session.add_all([event, red, blue])
+    db_session.commit()
+
+    urls = ["/fighters", f"/fighters/{red.id}", "/events", f"/events/{event.id}", f"/events/{event.id}/card"]
+    for url in urls:
+        get(client, url)
+
+    # A new fighter only changes the fighter list
+    client.post("/fighters", json={"first_name": "New", "last_name": "Comer"}, headers=headers)
+    assert [get(client, url).headers["x-cache"] for url in urls] == ["MISS", "HIT", "HIT", "HIT", "HIT"]
+
+    # A fight only changes its event's card
+    client.post(
+        "/fights",
+        json={"event_id": event.id, "fighter_1_id": red.id, "fighter_2_id": blue.id},
+        headers=headers,
+    )
+    assert [get(client, url).headers["x-cache"] for url in urls] == ["HIT", "HIT", "HIT", "MISS", "MISS"]
+    assert len(get(client, f"/events/{event.id}/card").json()["fights"]) == 1
+
+    # Deleting an event changes the event list and its detail
+    db_session.add(Event(name="Spare", event_date=date(2024, 5, 1)))
+    db_session.commit()
+    spare_id = db_session.query(Event).filter_by(name="Spare").one().id
+    get(client, f"/events/{spare_id}")
+    assert client.delete(f"/events/{spare_id}", headers=headers).status_code == 204
+    assert client.get(f"/events/{spare_id}").status_code == 404
+    assert get(client, "/events").headers["x-cache"] == "MISS"
+
+
+def test_redis_calls_stay_off_the_event_loop(cache, client, db_session):
+    fighter = Fighter(first_name="Alex", last_name="Pereira")
+    db_session.add(fighter)
+    db_session.commit()
+
+    assert get(client, f"/fighters/{fighter.id}").headers["x-cache"] == "MISS"
+    assert get(client, f"/fighters/{fighter.id}").headers["x-cache"] == "HIT"
+
+    # An async session commits, and runs the invalidation hook, on the loop
+    async def rename():
+        engine = create_async_engine(to_async_url(settings.DATABASE_URL), poolclass=NullPool)
+        async with async_sessionmaker(bind=engine)() as db:
+            (await db.get(Fighter, fighter.id)).nickname = "Poatan"
+            await db.commit()
+        await engine.dispose()
+
+    asyncio.run(rename())
+    db_session.expire_all()
+    response = get(client, f"/fighters/{fighter.id}")
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["nickname"] == "Poatan"
+
+    if isinstance(cache.backend, RedisBackend):
+        assert cache.backend.client.data
+        assert cache.backend.client.on_loop == []
+
+
+def test_errors_are_not_cached(cache, client):
+    assert client.get("/fighters/999").status_code == 404
+    assert client.get("/fighters/999").headers["x-cache"] == "MISS"
+
+
+def test_memory_backend_lru_and_ttl(monkeypatch):
+    backend = MemoryBackend(max_entries=2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+    assert backend.get("b") is None  # least recently used
+    assert backend.get("a") == b"1"
+
+    backend.set("d", b"4", ttl=-1)
+    assert backend.get("d") is None
@@ -0,0 +1,297 @@
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from app.core.batcher import Batcher
+from app.database import SessionLocal
+from app.models import Event, Fight, Fighter
+from app.services import result_service
+from app.services.result_service import ResultUpdate, result_batcher
+
+
+def record(client, fighter_id):
+    data = client.get(f"/fighters/{fighter_id}/record").json()
+    return (data["wins"], data["losses"], data["draws"], data["no_contests"])
+
+
+def seed_card(db_session):
+    red = Fighter(first_name="Red", last_name="Corner")
+    blue = Fighter(first_name="Blue", last_name="Corner")
+    green = Fighter(first_name="Green", last_name="Corner")
+    event = Event(name="Fight Night", event_date=date(2024, 6, 1))
+    fight = Fight(event=event, fighter_1=red, fighter_2=blue)
+    db_session.add_all([red, blue, green, event, fight])
+    db_session.commit()
+    return event.id, fight.id, red.id, blue.id, green.id
+
+
+def write_result(update: ResultUpdate):
+    db = SessionLocal()
+    try:
+        return result_service.apply_results(db, [update])
+    finally:
+        db.close()
+
+
+def post_result(client, token, event_id, key, wait=True, **result):
+    return client.post(
+        f"/events/{event_id}/results",
+        params={"wait": wait},
+        json=result,
+        headers={"Authorization": f"Bearer {token}", "Idempotency-Key": key},
+    )
+
+
+def test_result_updates_booked_fight(client, admin_token, db_session):
+    event_id, fight_id, red, blue, _ = seed_card(db_session)
+
+    # Corners reversed: still the booked bout
+    response = post_result(
+        client, admin_token, event_id, "feed-1",
+        fighter_1_id=blue, fighter_2_id=red, winner_id=red, method="KO/TKO", round=2,
+    )
+    assert response.status_code == 200
+    assert response.json() == {"idempotency_key": "feed-1", "status": "applied", "fight_id": fight_id}
+
+    card = client.get(f"/events/{event_id}/card").json()
+    assert len(card["fights"]) == 1
+    assert card["fights"][0]["winner"]["id"] == red
+    assert card["fights"][0]["method"] == "KO/TKO"
+    assert record(client, red) == (1, 0, 0, 0)
+    assert record(client, blue) == (0, 1, 0, 0)
+
+
+def test_retries_apply_once(client, admin_token, db_session):
+    event_id, fight_id, red, blue, _ = seed_card(db_session)
+    result = dict(fighter_1_id=red, fighter_2_id=blue, winner_id=red, method="Submission", round=1)
+
+    assert post_result(client, admin_token, event_id, "feed-1", **result).json()["status"] == "applied"
+    retry = post_result(client, admin_token, event_id, "feed-1", **result)
+    assert retry.status_code == 200
+    assert retry.json() == {"idempotency_key": "feed-1", "status": "duplicate", "fight_id": fight_id}
+    assert record(client, red) == (1, 0, 0, 0)
+
+    # A correction is a new update: the record moves, not doubles
+    correction = dict(result, winner_id=None, method="NC")
+    assert post_result(client, admin_token, event_id, "feed-2", **correction).json()["status"] == "applied"
+    assert record(client, red) == (0, 0, 0, 1)
+    assert record(client, blue) == (0, 0, 0, 1)
+
+    # A late retry of the first update does not undo the correction
+    assert post_result(client, admin_token, event_id, "feed-1", **result).json()["status"] == "duplicate"
+    assert record(client, red) == (0, 0, 0, 1)
+    assert db_session.query(Fight).count() == 1
+
+
+def test_unbooked_bout_is_added(client, admin_token, db_session):
+    event_id, _, red, _, green = seed_card(db_session)
+
+    response = post_result(
+        client, admin_token, event_id, "feed-1",
+        fighter_1_id=green, fighter_2_id=red, winner_id=green, method="Decision - Split", round=3,
+    )
+    assert response.json()["status"] == "applied"
+
+    fight = db_session.get(Fight, response.json()["fight_id"])
+    assert (fight.event_id, fight.fighter_1_id, fight.winner_id) == (event_id, green, green)
+    assert record(client, green) == (1, 0, 0, 0)
+
+
+def test_invalid_results(client, admin_token, db_session):
+    event_id, _, red, blue, _ = seed_card(db_session)
+
+    # Checked before queueing
+    response = post_result(client, admin_token, event_id, "k1", fighter_1_id=red, fighter_2_id=red, method="KO")
+    assert response.status_code == 400
+    response = post_result(
+        client, admin_token, event_id, "k2", fighter_1_id=red, fighter_2_id=blue, winner_id=999, method="KO"
+    )
+    assert response.status_code == 400
+
+    # Checked at write time
+    response = post_result(client, admin_token, event_id, "k3", fighter_1_id=red, fighter_2_id=999, method="KO")
+    assert response.status_code == 404
+    response = post_result(client, admin_token, 999, "k4", fighter_1_id=red, fighter_2_id=blue, method="KO")
+    assert response.status_code == 404
+    # ... and stays rejected on retry
+    response = post_result(client, admin_token, 999, "k4", fighter_1_id=red, fighter_2_id=blue, method="KO")
+    assert response.status_code == 404
+
+    response = client.post(
+        f"/events/{event_id}/results",
+        json={"fighter_1_id": red, "fighter_2_id": blue, "method": "KO"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert response.status_code == 422
+
+    # Ids no Integer column can hold never reach the queue
+    for bad in (0, -1, 2**31, 2**70):
+        response = post_result(client, admin_token, event_id, "k5", fighter_1_id=red, fighter_2_id=bad, method="KO")
+        assert response.status_code == 422
+    assert post_result(client, admin_token, 2**70, "k6", fighter_1_id=red, fighter_2_id=blue,
+                       method="KO").status_code == 422
+
+
+def test_bad_update_does_not_sink_its_batch(client, admin_token, db_session):
+    event_id, _, red, blue, _ = seed_card(db_session)
+
+    # Past the schema (e.g. a future bug): SQLite can't bind it,
+    # PostgreSQL finds no such fighter
+    bad = result_service.submit_result(ResultUpdate("bad", event_id, red, 2**70, None, "KO", 1))
+    good = result_service.submit_result(ResultUpdate("good", event_id, red, blue, red, "KO", 1))
+    assert result_batcher.drain(timeout=10)
+
+    assert good.result()["status"] == "applied"
+    assert bad.exception() is not None or bad.result()["status"] == "rejected"
+    assert record(client, red) == (1, 0, 0, 0)
+
+
+def test_queued_results_are_batched(client, admin_token, db_session):
+    event_id, fight_id, red, blue, _ = seed_card(db_session)
+
+    for key, winner in (("a", red), ("b", blue), ("a", red)):
+        response = post_result(
+            client, admin_token, event_id, key, wait=False,
+            fighter_1_id=red, fighter_2_id=blue, winner_id=winner, method="KO",
+        )
+        assert response.status_code == 202
+        assert response.json()["status"] == "queued"
+
+    assert result_batcher.drain(timeout=5)
+
+    # The latest update of the bout wins
+    db_session.expire_all()
+    assert db_session.get(Fight, fight_id).winner_id == blue
+    assert record(client, blue) == (1, 0, 0, 0)
+
+
+def test_batch_statements_do_not_grow_with_size(db_session, count_queries):
+    event_id, _, red, blue, green = seed_card(db_session)
+    others = [Fighter(first_name="F", last_name=str(i)) for i in range(40)]
+    db_session.add_all(others)
+    db_session.commit()
+
+    updates = [
+        ResultUpdate(f"key-{i}", event_id, others[2 * i].id, others[2 * i + 1].id, others[2 * i].id, "KO", 1)
+        for i in range(20)
+    ]
+    updates.append(ResultUpdate("key-booked", event_id, red, blue, blue, "Submission", 2))
+
+    with count_queries() as statements:
+        outcomes = result_service.apply_results(db_session, updates)
+
+    assert [outcome["status"] for outcome in outcomes] == ["applied"] * 21
+    # check ids, claim keys, load card, key booked fight, insert new
+    # bouts, lock and update booked ones, stats
+    assert len([s for s in statements if not s.startswith(("BEGIN", "COMMIT"))]) <= 8
+    assert db_session.query(Fight).filter(Fight.event_id == event_id).count() == 21
+
+
+def test_interleaved_corrections_keep_records(client, db_session, monkeypatch):
+    event_id, _, red, blue, _ = seed_card(db_session)
+    write_result(ResultUpdate("k0", event_id, red, blue, red, "KO", 1))
+
+    # The first correction stops after its writes, before committing
+    written, release = threading.Event(), threading.Event()
+    apply_stats_delta = result_service.apply_stats_delta
+
+    def paused(connection, delta):
+        apply_stats_delta(connection, delta)
+        if threading.current_thread().name == "first":
+            written.set()
+            release.wait(5)
+
+    monkeypatch.setattr(result_service, "apply_stats_delta", paused)
+
+    first = threading.Thread(name="first", target=write_result,
+                             args=(ResultUpdate("k1", event_id, red, blue, blue, "KO", 1),))
+    second = threading.Thread(name="second", target=write_result,
+                              args=(ResultUpdate("k2", event_id, red, blue, red, "Decision", 3),))
+    first.start()
+    assert written.wait(5)
+    second.start()
+    # The second correction waits for the first one's row lock
+    time.sleep(0.2)
+    release.set()
+    first.join(10)
+    second.join(10)
+
+    db_session.expire_all()
+    assert db_session.query(Fight).filter(Fight.event_id == event_id).one().winner_id == red
+    assert record(client, red) == (1, 0, 0, 0)
+    assert record(client, blue) == (0, 1, 0, 0)
+
+
+def test_batcher_flushes_by_size_and_time():
+    batches = []
+    batcher = Batcher("test", lambda items: batches.append(list(items)) or items,
+                      max_size=3, max_wait=0.2, max_pending=10)
+
+    futures = [batcher.submit(i) for i in range(4)]
+    # Size: the first three go at once
+    assert [future.result(timeout=1) for future in futures[:3]] == [0, 1, 2]
+    assert batches == [[0, 1, 2]]
+
+    # Time: the fourth waits for max_wait
+    start = time.monotonic()
+    assert futures[3].result(timeout=1) == 3
+    assert time.monotonic() - start > 0.1
+    batcher.shutdown()
+
+
+def test_batcher_retries_then_fails():
+    attempts = []
+
+    def flush(items):
+        attempts.append(items)
+        raise RuntimeError("database down")
+
+    batcher = Batcher("test", flush, max_size=10, max_wait=0, max_pending=10, retries=1)
+    future = batcher.submit("x")
+    with pytest.raises(RuntimeError):
+        future.result(timeout=2)
+    assert len(attempts) == 2
+    batcher.shutdown()
+
+
+def test_batcher_fails_only_the_bad_item():
+    def flush(items):
+        if "bad" in items:
+            raise ValueError("bad item")
+        return [item.upper() for item in items]
+
+    batcher = Batcher("test", flush, max_size=3, max_wait=1, max_pending=10, retries=0)
+    futures = [batcher.submit(item) for item in ("a", "bad", "c")]
+
+    assert futures[0].result(timeout=2) == "A"
+    assert futures[2].result(timeout=2) == "C"
+    with pytest.raises(ValueError):
+        futures[1].result(timeout=2)
+    batcher.shutdown()
+
+
+def test_batcher_shutdown_timeout_keeps_one_thread():
+    release = threading.Event()
+
+    def flush(items):
+        release.wait(5)
+        return items
+
+    batcher = Batcher("test", flush, max_size=1, max_wait=0, max_pending=10)
+    first = batcher.submit("a")
+    time.sleep(0.05)
+
+    # Still flushing: no second worker until the first one exits
+    assert batcher.shutdown(timeout=0.05) is False
+    with pytest.raises(RuntimeError):
+        batcher.submit("b")
+
+    release.set()
+    assert first.result(timeout=2) == "a"
+    deadline = time.monotonic() + 2
+    while batcher._thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert batcher.submit("c").result(timeout=2) == "c"
+    assert batcher.shutdown() is True
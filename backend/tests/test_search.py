@@ -0,0 +1,180 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
+
+from app.core.search import FighterSearchIndex, fighter_search_index, normalize, trigrams
+from app.database import engine
+from app.models import Fighter
+from app.models.fighter import SEARCH_NAME
+from app.services.search_service import has_trigram_support, trigram_search_statement
+
+
+def seed(db_session):
+    fighters = [
+        Fighter(first_name="Khabib", last_name="Nurmagomedov", nickname="The Eagle"),
+        Fighter(first_name="Umar", last_name="Nurmagomedov"),
+        Fighter(first_name="Islam", last_name="Makhachev"),
+        Fighter(first_name="Joanna", last_name="Jędrzejczyk"),
+        Fighter(first_name="Jan", last_name="Błachowicz", nickname="Prince of Cieszyn"),
+        Fighter(first_name="Jon", last_name="Jones", nickname="Bones"),
+    ]
+    db_session.add_all(fighters)
+    db_session.commit()
+    return {fighter.last_name + fighter.first_name: fighter.id for fighter in fighters}
+
+
+def names(response):
+    assert response.status_code == 200
+    return [f"{row['first_name']} {row['last_name']}" for row in response.json()]
+
+
+def test_normalize_and_trigrams():
+    assert normalize("Jan Błachowicz") == ["jan", "blachowicz"]
+    assert normalize("Jędrzejczyk") == ["jedrzejczyk"]
+    assert normalize("dos Anjos-Silva") == ["dos", "anjos", "silva"]
+    assert trigrams("jon") == {"  j", " jo", "jon", "on "}
+
+
+def test_search_tolerates_typos(client, db_session):
+    seed(db_session)
+
+    response = client.get("/fighters/search", params={"q": "Nurmagomedow"})
+    assert names(response)[:2] == ["Khabib Nurmagomedov", "Umar Nurmagomedov"]
+    assert 0.5 < response.json()[0]["score"] < 1
+
+    assert names(client.get("/fighters/search", params={"q": "khabib nurmagomedow"}))[0] == (
+        "Khabib Nurmagomedov"
+    )
+    assert names(client.get("/fighters/search", params={"q": "Jedrzejczyk"})) == [
+        "Joanna Jędrzejczyk"
+    ]
+    assert names(client.get("/fighters/search", params={"q": "Blachowicz"})) == [
+        "Jan Błachowicz"
+    ]
+    # Nicknames are searched too
+    assert names(client.get("/fighters/search", params={"q": "bones"})) == ["Jon Jones"]
+    assert client.get("/fighters/search", params={"q": "zzzz"}).json() == []
+
+
+def test_autocomplete(client, db_session):
+    seed(db_session)
+
+    response = client.get("/fighters/search", params={"q": "nurm", "mode": "autocomplete"})
+    assert names(response) == ["Khabib Nurmagomedov", "Umar Nurmagomedov"]
+    assert response.json()[0]["score"] is None
+
+    assert names(client.get(
+        "/fighters/search", params={"q": "um nurm", "mode": "autocomplete"}
+    )) == ["Umar Nurmagomedov"]
+    assert names(client.get(
+        "/fighters/search", params={"q": "j", "mode": "autocomplete", "limit": 2}
+    )) == ["Jan Błachowicz", "Joanna Jędrzejczyk"]
+
+
+def test_index_follows_fighter_writes(client, db_session):
+    ids = seed(db_session)
+    assert names(client.get("/fighters/search", params={"q": "Pereira"})) == []
+
+    # Insert, rename and delete after the index was built
+    db_session.add(Fighter(first_name="Alex", last_name="Pereira"))
+    fighter = db_session.get(Fighter, ids["JonesJon"])
+    fighter.nickname = "Night Night"
+    db_session.delete(db_session.get(Fighter, ids["MakhachevIslam"]))
+    db_session.commit()
+
+    assert names(client.get("/fighters/search", params={"q": "Pereira"})) == ["Alex Pereira"]
+    assert names(client.get(
+        "/fighters/search", params={"q": "bon", "mode": "autocomplete"}
+    )) == []
+    assert names(client.get("/fighters/search", params={"q": "night"})) == ["Jon Jones"]
+    assert names(client.get("/fighters/search", params={"q": "Makhachev"})) == []
+    assert names(client.get(
+        "/fighters/search", params={"q": "mak", "mode": "autocomplete"}
+    )) == []
+
+
+def test_bulk_import_resets_index(client, db_session):
+    from app.core.dependencies import require_admin
+    from app.main import app
+
+    seed(db_session)
+    client.get("/fighters/search", params={"q": "Nurmagomedov"})
+
+    app.dependency_overrides[require_admin] = lambda: None
+    try:
+        response = client.post(
+            "/fighters/bulk",
+            content="first_name,last_name\nTom,Aspinall\n",
+            headers={"Content-Type": "text/csv"},
+        )
+    finally:
+        del app.dependency_overrides[require_admin]
+    assert response.json()["inserted"] == 1
+
+    assert names(client.get("/fighters/search", params={"q": "aspinal"})) == ["Tom Aspinall"]
+
+
+def test_index_loads_once(db_session, count_queries):
+    seed(db_session)
+    index = FighterSearchIndex()
+
+    with count_queries() as statements:
+        index.search(db_session, "jones", 10)
+        index.autocomplete(db_session, "jo", 10)
+        index.search(db_session, "khabib", 10)
+
+    assert len(statements) == 1
+
+
+def test_trigram_statement_matches_index_expression():
+    sql = str(trigram_search_statement("Nurmagomedow", 10).compile(dialect=postgresql.dialect()))
+    index = str(CreateIndex(next(
+        index for index in Fighter.__table__.indexes if index.name == "ix_fighters_search_name_trgm"
+    )).compile(dialect=postgresql.dialect()))
+
+    # Inlined literals keep the expression identical to the GIN index
+    assert "<%" in sql
+    expression = index[index.index("USING gin (") + len("USING gin ("):-len(" gin_trgm_ops)")]
+    assert expression.replace("(first_name", "(fighters.first_name") \
+        .replace(" last_name", " fighters.last_name") \
+        .replace("(nickname", "(fighters.nickname") in sql
+
+
+NAMES = [
+    ("Jan", "Błachowicz", "Prince of Cieszyn"),
+    ("Georges", "Saint-Pierre", "Rush"),
+    ("Joanna", "Jędrzejczyk", None),
+    ("Ærøskøbing", "Œuvre-Straße", "L'Æther"),
+    ("ŁUKASZ", "ŻÓŁTY", "Đorđe Ǉubić"),
+]
+
+
+@pytest.mark.skipif(engine.dialect.name != "postgresql", reason="SEARCH_NAME is evaluated on PostgreSQL only")
+def test_search_name_matches_normalize(db_session):
+    # The SQL fold and the in-process one must not drift apart
+    fighters = [Fighter(first_name=first, last_name=last, nickname=nickname) for first, last, nickname in NAMES]
+    db_session.add_all(fighters)
+    db_session.commit()
+
+    rows = db_session.execute(
+        select(Fighter.first_name, Fighter.last_name, Fighter.nickname, SEARCH_NAME).order_by(Fighter.id)
+    ).all()
+    for first, last, nickname, search_name in rows:
+        assert search_name == " ".join(normalize(f"{first} {last} {nickname or ''}"))
+
+
+@pytest.mark.skipif(engine.dialect.name != "postgresql", reason="pg_trgm needs PostgreSQL")
+def test_trigram_search_matches_in_process_index(client, db_session):
+    if not has_trigram_support(db_session):
+        pytest.skip("pg_trgm is not installed")
+    seed(db_session)
+    db_session.add(Fighter(first_name="Georges", last_name="Saint-Pierre", nickname="Rush"))
+    db_session.commit()
+
+    for query, mode in [("blachowicz", "search"), ("Jedrzejczyk", "search"),
+                        ("pierre", "autocomplete"), ("błach", "autocomplete")]:
+        trigram = names(client.get("/fighters/search", params={"q": query, "mode": mode}))
+        method = fighter_search_index.autocomplete if mode == "autocomplete" else fighter_search_index.search
+        in_process = [f"{row['first_name']} {row['last_name']}" for row in method(db_session, query, 10)]
+        assert trigram == in_process != []
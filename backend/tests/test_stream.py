@@ -0,0 +1,229 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.core import changes
+from app.core.broadcast import Broadcaster, broadcaster
+from app.core.settings import settings
+from app.database import SessionLocal, engine
+from app.models import Event, Fight, Fighter
+from app.routes.stream import stream_event
+from app.services import result_service
+from app.services.result_service import ResultUpdate
+from app.services.stream_service import messages_for_changes
+
+
+def seed_card(db_session):
+    red = Fighter(first_name="Red", last_name="Corner")
+    blue = Fighter(first_name="Blue", last_name="Corner")
+    event = Event(name="Fight Night", event_date=date(2024, 6, 1))
+    other = Event(name="Other Night", event_date=date(2024, 7, 1))
+    fight = Fight(event=event, fighter_1=red, fighter_2=blue)
+    db_session.add_all([red, blue, event, other, fight])
+    db_session.commit()
+    return event.id, other.id, fight.id, red.id, blue.id
+
+
+def stream(client, event_id, write=lambda: None, **headers):
+    """
+    Open the stream, run write() once it is subscribed, then close
+    every stream so the response completes.
+    """
+
+    def writer():
+        deadline = time.monotonic() + 5
+        while broadcaster.connections == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        write()
+        broadcaster.close()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    response = client.get(f"/events/{event_id}/stream", headers=headers)
+    thread.join()
+    return response
+
+
+def parse(body: str) -> list[dict]:
+    messages = []
+    for block in body.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            messages.append({**fields, "data": json.loads(fields["data"])})
+    return messages
+
+
+def write_result(event_id, red, blue, key, winner):
+    db = SessionLocal()
+    try:
+        result_service.apply_results(db, [ResultUpdate(key, event_id, red, blue, winner, "KO/TKO", 1)])
+    finally:
+        db.close()
+
+
+def test_stream_pushes_card_updates(client, db_session):
+    event_id, other_id, fight_id, red, blue = seed_card(db_session)
+
+    def write():
+        write_result(event_id, red, blue, "feed-1", red)
+        # Another card: not on this stream
+        db = SessionLocal()
+        db.add(Fight(event_id=other_id, fighter_1_id=red, fighter_2_id=blue))
+        db.commit()
+        db.close()
+
+    response = stream(client, event_id, write)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.startswith(f"retry: {settings.STREAM_RETRY_MS}\n\n")
+
+    messages = parse(response.text)
+    assert [(m["event"], m["data"]["op"]) for m in messages] == [("fight", "update")]
+    fight = messages[0]["data"]["fight"]
+    assert (fight["id"], fight["event_id"], fight["winner_id"], fight["method"]) == (
+        fight_id, event_id, red, "KO/TKO"
+    )
+    assert broadcaster.connections == 0
+
+
+def test_stream_resumes_from_last_event_id(client, db_session):
+    event_id, _, _, red, blue = seed_card(db_session)
+
+    def write():
+        write_result(event_id, red, blue, "feed-1", red)
+        write_result(event_id, red, blue, "feed-2", blue)
+
+    first, second = parse(stream(client, event_id, write).text)
+    assert int(first["id"]) < int(second["id"])
+
+    # Reconnecting after the first message replays the second
+    replayed = parse(stream(client, event_id, **{"Last-Event-ID": first["id"]}).text)
+    assert replayed == [second]
+
+    # Nothing missed
+    assert parse(stream(client, event_id, **{"Last-Event-ID": second["id"]}).text) == []
+
+    # Unknown id: the client has to reload the card
+    for last_id in ("12345", "not-a-number"):
+        messages = parse(stream(client, event_id, **{"Last-Event-ID": last_id}).text)
+        assert [m["event"] for m in messages] == ["reset"]
+
+
+def test_stream_subscribed_before_body(db_session):
+    event_id, _, fight_id, red, blue = seed_card(db_session)
+
+    async def run():
+        response = await stream_event(event_id, None, SessionLocal())
+        # The response is built: a write from now on is on the
+        # stream, even before the body starts
+        assert broadcaster.connections == 1
+        await asyncio.to_thread(write_result, event_id, red, blue, "feed-1", red)
+        broadcaster.close()
+
+        body = []
+
+        async def send(message):
+            body.append(message.get("body", b""))
+
+        async def receive():
+            await asyncio.sleep(10)
+
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+        return b"".join(body).decode()
+
+    messages = parse(asyncio.run(run()))
+    assert [m["data"]["fight"]["id"] for m in messages] == [fight_id]
+    assert broadcaster.connections == 0
+
+
+def test_stream_heartbeat(client, db_session, monkeypatch):
+    event_id, *_ = seed_card(db_session)
+    monkeypatch.setattr(settings, "STREAM_HEARTBEAT_SECONDS", 0.05)
+
+    response = stream(client, event_id, lambda: time.sleep(0.3))
+    assert ": ping\n\n" in response.text
+    assert parse(response.text) == []
+
+
+def test_stream_errors(client, db_session, monkeypatch):
+    event_id, *_ = seed_card(db_session)
+
+    assert client.get("/events/999/stream").status_code == 404
+    assert broadcaster.connections == 0
+
+    monkeypatch.setattr(broadcaster, "max_connections", 0)
+    response = client.get(f"/events/{event_id}/stream")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+
+
+def test_fight_moved_to_another_card():
+    change = changes.Change(
+        table="fights", op="update", id=7,
+        values={"id": 7, "event_id": 2, "fighter_1_id": 1, "fighter_2_id": 3},
+        previous={"event_id": 1},
+    )
+    messages = messages_for_changes([change])
+    assert [(channel, data["op"]) for channel, _, data in messages] == [("event:2", "update"), ("event:1", "delete")]
+
+
+def on_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def test_notify_stays_off_the_event_loop(monkeypatch):
+    # No connection is made: _notify is replaced
+    sender = Broadcaster("postgres", engine=create_engine("postgresql+psycopg2://"))
+    notified = []
+    monkeypatch.setattr(sender, "_notify", lambda messages: notified.append(
+        (on_loop(), [message.channel for message in messages])
+    ))
+
+    async def publish():
+        # As a commit hook of an async session would
+        sender.publish([("event:1", "fight", {"op": "update"}), ("event:2", "fight", {"op": "update"})])
+
+    asyncio.run(publish())
+    sender.close()
+    assert notified == [(False, ["event:1", "event:2"])]
+
+    # NOTIFY failing: this worker still delivers
+    def fail(messages):
+        raise OSError("connection lost")
+
+    monkeypatch.setattr(sender, "_notify", fail)
+    asyncio.run(publish())
+    sender.close()
+    assert [message.channel for message in sender._history] == ["event:1", "event:2"]
+
+
+@pytest.mark.skipif(engine.dialect.name != "postgresql", reason="LISTEN/NOTIFY needs PostgreSQL")
+def test_postgres_fan_out():
+    # Two broadcasters stand in for two workers
+    sender = Broadcaster("postgres", engine=engine)
+    receiver = Broadcaster("postgres", engine=engine)
+
+    async def run():
+        subscription = receiver.subscribe("event:1")
+        assert await asyncio.to_thread(receiver.listening.wait, 5)
+        sender.publish([("event:1", "fight", {"op": "update"})])
+        messages = await subscription.get(timeout=5)
+        receiver.unsubscribe(subscription)
+        return messages
+
+    try:
+        [message] = asyncio.run(run())
+    finally:
+        receiver.close()
+        sender.close()
+
+    assert (message.channel, message.event, json.loads(message.data)) == ("event:1", "fight", {"op": "update"})